@@ -1,7 +1,48 @@
+from itertools import cycle
+from weakref import WeakKeyDictionary
+
 from grpc import Channel, insecure_channel, intercept_channel
 from locust.env import Environment
 from clients.grpc.interceptors.locust_interceptor import LocustInterceptor
+from tools.locust.options import GatewayPoolPolicy, get_gateway_pool_options
+
+# Адрес сервиса grpc-gateway
+GATEWAY_GRPC_TARGET = "localhost:9003"
+
+
+class GatewayLocustGRPCChannelPool:
+    """
+    Пул gRPC-каналов процесса Locust, общий для всех сервисных клиентов и виртуальных пользователей.
+
+    Каналы раздаются по кругу. Каждый канал открывает собственное HTTP/2-соединение
+    (локальный пул subchannel), иначе gRPC склеил бы все каналы с одинаковыми настройками в одно соединение.
+    """
 
+    def __init__(self, environment: Environment, size: int):
+        """
+        :param environment: Среда выполнения Locust (необходима для отправки событий).
+        :param size: Количество каналов (соединений) в пуле.
+        """
+        locust_interceptor = LocustInterceptor(environment=environment)
+
+        self.channels = [
+            intercept_channel(
+                insecure_channel(GATEWAY_GRPC_TARGET, options=[("grpc.use_local_subchannel_pool", 1)]),
+                locust_interceptor
+            )
+            for _ in range(max(size, 1))
+        ]
+        self.iterator = cycle(self.channels)
+
+    def get_channel(self) -> Channel:
+        """
+        :return: Следующий канал пула.
+        """
+        return next(self.iterator)
+
+
+# Общие пулы каналов Locust: по одному на окружение (то есть на процесс)
+gateway_locust_grpc_channel_pools: WeakKeyDictionary[Environment, GatewayLocustGRPCChannelPool] = WeakKeyDictionary()
 
 def build_gateway_grpc_client() -> Channel:
     """
@@ -9,7 +50,7 @@ def build_gateway_grpc_client() -> Channel:
 
     :return: Готовый к использованию объект insecure_channel.
     """
-    return insecure_channel("localhost:9003")
+    return insecure_channel(GATEWAY_GRPC_TARGET)
 
 def build_gateway_locust_grpc_client(environment: Environment) -> Channel:
     """
@@ -17,14 +58,28 @@ def build_gateway_locust_grpc_client(environment: Environment) -> Channel:
     В канал автоматически встраивается интерцептор LocustInterceptor,
     который регистрирует вызовы в системе метрик Locust.
 
+    По умолчанию (--gateway-pool-policy per-user) каждый вызов создаёт отдельный канал со своим соединением.
+    С политикой shared канал берётся из общего пула процесса размером --gateway-pool-size
+    (см. GatewayLocustGRPCChannelPool).
+
     :param environment: Среда выполнения Locust (необходима для отправки событий).
     :return: gRPC-канал с интерцептором, пригодный для нагрузочного тестирования.
     """
+    options = get_gateway_pool_options(environment)
+    if options.policy == GatewayPoolPolicy.SHARED:
+        if environment not in gateway_locust_grpc_channel_pools:
+            gateway_locust_grpc_channel_pools[environment] = GatewayLocustGRPCChannelPool(
+                environment,
+                size=options.size
+            )
+
+        return gateway_locust_grpc_channel_pools[environment].get_channel()
+
     # Создаём экземпляр интерцептора, передаём в него окружение Locust
     locust_interceptor = LocustInterceptor(environment=environment)
 
     # Создаём обычный канал
-    channel = insecure_channel("localhost:9003")
+    channel = insecure_channel(GATEWAY_GRPC_TARGET)
 
     # Оборачиваем канал интерцептором, чтобы все запросы проходили через него
     return intercept_channel(channel, locust_interceptor)
\ No newline at end of file
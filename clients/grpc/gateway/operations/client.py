@@ -1,7 +1,12 @@
+import random
+from functools import cache
+
 from clients.grpc.client import GRPCClient
+from clients.grpc.templates import GRPCRequestTemplates
 from grpc import Channel
 from locust.env import Environment
 
+from contracts.services.gateway.operations.operations_gateway_service_pb2 import DESCRIPTOR as OPERATIONS_GATEWAY_DESCRIPTOR
 from contracts.services.gateway.operations.operations_gateway_service_pb2_grpc import OperationsGatewayServiceStub
 from contracts.services.gateway.operations.rpc_get_operation_pb2 import GetOperationRequest, GetOperationResponse
 from contracts.services.gateway.operations.rpc_get_operation_receipt_pb2 import GetOperationReceiptRequest, GetOperationReceiptResponse
@@ -16,7 +21,9 @@ from contracts.services.gateway.operations.rpc_make_bill_payment_operation_pb2 i
 from contracts.services.gateway.operations.rpc_make_cash_withdrawal_operation_pb2 import MakeCashWithdrawalOperationRequest, MakeCashWithdrawalOperationResponse
 from clients.grpc.gateway.client import (build_gateway_grpc_client, build_gateway_locust_grpc_client)
 from contracts.services.operations.operation_pb2 import OperationStatus
-from tools.fakers import fake
+from tools.fakers import build_fake_seed, fake
+from tools.locust.options import get_gateway_grpc_options
+from tools.locust.workers import get_worker_partition
 
 
 class OperationsGatewayGRPCClient(GRPCClient):
@@ -25,14 +32,31 @@ class OperationsGatewayGRPCClient(GRPCClient):
     Предоставляет методы для работы с операциями: получение информации, создание операций разных типов.
     """
 
-    def __init__(self, channel: Channel):
+    def __init__(self, channel: Channel, templates: dict[str, GRPCRequestTemplates] | None = None):
         """
         Инициализация клиента с указанным gRPC-каналом.
 
         :param channel: gRPC-канал для подключения к OperationsGatewayService.
+        :param templates: Пулы заранее сериализованных запросов по имени метода
+                          (см. build_operations_gateway_grpc_request_templates). Если заданы, методы make_*_operation
+                          отправляют готовые байты вместо сборки нового сообщения на каждый вызов.
         """
         super().__init__(channel)
         self.stub = OperationsGatewayServiceStub(self.channel)
+        self.templates = templates or {}
+        self.template_calls = {method: template.bind(self.channel) for method, template in self.templates.items()}
+
+    def make_template_call(self, method: str, card_id: str, account_id: str):
+        """
+        Вызывает метод с запросом из пула шаблонов.
+
+        :param method: Имя метода сервиса.
+        :param card_id: Идентификатор карты
+        :param account_id: Идентификатор счета
+        :return: Ответ от сервиса
+        """
+        request = self.templates[method].render(card_id=card_id, account_id=account_id)
+        return self.template_calls[method](request)
 
     # Низкоуровневые методы API
     def get_operation_api(self, request: GetOperationRequest) -> GetOperationResponse:
@@ -183,6 +207,9 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счета
         :return: Ответ с данными созданной операции
         """
+        if "MakeFeeOperation" in self.templates:
+            return self.make_template_call("MakeFeeOperation", card_id, account_id)
+
         request = MakeFeeOperationRequest(
             card_id=card_id,
             account_id=account_id,
@@ -199,6 +226,9 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счета
         :return: Ответ с данными созданной операции
         """
+        if "MakeTopUpOperation" in self.templates:
+            return self.make_template_call("MakeTopUpOperation", card_id, account_id)
+
         request = MakeTopUpOperationRequest(
             card_id=card_id,
             account_id=account_id,
@@ -215,6 +245,9 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счета
         :return: Ответ с данными созданной операции
         """
+        if "MakeCashbackOperation" in self.templates:
+            return self.make_template_call("MakeCashbackOperation", card_id, account_id)
+
         request = MakeCashbackOperationRequest(
             card_id=card_id,
             account_id=account_id,
@@ -231,6 +264,9 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счета
         :return: Ответ с данными созданной операции
         """
+        if "MakeTransferOperation" in self.templates:
+            return self.make_template_call("MakeTransferOperation", card_id, account_id)
+
         request = MakeTransferOperationRequest(
             card_id=card_id,
             account_id=account_id,
@@ -247,6 +283,9 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счета
         :return: Ответ с данными созданной операции
         """
+        if "MakePurchaseOperation" in self.templates:
+            return self.make_template_call("MakePurchaseOperation", card_id, account_id)
+
         request = MakePurchaseOperationRequest(
             card_id=card_id,
             account_id=account_id,
@@ -264,6 +303,9 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счета
         :return: Ответ с данными созданной операции
         """
+        if "MakeBillPaymentOperation" in self.templates:
+            return self.make_template_call("MakeBillPaymentOperation", card_id, account_id)
+
         request = MakeBillPaymentOperationRequest(
             card_id=card_id,
             account_id=account_id,
@@ -280,6 +322,9 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: Идентификатор счета
         :return: Ответ с данными созданной операции
         """
+        if "MakeCashWithdrawalOperation" in self.templates:
+            return self.make_template_call("MakeCashWithdrawalOperation", card_id, account_id)
+
         request = MakeCashWithdrawalOperationRequest(
             card_id=card_id,
             account_id=account_id,
@@ -289,6 +334,54 @@ class OperationsGatewayGRPCClient(GRPCClient):
         return self.make_cash_withdrawal_operation_api(request)
 
 
+@cache
+def build_operations_gateway_grpc_request_templates(size: int, seed: int | None = None) -> dict[str, GRPCRequestTemplates]:
+    """
+    Создаёт пулы заранее сериализованных запросов для методов создания операций.
+
+    Пулы неизменяемы, поэтому строятся один раз на процесс и разделяются всеми клиентами.
+    Суммы, статусы и категории вариантов генерируются столбцами BulkFake за один вызов на метод,
+    словарь значений BulkFake берётся из пула fake (см. --fake-data-pool), если он включён.
+
+    :param size: Количество вариантов запроса на метод.
+    :param seed: Seed BulkFake: одинаковый seed даёт одинаковые пулы. None — случайный seed.
+    :return: Пулы шаблонов по имени метода OperationsGatewayService.
+    """
+    # NumPy нужен только для шаблонов запросов, поэтому без них импорт клиента его не требует
+    from tools.bulk_fakers import BulkFake, iter_rows
+
+    service = OPERATIONS_GATEWAY_DESCRIPTOR.services_by_name["OperationsGatewayService"]
+    bulk = BulkFake(seed=random.getrandbits(64) if seed is None else seed, pool=fake.pool)
+
+    def build_templates(method: str, request_class, response_class, category: bool = False) -> GRPCRequestTemplates:
+        rows = iter_rows(bulk.operations(OperationStatus, max(size, 1), category=category))
+        return GRPCRequestTemplates(service, method, response_class, lambda: request_class(**next(rows)), size=size)
+
+    return {
+        "MakeFeeOperation": build_templates(
+            "MakeFeeOperation", MakeFeeOperationRequest, MakeFeeOperationResponse
+        ),
+        "MakeTopUpOperation": build_templates(
+            "MakeTopUpOperation", MakeTopUpOperationRequest, MakeTopUpOperationResponse
+        ),
+        "MakeCashbackOperation": build_templates(
+            "MakeCashbackOperation", MakeCashbackOperationRequest, MakeCashbackOperationResponse
+        ),
+        "MakeTransferOperation": build_templates(
+            "MakeTransferOperation", MakeTransferOperationRequest, MakeTransferOperationResponse
+        ),
+        "MakePurchaseOperation": build_templates(
+            "MakePurchaseOperation", MakePurchaseOperationRequest, MakePurchaseOperationResponse, category=True
+        ),
+        "MakeBillPaymentOperation": build_templates(
+            "MakeBillPaymentOperation", MakeBillPaymentOperationRequest, MakeBillPaymentOperationResponse
+        ),
+        "MakeCashWithdrawalOperation": build_templates(
+            "MakeCashWithdrawalOperation", MakeCashWithdrawalOperationRequest, MakeCashWithdrawalOperationResponse
+        ),
+    }
+
+
 def build_operations_gateway_grpc_client() -> OperationsGatewayGRPCClient:
     """
     Фабрика для создания экземпляра OperationsGatewayGRPCClient.
@@ -304,7 +397,19 @@ def build_operations_gateway_locust_grpc_client(environment: Environment) -> Ope
         Клиент автоматически собирает метрики и передаёт их в Locust через хуки.
         Используется исключительно в нагрузочных тестах.
 
+        С --gateway-grpc-request-templates N методы создания операций отправляют запросы
+        из пула N заранее сериализованных вариантов на метод (см. GRPCRequestTemplates).
+        С --fake-run-id пулы детерминированы: seed вычисляется из run id и номера воркера.
+
         :param environment: объект окружения Locust.
         :return: экземпляр OperationsGatewayGRPCClient с хуками сбора метрик.
     """
-    return OperationsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
\ No newline at end of file
+    size = get_gateway_grpc_options(environment).request_templates
+    run_id = getattr(environment.parsed_options, "fake_run_id", "")
+    # Номер пользователя -1 не совпадает ни с одним виртуальным пользователем (см. build_locust_user_fake_stream)
+    seed = build_fake_seed(run_id, get_worker_partition(environment)[0], -1) if run_id else None
+
+    return OperationsGatewayGRPCClient(
+        channel=build_gateway_locust_grpc_client(environment),
+        templates=build_operations_gateway_grpc_request_templates(size, seed) if size else None
+    )
\ No newline at end of file
@@ -1,13 +1,208 @@
 import time
+import weakref
+from typing import Any, Iterator
 
-from grpc import RpcError, UnaryUnaryClientInterceptor
+from grpc import (
+    Call,
+    Future,
+    FutureCancelledError,
+    RpcError,
+    StatusCode,
+    UnaryUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    StreamUnaryClientInterceptor,
+    StreamStreamClientInterceptor
+)
 from locust.env import Environment
 
+from tools.locust.schedule import get_intended_send_time, get_intended_start
+from tools.locust.latency import LatencyRecorder, get_latency_recorder
+from tools.locust.stats import log_locust_stat
 
-class LocustInterceptor(UnaryUnaryClientInterceptor):
+# Тип вспомогательной строки статистики со временем между сообщениями потока ответов
+GRPC_STREAM_MESSAGE_REQUEST_TYPE = "gRPC-stream"
+
+
+def get_intended_call_time(start_time: float) -> float | None:
+    """
+    :param start_time: Фактическое время начала вызова (time.perf_counter).
+    :return: Запланированное время начала внутри итерации открытой модели, иначе None.
+    """
+    return get_intended_send_time(start_time) if get_intended_start() is not None else None
+
+
+def build_cancelled_error(method: str) -> FutureCancelledError:
+    """
+    :param method: Полное имя gRPC-метода.
+    :return: Исключение, с которым в Locust регистрируется отменённый вызов.
+    """
+    return FutureCancelledError(f"gRPC call {method} was cancelled")
+
+
+class LocustStreamResponse:
+    """
+    Обёртка над потоком ответов gRPC (unary-stream и stream-stream), которая собирает метрики Locust.
+
+    Событие запроса Locust (тип "gRPC") отправляется один раз на весь вызов: общее время и суммарный размер.
+    Время каждого сообщения — с начала вызова (для первого сообщения) или с предыдущего сообщения — пишется
+    во вспомогательную строку "gRPC-stream" (log_locust_stat), как TTFB и фазы HTTP-запросов: сообщения
+    не попадают в Aggregated, RPS и долю ошибок, и потоковый вызов не выглядит как N запросов.
+
+    Вызов регистрируется и тогда, когда поток не дочитан:
+    - cancel() отменяет вызов и регистрирует его как ошибку (FutureCancelledError);
+    - если вызов завершился ошибкой или отменой (например, по таймауту), его регистрирует done-callback;
+    - брошенный поток при сборке мусора отменяется, если вызов ещё идёт (gRPC не завершает вызов,
+      пока не прочитаны все ответы), иначе регистрируется как успешный на момент завершения вызова.
+    Остальные методы Call (code, details, initial_metadata и т.д.) делегируются исходному вызову.
+    """
+
+    def __init__(
+            self,
+            environment: Environment,
+            method: str,
+            call: Any,
+            start_time: float,
+            latency_recorder: LatencyRecorder | None = None
+    ):
+        """
+        :param environment: Экземпляр среды Locust, содержащий события сбора метрик.
+        :param method: Полное имя gRPC-метода.
+        :param call: Исходный вызов (итератор ответов и grpc.Call).
+        :param start_time: Время начала вызова (time.perf_counter).
+        :param latency_recorder: HDR-гистограммы задержек (см. tools.locust.latency) или None.
+        """
+        self.environment = environment
+        self.method = method
+        self.call = call
+        self.start_time = start_time
+        self.intended_start_time = get_intended_call_time(start_time)
+        self.latency_recorder = latency_recorder
+        self.message_time = start_time
+        self.response_length = 0
+        self.finished = False
+        # Время успешного завершения вызова (done-callback), если поток ещё не дочитан
+        self.done_time: float | None = None
+
+        # Вызов хранит callback, пока идёт: слабая ссылка позволяет собрать брошенный поток и отменить вызов
+        reference = weakref.ref(self)
+
+        def on_done(done_call: Any) -> None:
+            stream = reference()
+            if stream is not None:
+                stream.on_done(done_call)
+
+        self.call.add_done_callback(on_done)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.call, name)
+
+    def __iter__(self) -> Iterator[Any]:
+        return self
+
+    def __next__(self) -> Any:
+        try:
+            message = next(self.call)
+        except StopIteration:
+            self.finish(exception=None)
+            raise
+        except RpcError as error:
+            self.finish(exception=error)
+            raise
+
+        now = time.perf_counter()
+        message_length = message.ByteSize()
+        self.response_length += message_length
+
+        log_locust_stat(
+            self.environment,
+            GRPC_STREAM_MESSAGE_REQUEST_TYPE,
+            self.method,
+            (now - self.message_time) * 1000,
+            message_length
+        )
+        self.message_time = now
+
+        return message
+
+    def __del__(self) -> None:
+        if self.finished:
+            return
+
+        if self.done_time is None:
+            # Поток брошен до завершения вызова: освобождаем вызов, метрику отправит cancel
+            self.cancel()
+        else:
+            self.finish(exception=None, end_time=self.done_time)
+
+    def cancel(self) -> bool:
+        """
+        Отменяет вызов и регистрирует его в Locust как отменённый.
+
+        :return: Результат отмены исходного вызова.
+        """
+        cancelled = self.call.cancel()
+        self.finish(exception=build_cancelled_error(self.method))
+
+        return cancelled
+
+    def on_done(self, call: Any) -> None:
+        """
+        Done-callback исходного вызова: регистрирует вызов, завершившийся отменой или ошибкой,
+        даже если поток не читают. Успешный вызов регистрируется при дочитывании потока или в __del__.
+
+        :param call: Завершённый вызов.
+        """
+        if call.cancelled():
+            self.finish(exception=build_cancelled_error(self.method))
+        elif call.code() != StatusCode.OK:
+            self.finish(exception=call)
+        else:
+            self.done_time = time.perf_counter()
+
+    def finish(self, exception: Exception | None, end_time: float | None = None) -> None:
+        """
+        Отправляет метрику на весь потоковый вызов (один раз).
+
+        :param exception: Ошибка, которой завершился поток, или None.
+        :param end_time: Время завершения вызова (time.perf_counter), по умолчанию — текущее.
+        """
+        if self.finished:
+            return
+
+        self.finished = True
+        end_time = end_time or time.perf_counter()
+        self.environment.events.request.fire(
+            name=self.method,
+            context=None,
+            response=self.call,
+            exception=exception,
+            request_type="gRPC",
+            response_time=(end_time - self.start_time) * 1000,
+            response_length=self.response_length,
+        )
+
+        if self.latency_recorder is not None:
+            self.latency_recorder.record("gRPC", self.method, self.start_time, self.intended_start_time, end_time)
+
+
+class LocustInterceptor(
+    UnaryUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    StreamUnaryClientInterceptor,
+    StreamStreamClientInterceptor
+):
     """
     gRPC-интерцептор для сбора метрик Locust.
     Используется для измерения времени выполнения вызовов и регистрации успехов/ошибок.
+
+    Интерцептор не ждёт ответа сам: для вызовов с одиночным ответом метрика отправляется
+    из done-callback future, поэтому вызовы через .future() остаются неблокирующими
+    и могут выполняться конвейером. Потоковые ответы оборачиваются в LocustStreamResponse:
+    одно событие на весь поток и вспомогательная строка со временем сообщений.
+
+    С --latency-histograms время вызова пишется также в HDR-гистограммы: raw и скорректированное
+    на coordinated omission. Запланированное время начала (внутри итерации открытой модели)
+    запоминается при вызове, потому что done-callback выполняется вне контекста итерации.
     """
 
     def __init__(self, environment: Environment):
@@ -15,6 +210,60 @@ class LocustInterceptor(UnaryUnaryClientInterceptor):
         :param environment: Экземпляр среды Locust, содержащий события сбора метрик.
         """
         self.environment = environment
+        self.latency_recorder = get_latency_recorder(environment)
+
+    def fire_on_done(self, method: str, response: Future | Call, start_time: float) -> None:
+        """
+        Регистрирует отправку метрики по завершении вызова с одиночным ответом.
+
+        Если вызов уже завершён (обычный блокирующий вызов), callback выполняется сразу.
+
+        :param method: Полное имя gRPC-метода.
+        :param response: Future вызова.
+        :param start_time: Время начала вызова (time.perf_counter).
+        """
+        intended_start_time = get_intended_call_time(start_time)
+
+        def callback(future: Future) -> None:
+            # exception() у отменённого future бросает FutureCancelledError, поэтому отмена проверяется отдельно
+            exception = build_cancelled_error(method) if future.cancelled() else future.exception()
+            end_time = time.perf_counter()
+            response_time = (end_time - start_time) * 1000
+
+            self.environment.events.request.fire(
+                name=method,  # Имя метода (например, "/users.UsersService/CreateUser")
+                context=None,  # Можно использовать для передачи кастомных данных
+                response=future,  # Объект ответа (если нужен для контекста)
+                exception=exception,  # Если произошла ошибка — передаём её сюда
+                request_type="gRPC",  # Тип запроса (например, "HTTP", "gRPC")
+                response_time=response_time,  # Время выполнения в миллисекундах
+                response_length=0 if exception else future.result().ByteSize(),  # Размер ответа в байтах
+            )
+
+            if self.latency_recorder is not None:
+                self.latency_recorder.record("gRPC", method, start_time, intended_start_time, end_time)
+
+        response.add_done_callback(callback)
+
+    def fire_error(self, method: str, error: RpcError, start_time: float) -> None:
+        """
+        Отправляет метрику для вызова, который упал ещё до появления future.
+        """
+        end_time = time.perf_counter()
+        self.environment.events.request.fire(
+            name=method,
+            context=None,
+            response=None,
+            exception=error,
+            request_type="gRPC",
+            response_time=(end_time - start_time) * 1000,
+            response_length=0,
+        )
+
+        if self.latency_recorder is not None:
+            self.latency_recorder.record(
+                "gRPC", method, start_time, get_intended_call_time(start_time), end_time
+            )
 
     def intercept_unary_unary(self, continuation, client_call_details, request):
         """
@@ -25,31 +274,65 @@ class LocustInterceptor(UnaryUnaryClientInterceptor):
         :param request: Объект запроса, отправляемый на сервер.
         :return: gRPC response (future объект).
         """
-        response = None
-        exception: RpcError | None = None
         start_time = time.perf_counter()  # Засекаем время начала запроса
-        response_length = 0
 
         try:
-            # Выполняем gRPC вызов и получаем response future
             response = continuation(client_call_details, request)
+        except RpcError as error:
+            self.fire_error(client_call_details.method, error, start_time)
+            raise
+
+        self.fire_on_done(client_call_details.method, response, start_time)
+        return response
 
-            # Получаем размер ответа, если он уже доступен (для метрик)
-            response_length = response.result().ByteSize()
+    def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        """
+        Метод-перехватчик для stream-unary gRPC вызовов (поток запросов, один ответ).
+
+        :param continuation: Функция, вызывающая фактический gRPC метод.
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request_iterator: Итератор запросов, отправляемых на сервер.
+        :return: gRPC response (future объект).
+        """
+        start_time = time.perf_counter()
+
+        try:
+            response = continuation(client_call_details, request_iterator)
         except RpcError as error:
-            # В случае ошибки сохраняем исключение для метрик
-            exception = error
+            self.fire_error(client_call_details.method, error, start_time)
+            raise
 
-        # Регистрируем вызов в системе метрик Locust
-        self.environment.events.request.fire(
-            name=client_call_details.method,  # Имя метода (например, "/users.UsersService/CreateUser")
-            context=None,  # Можно использовать для передачи кастомных данных
-            response=response,  # Объект ответа (если нужен для контекста)
-            exception=exception,  # Если произошла ошибка — передаём её сюда
-            request_type="gRPC",  # Тип запроса (например, "HTTP", "gRPC")
-            response_time=(time.perf_counter() - start_time) * 1000,  # Время выполнения в миллисекундах
-            response_length=response_length,  # Размер ответа в байтах
+        self.fire_on_done(client_call_details.method, response, start_time)
+        return response
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        """
+        Метод-перехватчик для unary-stream gRPC вызовов (один запрос, поток ответов).
+
+        :param continuation: Функция, вызывающая фактический gRPC метод.
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request: Объект запроса, отправляемый на сервер.
+        :return: Поток ответов, собирающий метрики при чтении.
+        """
+        start_time = time.perf_counter()
+        response = continuation(client_call_details, request)
+
+        return LocustStreamResponse(
+            self.environment, client_call_details.method, response, start_time, self.latency_recorder
         )
 
-        # Возвращаем результат вызова (future-объект)
-        return response
\ No newline at end of file
+    def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
+        """
+        Метод-перехватчик для stream-stream gRPC вызовов (потоки запросов и ответов).
+
+        :param continuation: Функция, вызывающая фактический gRPC метод.
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request_iterator: Итератор запросов, отправляемых на сервер.
+        :return: Поток ответов, собирающий метрики при чтении.
+        """
+        start_time = time.perf_counter()
+        response = continuation(client_call_details, request_iterator)
+
+        return LocustStreamResponse(
+            self.environment, client_call_details.method, response, start_time, self.latency_recorder
+        )
@@ -0,0 +1,96 @@
+from itertools import cycle
+from typing import Callable
+
+from google.protobuf.descriptor import FieldDescriptor, ServiceDescriptor
+from google.protobuf.message import Message
+from grpc import Channel, UnaryUnaryMultiCallable
+
+
+def encode_varint(value: int) -> bytes:
+    """
+    Кодирует неотрицательное целое число в protobuf varint.
+
+    :param value: Число для кодирования.
+    :return: Байты varint.
+    """
+    result = bytearray()
+    while value > 0x7F:
+        result.append((value & 0x7F) | 0x80)
+        value >>= 7
+    result.append(value)
+
+    return bytes(result)
+
+
+class GRPCRequestTemplates:
+    """
+    Пул заранее собранных и сериализованных вариантов запроса одного unary-unary RPC.
+
+    Варианты (со случайными данными fake.*) строятся и сериализуются один раз при создании пула.
+    При отправке выбирается следующий вариант, а динамические строковые поля (например, card_id, account_id)
+    дописываются в конец готовых байт: protobuf при разборе берёт последнее значение поля,
+    поэтому ни сообщение, ни его сериализация на каждый вызов не нужны.
+    Запрос отправляется через вызов канала без сериализатора (см. bind).
+    """
+
+    def __init__(
+            self,
+            service: ServiceDescriptor,
+            method: str,
+            response_class: type[Message],
+            build_request: Callable[[], Message],
+            size: int,
+            dynamic_fields: tuple[str, ...] = ("card_id", "account_id")
+    ):
+        """
+        :param service: Дескриптор gRPC-сервиса (DESCRIPTOR.services_by_name[...] из *_pb2).
+        :param method: Имя метода сервиса, например "MakePurchaseOperation".
+        :param response_class: Класс ответа метода.
+        :param build_request: Функция, создающая вариант запроса без динамических полей.
+        :param size: Количество вариантов в пуле.
+        :param dynamic_fields: Строковые поля запроса, которые подставляются при каждом вызове.
+        """
+        self.path = f"/{service.full_name}/{method}"
+        self.response_class = response_class
+
+        request_fields = service.methods_by_name[method].input_type.fields_by_name
+        self.tags: dict[str, bytes] = {}
+        for name in dynamic_fields:
+            field = request_fields[name]
+            if field.type != FieldDescriptor.TYPE_STRING:
+                raise ValueError(f"Dynamic field '{name}' of {method} must be a string field")
+
+            # Ключ поля: номер поля и wire type 2 (length-delimited)
+            self.tags[name] = encode_varint(field.number << 3 | 2)
+
+        self.variants = [build_request().SerializeToString() for _ in range(max(size, 1))]
+        self.iterator = cycle(self.variants)
+
+    def render(self, **fields: str) -> bytes:
+        """
+        Собирает готовое тело запроса: следующий вариант из пула плюс динамические поля.
+
+        :param fields: Значения динамических полей.
+        :return: Сериализованный запрос.
+        """
+        parts = [next(self.iterator)]
+        for name, value in fields.items():
+            data = value.encode()
+            parts.append(self.tags[name] + encode_varint(len(data)) + data)
+
+        return b"".join(parts)
+
+    def bind(self, channel: Channel) -> UnaryUnaryMultiCallable:
+        """
+        Создаёт вызов метода на канале, принимающий уже сериализованный запрос.
+
+        Интерцепторы канала (например, LocustInterceptor) продолжают работать как обычно.
+
+        :param channel: gRPC-канал.
+        :return: Вызов метода: bytes -> объект ответа.
+        """
+        return channel.unary_unary(
+            self.path,
+            request_serializer=None,
+            response_deserializer=self.response_class.FromString
+        )
@@ -2,6 +2,8 @@ from typing import Any, TypedDict
 
 from httpx import Client, URL, Response, QueryParams
 
+from clients.http.serialization import FULL_RESPONSE_LOADER, JSON_HEADERS, LazyModel, Model, ResponseLoader
+
 
 class HTTPClientExtensions(TypedDict, total=False):
     route: str
@@ -11,10 +13,22 @@ class HTTPClient:
     Базовый HTTP API клиент, принимающий объект httpx.Client.
 
     :param client: экземпляр httpx.Client для выполнения HTTP-запросов
+    :param loader: загрузчик ответов: полная валидация (по умолчанию) или ленивый режим
     """
 
-    def __init__(self, client: Client):
+    def __init__(self, client: Client, loader: ResponseLoader = FULL_RESPONSE_LOADER):
         self.client = client
+        self.loader = loader
+
+    def load_response(self, schema: type[Model], response: Response) -> Model | LazyModel:
+        """
+        Преобразует тело ответа в модель согласно режиму загрузчика (см. ResponseLoader).
+
+        :param schema: Pydantic-модель ответа.
+        :param response: Объект Response.
+        :return: Экземпляр модели (или LazyModel в ленивом режиме).
+        """
+        return self.loader.load(schema, response.content)
     
     def get(self, url: URL | str,
             params: QueryParams | None = None,
@@ -32,13 +46,16 @@ class HTTPClient:
     
     def post(self, url: str,
              json: Any | None = None,
+             content: str | bytes | None = None,
              extensions: HTTPClientExtensions | None = None) -> Response:
         """
         Выполняет POST-запрос.
 
         :param url: URL-адрес эндпоинта.
         :param json: Данные в формате JSON.
+        :param content: Тело запроса, уже сериализованное в JSON (model_dump_json(by_alias=True)).
         :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
         :return: Объект Response с данными ответа.
         """
-        return self.client.post(url=url, json=json, extensions=extensions)
\ No newline at end of file
+        headers = JSON_HEADERS if content is not None else None
+        return self.client.post(url=url, json=json, content=content, headers=headers, extensions=extensions)
\ No newline at end of file
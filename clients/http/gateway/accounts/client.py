@@ -1,6 +1,7 @@
 from httpx import Response, QueryParams
 
 from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.serialization import LazyModel
 from locust.env import Environment
 from clients.http.gateway.accounts.schema import (
     GetAccountsQuerySchema,
@@ -17,7 +18,8 @@ from clients.http.gateway.accounts.schema import (
 
 from clients.http.gateway.client import (
     build_gateway_http_client,
-    build_gateway_locust_http_client
+    build_gateway_locust_http_client,
+    build_gateway_locust_response_loader
 )
 
 
@@ -49,7 +51,8 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/accounts/open-deposit-account",
-            json=request.model_dump(by_alias=True)
+            content=request.model_dump_json(by_alias=True),
+            extensions=HTTPClientExtensions(route="/api/v1/accounts/open-deposit-account")
         )
 
     def open_savings_account_api(self, request: OpenSavingsAccountRequestSchema) -> Response:
@@ -61,7 +64,8 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/accounts/open-savings-account",
-            json=request.model_dump(by_alias=True)
+            content=request.model_dump_json(by_alias=True),
+            extensions=HTTPClientExtensions(route="/api/v1/accounts/open-savings-account")
         )
 
     def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestSchema) -> Response:
@@ -73,7 +77,8 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/accounts/open-debit-card-account",
-            json=request.model_dump(by_alias=True)
+            content=request.model_dump_json(by_alias=True),
+            extensions=HTTPClientExtensions(route="/api/v1/accounts/open-debit-card-account")
         )
 
     def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestSchema) -> Response:
@@ -85,33 +90,34 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/accounts/open-credit-card-account",
-            json=request.model_dump(by_alias=True)
+            content=request.model_dump_json(by_alias=True),
+            extensions=HTTPClientExtensions(route="/api/v1/accounts/open-credit-card-account")
         )
 
-    def get_accounts(self, user_id: str) -> GetAccountsResponseSchema:
+    def get_accounts(self, user_id: str) -> GetAccountsResponseSchema | LazyModel:
         query = GetAccountsQuerySchema(user_id=user_id)
         response = self.get_accounts_api(query)
-        return GetAccountsResponseSchema.model_validate_json(response.text)
+        return self.load_response(GetAccountsResponseSchema, response)
 
-    def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
+    def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema | LazyModel:
         request = OpenDepositAccountRequestSchema(user_id=user_id)
         response = self.open_deposit_account_api(request)
-        return OpenDepositAccountResponseSchema.model_validate_json(response.text)
+        return self.load_response(OpenDepositAccountResponseSchema, response)
 
-    def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
+    def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema | LazyModel:
         request = OpenSavingsAccountRequestSchema(user_id=user_id)
         response = self.open_savings_account_api(request)
-        return OpenSavingsAccountResponseSchema.model_validate_json(response.text)
+        return self.load_response(OpenSavingsAccountResponseSchema, response)
 
-    def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
+    def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema | LazyModel:
         request = OpenDebitCardAccountRequestSchema(user_id=user_id)
         response = self.open_debit_card_account_api(request)
-        return OpenDebitCardAccountResponseSchema.model_validate_json(response.text)
+        return self.load_response(OpenDebitCardAccountResponseSchema, response)
 
-    def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
+    def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema | LazyModel:
         request = OpenCreditCardAccountRequestSchema(user_id=user_id)
         response = self.open_credit_card_account_api(request)
-        return OpenCreditCardAccountResponseSchema.model_validate_json(response.text)
+        return self.load_response(OpenCreditCardAccountResponseSchema, response)
 
 
 def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
@@ -132,4 +138,7 @@ def build_accounts_gateway_locust_http_client(environment: Environment) -> Accou
     :param environment: объект окружения Locust.
     :return: экземпляр AccountsGatewayHTTPClient с хуками сбора метрик.
     """
-    return AccountsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return AccountsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment),
+        loader=build_gateway_locust_response_loader(environment)
+    )
\ No newline at end of file
@@ -3,10 +3,12 @@ from typing import TypedDict
 from httpx import Response
 
 from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.serialization import LazyModel
 from locust.env import Environment
 from clients.http.gateway.client import (
     build_gateway_http_client,
-    build_gateway_locust_http_client
+    build_gateway_locust_http_client,
+    build_gateway_locust_response_loader
 )
 from clients.http.gateway.cards.schema import (
     CardSchema,
@@ -31,7 +33,7 @@ class CardsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/cards/issue-virtual-card",
-            json=request.model_dump(by_alias=True),
+            content=request.model_dump_json(by_alias=True),
             extensions=HTTPClientExtensions(route="/api/v1/cards/issue-virtual-card")
         )
 
@@ -44,19 +46,19 @@ class CardsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
                     "/api/v1/cards/issue-physical-card",
-                         json=request.model_dump(by_alias=True),
+                         content=request.model_dump_json(by_alias=True),
                          extensions=HTTPClientExtensions(route="/api/v1/cards/issue-physical-card")
                     )
 
-    def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
+    def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema | LazyModel:
         request = IssueVirtualCardRequestSchema(user_id=user_id, account_id=account_id)
         response = self.issue_virtual_card_api(request)
-        return IssueVirtualCardResponseSchema.model_validate_json(response.text)
+        return self.load_response(IssueVirtualCardResponseSchema, response)
 
-    def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
+    def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema | LazyModel:
         request = IssuePhysicalCardRequestSchema(user_id=user_id, account_id=account_id)
         response = self.issue_physical_card_api(request)
-        return IssuePhysicalCardResponseSchema.model_validate_json(response.text)
+        return self.load_response(IssuePhysicalCardResponseSchema, response)
 
 
 def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
@@ -77,4 +79,7 @@ def build_cards_gateway_locust_http_client(environment: Environment) -> CardsGat
     :param environment: объект окружения Locust.
     :return: экземпляр AccountsGatewayHTTPClient с хуками сбора метрик.
     """
-    return CardsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return CardsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment),
+        loader=build_gateway_locust_response_loader(environment)
+    )
\ No newline at end of file
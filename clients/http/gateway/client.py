@@ -1,19 +1,34 @@
-from httpx import Client
+from weakref import WeakKeyDictionary
+
+from httpx import Client, Limits
 from locust.env import Environment
 
-from clients.http.http_hooks.locust_event_hook import (
-    locust_request_event_hook,
-    locust_response_event_hook
+from clients.http.http_hooks.locust_event_hook import locust_request_event_hook, locust_response_event_hook
+from clients.http.serialization import ResponseLoader
+from clients.http.transport import GeventHTTPTransport
+from tools.locust.options import (
+    GatewayHTTPTransport,
+    GatewayPoolOptions,
+    GatewayPoolPolicy,
+    GatewayResponseValidation,
+    get_gateway_pool_options,
+    get_gateway_response_options
 )
 import logging
 
+# Базовый URL сервиса http-gateway
+GATEWAY_HTTP_BASE_URL = "http://localhost:8003"
+
+# Общие HTTP-клиенты Locust: по одному на окружение (то есть на процесс)
+gateway_locust_http_clients: WeakKeyDictionary[Environment, Client] = WeakKeyDictionary()
+
 def build_gateway_http_client() -> Client:
     """
     Функция создаёт экземпляр httpx.Client с базовыми настройками для сервиса http-gateway.
 
     :return: Готовый к использованию объект httpx.Client.
     """
-    return Client(timeout=100, base_url="http://localhost:8003")
+    return Client(timeout=100, base_url=GATEWAY_HTTP_BASE_URL)
 
 def build_gateway_locust_http_client(environment: Environment) -> Client:
     """
@@ -27,18 +42,74 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
     Таким образом, данный клиент автоматически репортит статистику в Locust
     при каждом выполненном HTTP-запросе.
 
+    По умолчанию (--gateway-pool-policy per-user) каждый вызов создаёт отдельный клиент со своими соединениями.
+    С политикой shared все сервисные клиенты всех виртуальных пользователей процесса получают один и тот же
+    httpx.Client, у которого не больше --gateway-pool-size соединений: количество сокетов и рукопожатий
+    тогда зависит от конкурентности, а не от числа пользователей. Запросы, ждущие свободного соединения,
+    не засчитывают это ожидание во время ответа (см. locust_response_event_hook), но подаваемая нагрузка
+    ограничена размером пула, поэтому он должен быть не меньше числа одновременных запросов процесса.
+    С --gateway-http-transport gevent сетевой уровень выполняет geventhttpclient (см. GeventHTTPTransport).
+    С --gateway-http-phases в статистику по каждому маршруту пишутся фазы запроса (см. LocustHTTPTrace).
+
+    :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :return: httpx.Client с подключёнными хуками под нагрузочное тестирование.
+    """
+    options = get_gateway_pool_options(environment)
+    if options.policy == GatewayPoolPolicy.PER_USER:
+        return create_gateway_locust_http_client(environment, options)
+
+    if environment not in gateway_locust_http_clients:
+        gateway_locust_http_clients[environment] = create_gateway_locust_http_client(environment, options)
+
+    return gateway_locust_http_clients[environment]
+
+def create_gateway_locust_http_client(environment: Environment, options: GatewayPoolOptions) -> Client:
+    """
+    Создаёт новый httpx.Client с хуками Locust (см. build_gateway_locust_http_client).
+
     :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :param options: Настройки пула соединений и транспорта.
     :return: httpx.Client с подключёнными хуками под нагрузочное тестирование.
     """
     # Подавляем INFO-логи httpx (например: "HTTP Request: GET ... 200 OK")
     # Это избавляет консоль от лишнего вывода при высоконагруженных тестах
     logging.getLogger("httpx").setLevel(logging.WARNING)
 
+    if options.policy == GatewayPoolPolicy.SHARED:
+        limits = Limits(max_connections=options.size, max_keepalive_connections=options.size)
+    else:
+        # Собственный клиент виртуального пользователя: стандартные ограничения httpx
+        limits = Limits(max_connections=100, max_keepalive_connections=20)
+
+    transport = None
+    if options.http_transport == GatewayHTTPTransport.GEVENT:
+        transport = GeventHTTPTransport(concurrency=limits.max_connections)
+
     return Client(
         timeout=100,
-        base_url="http://localhost:8003",
+        base_url=GATEWAY_HTTP_BASE_URL,
+        limits=limits,
+        transport=transport,
         event_hooks={
             "request": [locust_request_event_hook],
-            "response": [locust_response_event_hook(environment)]
+            "response": [locust_response_event_hook(environment, http_phases=options.http_phases)]
         }
-    )
\ No newline at end of file
+    )
+
+def build_gateway_locust_response_loader(environment: Environment) -> ResponseLoader:
+    """
+    Загрузчик ответов для HTTP-клиентов шлюза в Locust.
+
+    С --gateway-response-validation lazy ответы не валидируются, а возвращаются как LazyModel:
+    сценарии читают из них только нужные поля (идентификаторы пользователя, счёта, карты).
+    Доля --gateway-response-validation-sample ответов всё равно проходит полную валидацию.
+
+    :param environment: Объект окружения Locust.
+    :return: Загрузчик ответов согласно параметрам запуска.
+    """
+    options = get_gateway_response_options(environment)
+
+    return ResponseLoader(
+        lazy=options.validation == GatewayResponseValidation.LAZY,
+        sample_rate=options.validation_sample
+    )
@@ -4,8 +4,10 @@ from httpx import Response
 
 from locust.env import Environment
 from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.serialization import LazyModel
 from clients.http.gateway.client import (build_gateway_http_client,
-                                        build_gateway_locust_http_client)
+                                        build_gateway_locust_http_client,
+                                        build_gateway_locust_response_loader)
 from clients.http.gateway.documents.schema import (
     GetTariffDocumentResponseSchema,
     GetContractDocumentResponseSchema
@@ -39,7 +41,7 @@ class DocumentsGatewayHTTPClient(HTTPClient):
                         extensions=HTTPClientExtensions(route="/api/v1/documents/contract-document/{account_id}")
         )
 
-    def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema:
+    def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema | LazyModel:
         """
         Получить тарифный документ по счету.
 
@@ -49,9 +51,9 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :return: Словарь с данными тарифного документа
         """
         response = self.get_tariff_document_api(account_id)
-        return GetTariffDocumentResponseSchema.model_validate_json(response.text)
+        return self.load_response(GetTariffDocumentResponseSchema, response)
 
-    def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
+    def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema | LazyModel:
         """
         Получить контракта по счету.
 
@@ -61,7 +63,7 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :return: Словарь с данными контракта по счету.
         """
         response = self.get_contract_document_api(account_id)
-        return GetContractDocumentResponseSchema.model_validate_json(response.text)
+        return self.load_response(GetContractDocumentResponseSchema, response)
 
 
 # Добавляем builder для DocumentsGatewayHTTPClient
@@ -83,4 +85,7 @@ def build_documents_gateway_locust_http_client(environment: Environment) -> Docu
     :param environment: объект окружения Locust.
     :return: экземпляр DocumentsGatewayHTTPClient с хуками сбора метрик.
     """
-    return DocumentsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return DocumentsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment),
+        loader=build_gateway_locust_response_loader(environment)
+    )
\ No newline at end of file
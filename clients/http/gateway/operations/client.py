@@ -1,8 +1,10 @@
 from httpx import Response, QueryParams
 from locust.env import Environment
 from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.serialization import LazyModel
 from clients.http.gateway.client import (build_gateway_http_client,
-                                        build_gateway_locust_http_client)
+                                        build_gateway_locust_http_client,
+                                        build_gateway_locust_response_loader)
 from clients.http.gateway.operations.schema import (
     OperationStatusRequest,
     GetOperationsQuerySchema,
@@ -86,7 +88,11 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param data: Словарь с данными для создания операции комиссии.
         :return: Объект httpx.Response с результатом создания операции.
         """
-        return self.post("/api/v1/operations/make-fee-operation", json=request.model_dump(by_alias=True))
+        return self.post(
+            "/api/v1/operations/make-fee-operation",
+            content=request.model_dump_json(by_alias=True),
+            extensions=HTTPClientExtensions(route="/api/v1/operations/make-fee-operation")
+        )
     
     def make_top_up_operation_api(self, request: MakeTopUpOperationRequestSchema) -> Response:
         """
@@ -95,7 +101,11 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param data: Словарь с данными для создания операции пополнения.
         :return: Объект httpx.Response с результатом создания операции.
         """
-        return self.post("/api/v1/operations/make-top-up-operation", json=request.model_dump(by_alias=True))
+        return self.post(
+            "/api/v1/operations/make-top-up-operation",
+            content=request.model_dump_json(by_alias=True),
+            extensions=HTTPClientExtensions(route="/api/v1/operations/make-top-up-operation")
+        )
 
     def make_cashback_operation_api(self, request: MakeCashbackOperationRequestSchema) -> Response:
         """
@@ -104,7 +114,11 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param data: Словарь с данными для создания операции кэшбэка.
         :return: Объект httpx.Response с результатом создания операции.
         """
-        return self.post("/api/v1/operations/make-cashback-operation", json=request.model_dump(by_alias=True))
+        return self.post(
+            "/api/v1/operations/make-cashback-operation",
+            content=request.model_dump_json(by_alias=True),
+            extensions=HTTPClientExtensions(route="/api/v1/operations/make-cashback-operation")
+        )
 
     def make_transfer_operation_api(self, request: MakeTransferOperationRequestSchema) -> Response:
         """
@@ -113,7 +127,11 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param data: Словарь с данными для создания операции перевода.
         :return: Объект httpx.Response с результатом создания операции.
         """
-        return self.post("/api/v1/operations/make-transfer-operation", json=request.model_dump(by_alias=True))
+        return self.post(
+            "/api/v1/operations/make-transfer-operation",
+            content=request.model_dump_json(by_alias=True),
+            extensions=HTTPClientExtensions(route="/api/v1/operations/make-transfer-operation")
+        )
 
     def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema) -> Response:
         """
@@ -122,7 +140,11 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param data: Словарь с данными для создания операции покупки.
         :return: Объект httpx.Response с результатом создания операции.
         """
-        return self.post("/api/v1/operations/make-purchase-operation", json=request.model_dump(by_alias=True))
+        return self.post(
+            "/api/v1/operations/make-purchase-operation",
+            content=request.model_dump_json(by_alias=True),
+            extensions=HTTPClientExtensions(route="/api/v1/operations/make-purchase-operation")
+        )
 
     def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequestSchema) -> Response:
         """
@@ -131,7 +153,11 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param data: Словарь с данными для создания операции оплаты по счету.
         :return: Объект httpx.Response с результатом создания операции.
         """
-        return self.post("/api/v1/operations/make-bill-payment-operation", json=request.model_dump(by_alias=True))
+        return self.post(
+            "/api/v1/operations/make-bill-payment-operation",
+            content=request.model_dump_json(by_alias=True),
+            extensions=HTTPClientExtensions(route="/api/v1/operations/make-bill-payment-operation")
+        )
 
     def make_cash_withdrawal_operation_api(self, request: MakeCashWithdrawalOperationRequestSchema) -> Response:
         """
@@ -140,10 +166,14 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param data: Словарь с данными для создания операции снятия наличных.
         :return: Объект httpx.Response с результатом создания операции.
         """
-        return self.post("/api/v1/operations/make-cash-withdrawal-operation", json=request.model_dump(by_alias=True))
+        return self.post(
+            "/api/v1/operations/make-cash-withdrawal-operation",
+            content=request.model_dump_json(by_alias=True),
+            extensions=HTTPClientExtensions(route="/api/v1/operations/make-cash-withdrawal-operation")
+        )
 
     ####Высокоуровневые методы
-    def get_operation(self, operation_id: str) -> GetOperationResponseSchema:
+    def get_operation(self, operation_id: str) -> GetOperationResponseSchema | LazyModel:
         """
         Получить информацию об операции по её идентификатору.
 
@@ -154,9 +184,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Словарь с данными операции.
         """
         response = self.get_operation_api(operation_id)
-        return GetOperationResponseSchema.model_validate_json(response.text)
+        return self.load_response(GetOperationResponseSchema, response)
 
-    def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponseSchema:
+    def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponseSchema | LazyModel:
         """
         Получить чек по операции по её идентификатору.
 
@@ -167,9 +197,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Словарь с данными чека операции.
         """
         response = self.get_operation_receipt_api(operation_id)
-        return GetOperationReceiptResponseSchema.model_validate_json(response.text)
+        return self.load_response(GetOperationReceiptResponseSchema, response)
 
-    def get_operations(self, account_id: str) -> GetOperationsResponseSchema:
+    def get_operations(self, account_id: str) -> GetOperationsResponseSchema | LazyModel:
         """
         Получить список операций для определенного счета.
 
@@ -181,9 +211,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         query = GetOperationsQuerySchema(accountId=account_id)
         response = self.get_operations_api(query)
-        return GetOperationsResponseSchema.model_validate_json(response.text)
+        return self.load_response(GetOperationsResponseSchema, response)
 
-    def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseSchema:
+    def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseSchema | LazyModel:
         """
         Получить статистику по операциям для определенного счета.
 
@@ -195,9 +225,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         query = GetOperationsSummaryQuerySchema(accountId=account_id)
         response = self.get_operations_summary_api(query)
-        return GetOperationsSummaryResponseSchema.model_validate_json(response.text)
+        return self.load_response(GetOperationsSummaryResponseSchema, response)
 
-    def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseSchema:
+    def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseSchema | LazyModel:
         """
         Создать операцию комиссии.
 
@@ -215,10 +245,10 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_fee_operation_api(request)
-        return MakeFeeOperationResponseSchema.model_validate_json(response.text)
+        return self.load_response(MakeFeeOperationResponseSchema, response)
 
     def make_top_up_operation(self,
-                              card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema:
+                              card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema | LazyModel:
         """
         Создать операцию пополнения счета.
 
@@ -236,10 +266,10 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_top_up_operation_api(request)
-        return MakeTopUpOperationResponseSchema.model_validate_json(response.text)
+        return self.load_response(MakeTopUpOperationResponseSchema, response)
 
     def make_cashback_operation(self, card_id: str,
-                                account_id: str) -> MakeCashbackOperationResponseSchema:
+                                account_id: str) -> MakeCashbackOperationResponseSchema | LazyModel:
         """
         Создать операцию кэшбэка.
 
@@ -257,10 +287,10 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_cashback_operation_api(request)
-        return MakeCashbackOperationResponseSchema.model_validate_json(response.text)
+        return self.load_response(MakeCashbackOperationResponseSchema, response)
 
     def make_transfer_operation(self, card_id: str,
-                                account_id: str) -> MakeTransferOperationResponseSchema:
+                                account_id: str) -> MakeTransferOperationResponseSchema | LazyModel:
         """
         Создать операцию перевода средств.
 
@@ -278,10 +308,10 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_transfer_operation_api(request)
-        return MakeTransferOperationResponseSchema.model_validate_json(response.text)
+        return self.load_response(MakeTransferOperationResponseSchema, response)
 
     def make_purchase_operation(self, card_id: str, account_id: str,
-                                category: str) -> MakePurchaseOperationResponseSchema:
+                                category: str) -> MakePurchaseOperationResponseSchema | LazyModel:
         """
         Создать операцию покупки.
 
@@ -300,10 +330,10 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_purchase_operation_api(request)
-        return MakePurchaseOperationResponseSchema.model_validate_json(response.text)
+        return self.load_response(MakePurchaseOperationResponseSchema, response)
 
     def make_bill_payment_operation(self, card_id: str,
-                                    account_id: str) -> MakeBillPaymentOperationResponseSchema:
+                                    account_id: str) -> MakeBillPaymentOperationResponseSchema | LazyModel:
         """
         Создать операцию оплаты счета/квитанции.
 
@@ -321,10 +351,10 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_bill_payment_operation_api(request)
-        return MakeBillPaymentOperationResponseSchema.model_validate_json(response.text)
+        return self.load_response(MakeBillPaymentOperationResponseSchema, response)
 
     def make_cash_withdrawal_operation(self, card_id: str,
-                                       account_id: str) -> MakeCashWithdrawalOperationResponseSchema:
+                                       account_id: str) -> MakeCashWithdrawalOperationResponseSchema | LazyModel:
         """
         Создать операцию снятия наличных.
 
@@ -342,7 +372,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_cash_withdrawal_operation_api(request)
-        return MakeCashWithdrawalOperationResponseSchema.model_validate_json(response.text)
+        return self.load_response(MakeCashWithdrawalOperationResponseSchema, response)
 
 
 def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
@@ -363,4 +393,7 @@ def build_operations_gateway_locust_http_client(environment: Environment) -> Ope
     :param environment: объект окружения Locust.
     :return: экземпляр OperationsGatewayHTTPClient с хуками сбора метрик.
     """
-    return OperationsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return OperationsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment),
+        loader=build_gateway_locust_response_loader(environment)
+    )
\ No newline at end of file
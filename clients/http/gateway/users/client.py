@@ -3,9 +3,11 @@ from httpx import Response
 from locust.env import Environment
 
 from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.serialization import LazyModel
 from clients.http.gateway.client import (
     build_gateway_http_client,
-    build_gateway_locust_http_client
+    build_gateway_locust_http_client,
+    build_gateway_locust_response_loader
 )
 
 from clients.http.gateway.users.schema import (
@@ -38,18 +40,22 @@ class UsersGatewayHTTPClient(HTTPClient):
         :param request: Словарь с данными нового пользователя.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.post("/api/v1/users", json=request.model_dump(by_alias=True))
+        return self.post(
+            "/api/v1/users",
+            content=request.model_dump_json(by_alias=True),
+            extensions=HTTPClientExtensions(route="/api/v1/users")
+        )
 
 
-    def get_user(self, user_id: str) -> GetUserResponseSchema:
+    def get_user(self, user_id: str) -> GetUserResponseSchema | LazyModel:
         response = self.get_user_api(user_id)
-        return GetUserResponseSchema.model_validate_json(response.text)
+        return self.load_response(GetUserResponseSchema, response)
 
 
-    def create_user(self) -> CreateUserResponseSchema:
+    def create_user(self) -> CreateUserResponseSchema | LazyModel:
         request = CreateUserRequestSchema()
         response = self.create_user_api(request)
-        return CreateUserResponseSchema.model_validate_json(response.text)
+        return self.load_response(CreateUserResponseSchema, response)
 
 
 def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
@@ -70,4 +76,7 @@ def build_users_gateway_locust_http_client(environment: Environment) -> UsersGat
     :param environment: объект окружения Locust.
     :return: экземпляр UsersGatewayHTTPClient с хуками сбора метрик.
     """
-    return UsersGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return UsersGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment),
+        loader=build_gateway_locust_response_loader(environment)
+    )
@@ -1,60 +1,207 @@
 import time
+from typing import Callable, Iterator
 
-from httpx import Request, Response, HTTPStatusError, HTTPError
+from httpx import Request, Response, HTTPStatusError, SyncByteStream
 from locust.env import Environment
 
+from tools.locust.schedule import get_intended_send_time, get_intended_start
+from tools.locust.latency import get_latency_recorder
+from tools.locust.stats import build_route_template, get_locust_stat_name, log_locust_stat
+
+
+class LocustByteStream(SyncByteStream):
+    """
+    Обёртка над потоком тела ответа httpx, которая считает байты по мере чтения
+    и вызывает on_close, когда тело дочитано (или поток закрыт раньше).
+
+    Благодаря ей хук ответа не читает тело сам: httpx дочитывает его как обычно,
+    без повторной буферизации внутри замера.
+    """
+
+    def __init__(self, stream: SyncByteStream, on_close: Callable[[int], None]):
+        """
+        :param stream: Исходный поток тела ответа.
+        :param on_close: Функция, которая получает количество прочитанных байт при закрытии потока.
+        """
+        self.stream = stream
+        self.on_close = on_close
+        self.length = 0
+        self.closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self.stream:
+            self.length += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        try:
+            self.stream.close()
+        finally:
+            if not self.closed:
+                self.closed = True
+                self.on_close(self.length)
+
+
+class LocustHTTPTrace:
+    """
+    Обработчик trace-расширения httpcore: запоминает моменты событий соединения и обмена данными
+    и раскладывает время запроса на фазы.
+
+    Фазы:
+    - acquire — от отправки запроса до начала подключения или записи (ожидание свободного соединения в пуле);
+    - connect — установка TCP-соединения (только для нового соединения);
+    - tls — TLS-рукопожатие (только для нового HTTPS-соединения);
+    - write — отправка заголовков и тела запроса;
+    - wait — ожидание заголовков ответа после отправки запроса (обработка на сервере и сеть);
+    - read — чтение тела ответа.
+    """
+
+    def __init__(self):
+        self.start_time = time.perf_counter()
+        self.events: dict[str, float] = {}
+        self.send_time: float | None = None
+
+    def __call__(self, event_name: str, info: dict) -> None:
+        """
+        Вызывается httpcore на каждое событие, например "http11.send_request_headers.started".
+        Префикс протокола (connection, http11, http2) отбрасывается.
+
+        Первое событие означает, что запрос получил соединение из пула: с этого момента (send_time)
+        считается время ответа, а ожидание свободного соединения в него не входит.
+        """
+        now = time.perf_counter()
+        self.events[event_name.split(".", 1)[1]] = now
+        if self.send_time is None:
+            self.send_time = now
+
+    def span(self, started: str, completed: str) -> float | None:
+        """
+        :return: Время между двумя событиями в миллисекундах или None, если какого-то события не было.
+        """
+        if started not in self.events or completed not in self.events:
+            return None
+
+        return (self.events[completed] - self.events[started]) * 1000
+
+    def get_phases(self) -> dict[str, float]:
+        """
+        :return: Длительности фаз в миллисекундах (только фазы, которые произошли).
+        """
+        phases = {
+            "acquire": (self.send_time - self.start_time) * 1000 if self.send_time is not None else None,
+            "connect": self.span("connect_tcp.started", "connect_tcp.complete"),
+            "tls": self.span("start_tls.started", "start_tls.complete"),
+            "write": self.span("send_request_headers.started", "send_request_body.complete"),
+            "wait": self.span("send_request_body.complete", "receive_response_headers.complete"),
+            "read": self.span("receive_response_body.started", "receive_response_body.complete"),
+        }
+        return {phase: value for phase, value in phases.items() if value is not None}
+
 
 def locust_request_event_hook(request: Request) -> None:
     """
     HTTPX event hook, вызываемый перед отправкой запроса.
 
-    Сохраняет текущее время в `request.extensions["start_time"]`,
-    чтобы потом использовать его для расчёта времени ответа.
+    Сохраняет текущее значение монотонных часов (time.perf_counter) в `request.extensions["start_time"]`
+    и подключает к запросу trace-расширение httpcore (LocustHTTPTrace). По первому событию trace
+    хук ответа узнаёт, когда запрос получил соединение, и не включает ожидание свободного соединения
+    в пуле во время ответа. Стандартный транспорт httpx и GeventHTTPTransport отправляют это событие;
+    если транспорт событий не отправляет, время считается от start_time.
+    Внутри итерации открытой модели (см. tools.locust.arrival) также сохраняет запланированное время
+    отправки в `request.extensions["intended_start_time"]` — по нему считается задержка без coordinated omission.
     """
-    request.extensions["start_time"] = time.time()
+    start_time = time.perf_counter()
+    request.extensions["start_time"] = start_time
+    request.extensions["trace"] = LocustHTTPTrace()
 
+    if get_intended_start() is not None:
+        request.extensions["intended_start_time"] = get_intended_send_time(start_time)
 
-def locust_response_event_hook(environment: Environment):
+
+def locust_response_event_hook(environment: Environment, http_phases: bool = False):
     """
     Возвращает HTTPX event hook, вызываемый после получения ответа.
 
+    Хук вызывается, как только получены заголовки ответа, поэтому здесь фиксируется время до первого байта
+    (TTFB): оно пишется отдельной строкой статистики с типом "TTFB" и не влияет на RPS и Aggregated.
+    Полное время и размер тела фиксируются, когда httpx дочитает тело (см. LocustByteStream):
+    тогда в `environment.events.request` отправляется событие на весь запрос. Размер берётся из счётчика
+    прочитанных байт, а если тело закрыли не читая — из заголовка Content-Length.
+    Время ответа и TTFB считаются с момента, когда запрос получил соединение (LocustHTTPTrace.send_time),
+    поэтому ожидание в очереди пула соединений не выдаётся за время ответа шлюза.
+    С http_phases фазы запроса (см. LocustHTTPTrace) пишутся отдельными строками статистики
+    с типами "HTTP acquire", "HTTP connect", "HTTP tls" и т.д.
+    С --latency-histograms полное время запроса пишется также в HDR-гистограммы маршрута:
+    raw и скорректированное на coordinated omission (см. tools.locust.latency).
+
     Использует `request.extensions["start_time"]` для вычисления времени отклика.
-    Извлекает route из `request.extensions["route"]`, если задан.
-    Отправляет собранные метрики в `environment.events.request`, чтобы Locust мог агрегировать статистику.
+    Извлекает route из `request.extensions["route"]`, если задан, иначе строит шаблон из пути
+    (см. build_route_template). Количество строк статистики ограничено (см. get_locust_stat_name),
+    а текст ошибки статуса не содержит конкретного URL, поэтому и таблица ошибок не растёт.
 
     :param environment: Объект окружения Locust, через который отправляются метрики.
+    :param http_phases: Писать ли фазы запроса в статистику (--gateway-http-phases).
     :return: Функция-хук для HTTPX response event hook.
     """
 
-    def inner(response: Response) -> None:
-        exception: HTTPError | HTTPStatusError | None = None
+    latency_recorder = get_latency_recorder(environment)
 
-        try:
-            # Проверка на статус ошибки (например, 500, 404 и т.д.)
-            response = response.raise_for_status()
-        except (HTTPError, HTTPStatusError) as error:
-            exception = error
+    def inner(response: Response) -> None:
+        exception: HTTPStatusError | None = None
 
         request = response.request
 
-        # Получаем route, если он был передан через extensions, иначе используем raw path
-        route = request.extensions.get("route", request.url.path)
-        # Время начала запроса, установленное в request event hook
-        start_time = request.extensions.get("start_time", time.time())
-        # Вычисляем длительность запроса в миллисекундах
-        response_time = (time.time() - start_time) * 1000
-        # Определяем размер тела ответа (можно заменить на 0, если не нужно)
-        response_length = len(response.read())
-
-        # Отправляем событие в Locust
-        environment.events.request.fire(
-            name=f"{request.method} {route}",  # Имя запроса (метод + логическое имя маршрута)
-            context=None,  # Контекст (опционально, можно использовать для расширений)
-            response=response,  # Объект ответа (опционально)
-            exception=exception,  # Исключение, если оно произошло
-            request_type="HTTP",  # Тип запроса (может быть любым: HTTP, gRPC, DB и т.д.)
-            response_time=response_time,  # Время выполнения запроса в мс
-            response_length=response_length,  # Размер тела ответа
-        )
+        # Получаем route, если он был передан через extensions, иначе строим шаблон из raw path
+        route = request.extensions.get("route") or build_route_template(request.url.path)
+        # Имя запроса (метод + логическое имя маршрута)
+        name = get_locust_stat_name(environment, "HTTP", f"{request.method} {route}")
+
+        if not response.is_success:
+            # Как и raise_for_status, ошибкой считается любой статус вне 2xx, в том числе редиректы 3xx.
+            # Текст ошибки без конкретного URL: ошибки группируются по маршруту, а не по идентификаторам
+            exception = HTTPStatusError(
+                f"{response.status_code} {response.reason_phrase} for route '{name}'",
+                request=request,
+                response=response
+            )
+        # Время получения соединения, а если транспорт не сообщил о нём — время из request event hook
+        trace = request.extensions.get("trace")
+        start_time = trace.send_time if isinstance(trace, LocustHTTPTrace) else None
+        if start_time is None:
+            start_time = request.extensions.get("start_time", time.perf_counter())
+
+        if exception is None:
+            log_locust_stat(environment, "TTFB", name, (time.perf_counter() - start_time) * 1000)
+
+        def on_close(length: int) -> None:
+            end_time = time.perf_counter()
+            # Если тело не читали, опираемся на заявленный сервером размер
+            response_length = length or int(response.headers.get("Content-Length", 0))
+
+            # Отправляем событие в Locust
+            environment.events.request.fire(
+                name=name,
+                context=None,  # Контекст (опционально, можно использовать для расширений)
+                response=response,  # Объект ответа (опционально)
+                exception=exception,  # Исключение, если оно произошло
+                request_type="HTTP",  # Тип запроса (может быть любым: HTTP, gRPC, DB и т.д.)
+                response_time=(end_time - start_time) * 1000,  # Время выполнения запроса в мс
+                response_length=response_length,  # Размер тела ответа
+            )
+
+            if latency_recorder is not None:
+                latency_recorder.record(
+                    "HTTP", name, start_time, request.extensions.get("intended_start_time"), end_time
+                )
+
+            if http_phases and isinstance(trace, LocustHTTPTrace):
+                for phase, value in trace.get_phases().items():
+                    log_locust_stat(environment, f"HTTP {phase}", name, value)
+
+        if response.is_closed:
+            # Транспорт уже загрузил тело целиком (например, GeventHTTPTransport) — поток больше не читается
+            on_close(len(response.content))
+        else:
+            response.stream = LocustByteStream(response.stream, on_close)
 
     return inner
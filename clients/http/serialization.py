@@ -0,0 +1,123 @@
+import random
+from functools import cache
+from types import NoneType, UnionType
+from typing import Any, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel
+from pydantic_core import from_json
+
+Model = TypeVar("Model", bound=BaseModel)
+
+# Заголовки запроса с телом, уже сериализованным в JSON
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@cache
+def get_lazy_fields(schema: type[BaseModel]) -> dict[str, tuple[str, type[BaseModel] | None, bool]]:
+    """
+    Описание полей схемы для ленивого доступа (см. LazyModel).
+
+    :param schema: Pydantic-модель ответа.
+    :return: Для каждого поля: ключ в JSON (алиас), вложенная модель (или None) и признак списка моделей.
+    """
+    fields = {}
+    for name, field in schema.model_fields.items():
+        annotation, is_list = field.annotation, False
+        if get_origin(annotation) is list:
+            annotation, is_list = get_args(annotation)[0], True
+        elif get_origin(annotation) in (Union, UnionType):
+            # X | None: берём вложенную модель, если она есть
+            annotation = next((arg for arg in get_args(annotation) if arg is not NoneType), None)
+
+        nested = annotation if isinstance(annotation, type) and issubclass(annotation, BaseModel) else None
+        fields[name] = (field.alias or name, nested, is_list and nested is not None)
+
+    return fields
+
+
+class LazyModel:
+    """
+    Ленивое представление ответа без валидации pydantic.
+
+    JSON разбирается в dict один раз, а поле извлекается только при обращении к нему — по имени атрибута
+    схемы с учётом алиасов. Вложенные модели и списки моделей тоже оборачиваются в LazyModel,
+    скалярные значения возвращаются как есть (строки, числа; перечисления — строками, даты — в ISO-формате).
+    Полная валидация доступна по требованию через validate().
+    """
+
+    __slots__ = ("schema", "data")
+
+    def __init__(self, schema: type[BaseModel], data: dict[str, Any]):
+        """
+        :param schema: Pydantic-модель, которую представляет объект.
+        :param data: Разобранный JSON этой модели.
+        """
+        self.schema = schema
+        self.data = data
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            key, nested, is_list = get_lazy_fields(self.schema)[name]
+        except KeyError:
+            raise AttributeError(f"'{self.schema.__name__}' has no field '{name}'") from None
+
+        if key in self.data:
+            value = self.data[key]
+        elif self.schema.model_fields[name].is_required():
+            raise AttributeError(f"'{self.schema.__name__}' response has no key '{key}'")
+        else:
+            value = self.schema.model_fields[name].get_default(call_default_factory=True)
+
+        if nested is None or value is None:
+            return value
+        if is_list:
+            return [LazyModel(nested, item) for item in value]
+
+        return LazyModel(nested, value)
+
+    def __repr__(self) -> str:
+        return f"LazyModel[{self.schema.__name__}]({self.data!r})"
+
+    def validate(self) -> BaseModel:
+        """
+        Выполняет полную валидацию ответа.
+
+        :return: Экземпляр схемы.
+        """
+        return self.schema.model_validate(self.data)
+
+
+class ResponseLoader:
+    """
+    Загрузчик ответов HTTP-клиентов.
+
+    По умолчанию каждый ответ полностью валидируется схемой (model_validate_json). В ленивом режиме
+    ответ только разбирается как JSON и возвращается в виде LazyModel: CPU генератора нагрузки
+    не тратится на валидацию полей, которые сценарий не читает. Чтобы не потерять контроль
+    контракта, доля sample_rate ответов всё равно валидируется полностью.
+    """
+
+    def __init__(self, lazy: bool = False, sample_rate: float = 0.0):
+        """
+        :param lazy: Возвращать ли ответы без валидации (LazyModel).
+        :param sample_rate: Доля ответов (от 0 до 1), которые в ленивом режиме валидируются полностью.
+        """
+        self.lazy = lazy
+        self.sample_rate = sample_rate
+
+    def load(self, schema: type[Model], content: bytes) -> Model | LazyModel:
+        """
+        Загружает ответ согласно режиму.
+
+        :param schema: Pydantic-модель ответа.
+        :param content: Тело ответа (response.content).
+        :return: Экземпляр модели или LazyModel с тем же набором полей.
+        """
+        if not self.lazy or random.random() < self.sample_rate:
+            return schema.model_validate_json(content)
+
+        return LazyModel(schema, from_json(content, cache_strings="keys"))
+
+
+# Загрузчик по умолчанию: полная валидация каждого ответа
+FULL_RESPONSE_LOADER = ResponseLoader()
@@ -0,0 +1,108 @@
+import socket
+
+import gevent
+from gevent.lock import BoundedSemaphore
+from geventhttpclient import HTTPClient as GeventHTTPClient
+from geventhttpclient.header import Headers
+from httpx import BaseTransport, Request, Response, ConnectError, ReadTimeout, NetworkError
+
+
+class GeventHTTPTransport(BaseTransport):
+    """
+    Транспорт httpx поверх geventhttpclient — того же C-парсера HTTP, на котором работает FastHttpUser в Locust.
+
+    httpx.Client остаётся прежним, поэтому HTTPClient.get/post, extensions (route) и event hooks
+    (а значит, и отправка метрик в environment.events.request) работают без изменений.
+    Меняется только сетевой уровень: вместо httpcore/h11 на чистом Python запрос пишется и
+    разбирается geventhttpclient. Сборка запроса и ответа httpx и event hooks остаются, поэтому выигрыш
+    ограничен долей сетевого уровня в CPU на запрос (в наших замерах около 20%, 1.6 -> 1.3 мс),
+    а не кратный рост RPS.
+
+    Поддерживается HTTP/1.1. Для каждого хоста держится свой пул из concurrency соединений.
+    Получив свободное соединение, транспорт отправляет в trace-расширение запроса (если оно есть) событие
+    "http11.send_request_headers.started", как это делает httpcore: по нему хук Locust отделяет ожидание
+    соединения в пуле от времени ответа.
+    """
+
+    def __init__(self, concurrency: int = 10, connection_timeout: float = 100, network_timeout: float = 100):
+        """
+        :param concurrency: Максимальное количество соединений к одному хосту.
+        :param connection_timeout: Таймаут установки соединения, с.
+        :param network_timeout: Таймаут чтения/записи, с.
+        """
+        self.concurrency = concurrency
+        self.connection_timeout = connection_timeout
+        self.network_timeout = network_timeout
+        self.clients: dict[tuple[str, str, int | None], GeventHTTPClient] = {}
+        # Ограничивают число одновременных запросов к хосту размером пула geventhttpclient, поэтому
+        # запрос, получивший слот, получает соединение без ожидания
+        self.slots: dict[tuple[str, str, int | None], BoundedSemaphore] = {}
+
+    def get_client(self, request: Request) -> GeventHTTPClient:
+        """
+        :param request: Запрос httpx.
+        :return: Клиент geventhttpclient (пул соединений) для хоста запроса.
+        """
+        url = request.url
+        key = (url.scheme, url.host, url.port)
+
+        if key not in self.clients:
+            self.clients[key] = GeventHTTPClient(
+                url.host,
+                port=url.port or (443 if url.scheme == "https" else 80),
+                ssl=url.scheme == "https",
+                concurrency=self.concurrency,
+                connection_timeout=self.connection_timeout,
+                network_timeout=self.network_timeout
+            )
+            self.slots[key] = BoundedSemaphore(self.concurrency)
+
+        return self.clients[key]
+
+    def handle_request(self, request: Request) -> Response:
+        """
+        Отправляет запрос через geventhttpclient и собирает из ответа httpx.Response.
+
+        Сетевые ошибки приводятся к исключениям httpx, чтобы вызывающий код обрабатывал их как обычно.
+        """
+        client = self.get_client(request)
+        url = request.url
+        trace = request.extensions.get("trace")
+
+        try:
+            with self.slots[(url.scheme, url.host, url.port)]:
+                if trace is not None:
+                    trace("http11.send_request_headers.started", {})
+
+                response = client.request(
+                    request.method,
+                    url.raw_path.decode("ascii"),
+                    body=request.read(),
+                    # multi_items сохраняет повторяющиеся заголовки отдельными строками
+                    headers=Headers(request.headers.multi_items())
+                )
+                try:
+                    content = response.read()
+                finally:
+                    response.release()
+        except (socket.timeout, gevent.Timeout) as error:
+            raise ReadTimeout(str(error), request=request) from error
+        except ConnectionRefusedError as error:
+            raise ConnectError(str(error), request=request) from error
+        except OSError as error:
+            raise NetworkError(str(error), request=request) from error
+
+        return Response(
+            status_code=response.status_code,
+            headers=list(response.items()),
+            content=content,
+            request=request,
+            extensions={"http_version": b"HTTP/1.1", "reason_phrase": (response.status_message or "").encode()}
+        )
+
+    def close(self) -> None:
+        for client in self.clients.values():
+            client.close()
+
+        self.clients.clear()
+        self.slots.clear()
@@ -0,0 +1,32 @@
+from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient, build_accounts_gateway_locust_http_client
+from clients.http.gateway.operations.client import (
+    OperationsGatewayHTTPClient,
+    build_operations_gateway_locust_http_client
+)
+from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_locust_http_client
+from tools.locust.arrival import LocustArrivalRateUser
+
+
+# Открытая модель: итерации стартуют с постоянной частотой независимо от времени ответа шлюза
+class MakeTopUpOperationArrivalRateUser(LocustArrivalRateUser):
+    users_gateway_client: UsersGatewayHTTPClient
+    accounts_gateway_client: AccountsGatewayHTTPClient
+    operations_gateway_client: OperationsGatewayHTTPClient
+
+    def on_start(self) -> None:
+        super().on_start()
+        self.users_gateway_client = build_users_gateway_locust_http_client(self.environment)
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.environment)
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.environment)
+
+    def iteration(self) -> None:
+        create_user_response = self.users_gateway_client.create_user()
+
+        open_debit_card_account_response = self.accounts_gateway_client.open_debit_card_account(
+            user_id=create_user_response.user.id
+        )
+
+        self.operations_gateway_client.make_top_up_operation(
+            card_id=open_debit_card_account_response.account.cards[0].id,
+            account_id=open_debit_card_account_response.account.id
+        )
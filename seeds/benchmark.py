@@ -0,0 +1,231 @@
+import copy
+import os
+import time
+from collections import defaultdict
+from datetime import datetime
+from functools import wraps
+from typing import Callable, Iterator
+
+from pydantic import BaseModel
+
+from seeds.builder import SeedsBuilder
+from seeds.schema.plan import SeedUsersPlan
+from seeds.schema.result import SeedUserResult, SeedAccountResult
+
+
+class SeedsRPCStats(BaseModel):
+    """
+    Статистика времени выполнения одного метода шлюза (RPC).
+
+    Attributes:
+        count (int): Количество вызовов.
+        mean_ms (float): Среднее время, мс.
+        p50_ms (float): Медиана, мс.
+        p90_ms (float): 90-й перцентиль, мс.
+        p95_ms (float): 95-й перцентиль, мс.
+        p99_ms (float): 99-й перцентиль, мс.
+        max_ms (float): Максимальное время, мс.
+    """
+    count: int
+    mean_ms: float
+    p50_ms: float
+    p90_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+class SeedsBenchmarkReport(BaseModel):
+    """
+    Результат бенчмарка сидинга.
+
+    Attributes:
+        scenario (str): Название сценария сидинга.
+        workers (int): Количество параллельных воркеров билдера.
+        started_at (datetime): Время запуска бенчмарка.
+        wall_time_s (float): Общее время сидинга, с.
+        cpu_time_s (float): Процессорное время клиента (всех потоков процесса), с.
+        cpu_utilization (float): Доля ядра, занятая клиентом (cpu_time_s / wall_time_s).
+        users (int): Количество созданных пользователей.
+        accounts (int): Количество открытых счетов.
+        cards (int): Количество выпущенных карт (без карт по умолчанию).
+        operations (int): Количество проведённых операций.
+        users_per_second (float): Пользователей в секунду.
+        accounts_per_second (float): Счетов в секунду.
+        cards_per_second (float): Карт в секунду.
+        operations_per_second (float): Операций в секунду.
+        rpcs (dict[str, SeedsRPCStats]): Время вызовов шлюза по именам методов (CreateUser, OpenDebitCardAccount, ...).
+    """
+    scenario: str
+    workers: int
+    started_at: datetime
+    wall_time_s: float
+    cpu_time_s: float
+    cpu_utilization: float
+    users: int
+    accounts: int
+    cards: int
+    operations: int
+    users_per_second: float
+    accounts_per_second: float
+    cards_per_second: float
+    operations_per_second: float
+    rpcs: dict[str, SeedsRPCStats]
+
+
+def build_seeds_rpc_stats(durations: list[float]) -> SeedsRPCStats:
+    """
+    Считает статистику метода по списку длительностей (перцентили по ближайшему рангу).
+
+    :param durations: Длительности вызовов в секундах.
+    :return: Статистика в миллисекундах.
+    """
+    values = sorted(durations)
+
+    def percentile(value: float) -> float:
+        return values[min(len(values) - 1, max(0, round(value * len(values)) - 1))] * 1000
+
+    return SeedsRPCStats(
+        count=len(values),
+        mean_ms=sum(values) / len(values) * 1000,
+        p50_ms=percentile(0.5),
+        p90_ms=percentile(0.9),
+        p95_ms=percentile(0.95),
+        p99_ms=percentile(0.99),
+        max_ms=values[-1] * 1000
+    )
+
+
+def get_seeds_rpc_name(method: str) -> str:
+    """
+    :param method: Имя низкоуровневого метода клиента, например "open_debit_card_account_api".
+    :return: Имя RPC для отчёта, например "OpenDebitCardAccount".
+    """
+    return "".join(part.capitalize() for part in method.removesuffix("_api").split("_"))
+
+
+class SeedsBenchmark:
+    """
+    Бенчмарк билдера сидинга: пропускная способность, время каждого вызова шлюза и CPU клиента.
+
+    Таймерами оборачиваются низкоуровневые методы *_api клиентов шлюза (create_user_api,
+    open_debit_card_account_api, make_top_up_operation_api, ...): один вызов — один запрос к шлюзу,
+    поэтому в отчёте одна строка на RPC. HTTP- и gRPC-клиенты называют эти методы одинаково.
+    Обёртки ставятся на копии билдера и его клиентов, поэтому билдер сценария не меняется.
+    """
+
+    def __init__(self, builder: SeedsBuilder):
+        """
+        :param builder: Билдер, который нужно измерить.
+        """
+        self.builder = copy.copy(builder)
+        self.durations: dict[str, list[float]] = defaultdict(list)
+
+        for attribute in (
+                "users_gateway_client",
+                "cards_gateway_client",
+                "accounts_gateway_client",
+                "operations_gateway_client"
+        ):
+            client = copy.copy(getattr(self.builder, attribute))
+            for name in dir(client):
+                if name.endswith("_api") and not name.startswith("_"):
+                    setattr(client, name, self.timed(get_seeds_rpc_name(name), getattr(client, name)))
+
+            setattr(self.builder, attribute, client)
+
+    def timed(self, name: str, method: Callable) -> Callable:
+        """
+        Оборачивает метод клиента таймером.
+
+        :param name: Имя RPC в отчёте.
+        :param method: Метод клиента.
+        :return: Обёртка, записывающая длительность каждого вызова.
+        """
+        durations = self.durations[name]
+
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                durations.append(time.perf_counter() - start)
+
+        return wrapper
+
+    def run(self, scenario: str, plan: SeedUsersPlan, count: int | None = None, workers: int = 1) -> SeedsBenchmarkReport:
+        """
+        Создаёт пользователей по плану и собирает отчёт. Дамп и чекпоинт при этом не пишутся.
+
+        :param scenario: Название сценария сидинга (для отчёта).
+        :param plan: План генерации пользователя.
+        :param count: Сколько пользователей создать (по умолчанию plan.count).
+        :param workers: Количество параллельных воркеров билдера.
+        :return: Отчёт бенчмарка.
+        """
+        started_at = datetime.now()
+        users = accounts = cards = operations = 0
+
+        start_wall, start_cpu = time.perf_counter(), time.process_time()
+        for user in self.builder.iter_users(plan=plan, count=count, workers=workers):
+            users += 1
+            for account in self.iter_accounts(user):
+                accounts += 1
+                cards += len(account.physical_cards) + len(account.virtual_cards)
+                operations += (
+                        len(account.top_up_operations)
+                        + len(account.purchase_operations)
+                        + len(account.transfer_operations)
+                        + len(account.cash_withdrawal_operations)
+                )
+        wall_time, cpu_time = time.perf_counter() - start_wall, time.process_time() - start_cpu
+
+        return SeedsBenchmarkReport(
+            scenario=scenario,
+            workers=workers,
+            started_at=started_at,
+            wall_time_s=wall_time,
+            cpu_time_s=cpu_time,
+            cpu_utilization=cpu_time / wall_time if wall_time else 0.0,
+            users=users,
+            accounts=accounts,
+            cards=cards,
+            operations=operations,
+            users_per_second=users / wall_time if wall_time else 0.0,
+            accounts_per_second=accounts / wall_time if wall_time else 0.0,
+            cards_per_second=cards / wall_time if wall_time else 0.0,
+            operations_per_second=operations / wall_time if wall_time else 0.0,
+            rpcs={
+                name: build_seeds_rpc_stats(durations)
+                for name, durations in sorted(self.durations.items()) if durations
+            }
+        )
+
+    @staticmethod
+    def iter_accounts(user: SeedUserResult) -> Iterator[SeedAccountResult]:
+        """
+        :param user: Созданный пользователь.
+        :return: Все счета пользователя всех типов.
+        """
+        yield from user.savings_accounts
+        yield from user.deposit_accounts
+        yield from user.debit_card_accounts
+        yield from user.credit_card_accounts
+
+
+def save_seeds_benchmark_report(report: SeedsBenchmarkReport) -> str:
+    """
+    Сохраняет отчёт бенчмарка в JSON рядом с отчётами Locust.
+
+    :param report: Отчёт бенчмарка.
+    :return: Путь к сохранённому файлу.
+    """
+    if not os.path.exists("reports"):
+        os.mkdir("reports")
+
+    path = f"./reports/{report.scenario}_seeds_benchmark_{report.started_at:%Y-%m-%d-%Hh%Mm%S}.json"
+    with open(path, 'w', encoding="utf-8") as file:
+        file.write(report.model_dump_json(indent=2))
+
+    return path
@@ -1,7 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from functools import partial
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+
+from clients.grpc.gateway.client import GATEWAY_GRPC_TARGET
 from clients.grpc.gateway.accounts.client import build_accounts_gateway_grpc_client, AccountsGatewayGRPCClient
 from clients.grpc.gateway.cards.client import build_cards_gateway_grpc_client, CardsGatewayGRPCClient
 from clients.grpc.gateway.operations.client import build_operations_gateway_grpc_client, OperationsGatewayGRPCClient
 from clients.grpc.gateway.users.client import build_users_gateway_grpc_client, UsersGatewayGRPCClient
+from clients.http.gateway.client import GATEWAY_HTTP_BASE_URL
 from clients.http.gateway.accounts.client import build_accounts_gateway_http_client, AccountsGatewayHTTPClient
 from clients.http.gateway.cards.client import build_cards_gateway_http_client, CardsGatewayHTTPClient
 from clients.http.gateway.operations.client import build_operations_gateway_http_client, OperationsGatewayHTTPClient
@@ -30,6 +37,7 @@ class SeedsBuilder:
         cards_gateway_client: Клиент для выпуска карт
         accounts_gateway_client: Клиент для открытия счетов
         operations_gateway_client: Клиент для операций (топ-ап, покупки и т.д.)
+        gateway: Адрес шлюза, с которым работают клиенты (gRPC target или базовый URL HTTP)
     """
 
     def __init__(
@@ -37,12 +45,14 @@ class SeedsBuilder:
             users_gateway_client: UsersGatewayGRPCClient | UsersGatewayHTTPClient,
             cards_gateway_client: CardsGatewayGRPCClient | CardsGatewayHTTPClient,
             accounts_gateway_client: AccountsGatewayGRPCClient | AccountsGatewayHTTPClient,
-            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient
+            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient,
+            gateway: str
     ):
         self.users_gateway_client = users_gateway_client
         self.cards_gateway_client = cards_gateway_client
         self.accounts_gateway_client = accounts_gateway_client
         self.operations_gateway_client = operations_gateway_client
+        self.gateway = gateway
 
     def build_physical_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
         """
@@ -304,7 +314,202 @@ class SeedsBuilder:
             ]
         )
 
-    def build(self, plan: SeedsPlan) -> SeedsResult:
+    def top_up_card_account_result(
+            self,
+            plan: SeedAccountsPlan,
+            user_id: str,
+            account: SeedAccountResult,
+            card_id: str | None
+    ) -> SeedAccountResult:
+        """
+        Дополняет уже созданный карточный (дебетовый или кредитный) счёт картами и операциями,
+        которых не хватает до плана. То, что уже есть на счёте, повторно не создаётся.
+
+        Args:
+            plan: План счёта
+            user_id: Идентификатор пользователя
+            account: Существующий счёт из дампа (дополняется на месте)
+            card_id: Идентификатор карты по умолчанию (нужен только для операций)
+
+        Returns:
+            SeedAccountResult: Дополненный счёт
+
+        Raises:
+            ValueError: Если на счёте не хватает операций, а карты, по которой их провести, нет
+        """
+        account_id = account.account_id
+
+        if card_id is None and (
+                len(account.top_up_operations) < plan.top_up_operations.count
+                or len(account.purchase_operations) < plan.purchase_operations.count
+                or len(account.transfer_operations) < plan.transfer_operations.count
+                or len(account.cash_withdrawal_operations) < plan.cash_withdrawal_operations.count
+        ):
+            raise ValueError(
+                f"Cannot top up operations of account {account_id} of user {user_id}: the account has no cards"
+            )
+
+        account.physical_cards += [
+            self.build_physical_card_result(user_id=user_id, account_id=account_id)
+            for _ in range(plan.physical_cards.count - len(account.physical_cards))
+        ]
+        account.virtual_cards += [
+            self.build_virtual_card_result(user_id=user_id, account_id=account_id)
+            for _ in range(plan.virtual_cards.count - len(account.virtual_cards))
+        ]
+        account.top_up_operations += [
+            self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
+            for _ in range(plan.top_up_operations.count - len(account.top_up_operations))
+        ]
+        account.purchase_operations += [
+            self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
+            for _ in range(plan.purchase_operations.count - len(account.purchase_operations))
+        ]
+        account.transfer_operations += [
+            self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
+            for _ in range(plan.transfer_operations.count - len(account.transfer_operations))
+        ]
+        account.cash_withdrawal_operations += [
+            self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id)
+            for _ in range(plan.cash_withdrawal_operations.count - len(account.cash_withdrawal_operations))
+        ]
+        return account
+
+    def top_up_user(self, plan: SeedUsersPlan, user: SeedUserResult) -> SeedUserResult:
+        """
+        Дополняет уже созданного пользователя до плана: открывает недостающие счета,
+        а на существующих карточных счетах выпускает недостающие карты и проводит недостающие операции.
+
+        Операциям нужна карта по умолчанию, которой нет в дампе, поэтому она берётся из списка
+        счетов пользователя — один запрос get_accounts и только если на каком-то счёте не хватает операций.
+
+        Args:
+            plan: План генерации пользователя
+            user: Пользователь из существующего дампа (дополняется на месте)
+
+        Returns:
+            SeedUserResult: Дополненный пользователь
+        """
+        user_id = user.user_id
+
+        user.savings_accounts += [
+            self.build_savings_account_result(user_id=user_id)
+            for _ in range(plan.savings_accounts.count - len(user.savings_accounts))
+        ]
+        user.deposit_accounts += [
+            self.build_deposit_account_result(user_id=user_id)
+            for _ in range(plan.deposit_accounts.count - len(user.deposit_accounts))
+        ]
+
+        card_accounts = (
+            (plan.debit_card_accounts, user.debit_card_accounts, self.build_debit_card_account_result),
+            (plan.credit_card_accounts, user.credit_card_accounts, self.build_credit_card_account_result)
+        )
+
+        card_ids: dict[str, str] = {}
+        if any(
+                len(account.top_up_operations) < accounts_plan.top_up_operations.count
+                or len(account.purchase_operations) < accounts_plan.purchase_operations.count
+                or len(account.transfer_operations) < accounts_plan.transfer_operations.count
+                or len(account.cash_withdrawal_operations) < accounts_plan.cash_withdrawal_operations.count
+                for accounts_plan, accounts, _ in card_accounts
+                for account in accounts
+        ):
+            response = self.accounts_gateway_client.get_accounts(user_id=user_id)
+            card_ids = {account.id: account.cards[0].id for account in response.accounts if account.cards}
+
+        for accounts_plan, accounts, build_account_result in card_accounts:
+            for account in accounts:
+                self.top_up_card_account_result(
+                    plan=accounts_plan,
+                    user_id=user_id,
+                    account=account,
+                    card_id=card_ids.get(account.account_id)
+                )
+
+            accounts += [
+                build_account_result(plan=accounts_plan, user_id=user_id)
+                for _ in range(accounts_plan.count - len(accounts))
+            ]
+
+        return user
+
+    def run_tasks(self, tasks: Iterator[Callable[[], SeedUserResult]], workers: int = 1) -> Iterator[SeedUserResult]:
+        """
+        Выполняет задачи построения пользователей и отдаёт результаты по мере готовности.
+
+        При workers > 1 задачи выполняются в пуле потоков, но в работе одновременно находится
+        не больше workers * 2 задач, поэтому следующие задачи берутся из итератора лениво.
+
+        Args:
+            tasks: Итератор задач, каждая возвращает готового пользователя
+            workers: Количество параллельных воркеров
+
+        Returns:
+            Iterator[SeedUserResult]: Пользователи в порядке завершения
+        """
+        if workers <= 1:
+            for task in tasks:
+                yield task()
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending: set[Future[SeedUserResult]] = {
+                executor.submit(task) for task in islice(tasks, workers * 2)
+            }
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for task in islice(tasks, 1):
+                        pending.add(executor.submit(task))
+
+                    yield future.result()
+
+    def iter_users(self, plan: SeedUsersPlan, count: int | None = None, workers: int = 1) -> Iterator[SeedUserResult]:
+        """
+        Создаёт пользователей согласно плану и отдаёт их по одному по мере готовности.
+
+        При workers > 1 деревья разных пользователей строятся параллельно в пуле потоков,
+        при этом внутри одного пользователя порядок сохраняется: пользователь, затем счёт,
+        затем карты и операции. В работе одновременно находится не больше workers * 2 задач,
+        поэтому память не растёт с количеством пользователей в плане.
+
+        Args:
+            plan: План генерации пользователя
+            count: Сколько пользователей создать (по умолчанию plan.count)
+            workers: Количество параллельных воркеров
+
+        Returns:
+            Iterator[SeedUserResult]: Созданные пользователи в порядке завершения
+        """
+        count = plan.count if count is None else count
+        tasks = (partial(self.build_user, plan=plan) for _ in range(count))
+
+        return self.run_tasks(tasks, workers=workers)
+
+    def iter_top_up_users(
+            self,
+            plan: SeedUsersPlan,
+            users: Iterable[SeedUserResult],
+            workers: int = 1
+    ) -> Iterator[SeedUserResult]:
+        """
+        Дополняет существующих пользователей до плана (см. top_up_user) с тем же параллелизмом, что и iter_users.
+
+        Args:
+            plan: План генерации пользователя
+            users: Пользователи из существующего дампа (читаются лениво)
+            workers: Количество параллельных воркеров
+
+        Returns:
+            Iterator[SeedUserResult]: Дополненные пользователи в порядке завершения
+        """
+        tasks = (partial(self.top_up_user, plan=plan, user=user) for user in users)
+
+        return self.run_tasks(tasks, workers=workers)
+
+    def build(self, plan: SeedsPlan, workers: int = 1) -> SeedsResult:
         """
         Генерирует полную структуру данных на основе плана:
         - создаёт указанное количество пользователей
@@ -312,11 +517,12 @@ class SeedsBuilder:
 
         Args:
             plan: Полный план генерации данных
+            workers: Количество параллельных воркеров (1 — последовательная генерация)
 
         Returns:
             SeedsResult: Результат с данными всех созданных пользователей
         """
-        return SeedsResult(users=[self.build_user(plan=plan.users) for _ in range(plan.users.count)])
+        return SeedsResult(users=list(self.iter_users(plan=plan.users, workers=workers)))
 
 
 def build_grpc_seeds_builder() -> SeedsBuilder:
@@ -330,7 +536,8 @@ def build_grpc_seeds_builder() -> SeedsBuilder:
         users_gateway_client=build_users_gateway_grpc_client(),
         cards_gateway_client=build_cards_gateway_grpc_client(),
         accounts_gateway_client=build_accounts_gateway_grpc_client(),
-        operations_gateway_client=build_operations_gateway_grpc_client()
+        operations_gateway_client=build_operations_gateway_grpc_client(),
+        gateway=GATEWAY_GRPC_TARGET
     )
 
 
@@ -345,5 +552,6 @@ def build_http_seeds_builder():
         users_gateway_client=build_users_gateway_http_client(),
         cards_gateway_client=build_cards_gateway_http_client(),
         accounts_gateway_client=build_accounts_gateway_http_client(),
-        operations_gateway_client=build_operations_gateway_http_client()
+        operations_gateway_client=build_operations_gateway_http_client(),
+        gateway=GATEWAY_HTTP_BASE_URL
     )
@@ -0,0 +1,104 @@
+import hashlib
+import json
+import os
+
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from seeds.dumps import SeedsDumpFormat
+from seeds.schema.plan import SeedsPlan
+
+
+class SeedsDumpMeta(BaseModel):
+    """
+    Метаданные дампа сидинга, которые хранятся рядом с ним.
+
+    Attributes:
+        plan_hash (str): Хеш структуры плана и адреса шлюза (см. build_seeds_plan_hash).
+        gateway (str): Адрес шлюза, на котором создавались данные.
+        dump_format (SeedsDumpFormat): Формат, в котором сохранён дамп.
+        plan (SeedsPlan): План, которому удовлетворяет дамп (users.count — фактическое количество пользователей).
+    """
+    plan_hash: str
+    gateway: str
+    dump_format: SeedsDumpFormat
+    plan: SeedsPlan = Field(default_factory=SeedsPlan)
+
+
+def strip_seeds_plan_counts(value: Any) -> Any:
+    """
+    Убирает из выгрузки плана все поля count, оставляя только его структуру.
+    """
+    if isinstance(value, dict):
+        return {key: strip_seeds_plan_counts(item) for key, item in value.items() if key != "count"}
+
+    return value
+
+
+def is_seeds_plan_covered(current: Any, required: Any) -> bool:
+    """
+    Проверяет, что каждое количество в требуемом плане не больше, чем в текущем.
+
+    :param current: Выгрузка плана, которому удовлетворяет дамп (model_dump).
+    :param required: Выгрузка требуемого плана (model_dump).
+    :return: True, если дамп покрывает требуемый план и достраивать ничего не нужно.
+    """
+    if isinstance(required, dict):
+        return all(is_seeds_plan_covered(current.get(key, 0), value) for key, value in required.items())
+
+    return current >= required
+
+
+def build_seeds_plan_hash(plan: SeedsPlan, gateway: str) -> str:
+    """
+    Считает стабильный хеш плана сидинга для заданного шлюза.
+
+    Количества (поля count) в хеш не входят: если выросли только они, существующий дамп
+    можно дополнить недостающими пользователями, счетами, картами и операциями, а не пересоздавать.
+
+    :param plan: План сидинга.
+    :param gateway: Адрес шлюза, на котором создаются данные.
+    :return: Хеш в виде hex-строки sha256.
+    """
+    payload = json.dumps(
+        {"plan": strip_seeds_plan_counts(plan.model_dump(mode="json")), "gateway": gateway},
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def get_seeds_meta_path(scenario: str) -> str:
+    """
+    :param scenario: Название сценария нагрузки.
+    :return: Путь к файлу метаданных дампа.
+    """
+    return f"./dumps/{scenario}_seeds.meta.json"
+
+
+def save_seeds_dump_meta(meta: SeedsDumpMeta, scenario: str) -> None:
+    """
+    Сохраняет метаданные дампа сценария.
+
+    :param meta: Метаданные дампа.
+    :param scenario: Название сценария нагрузки.
+    """
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    with open(get_seeds_meta_path(scenario), 'w', encoding="utf-8") as file:
+        file.write(meta.model_dump_json())
+
+
+def load_seeds_dump_meta(scenario: str) -> SeedsDumpMeta | None:
+    """
+    Загружает метаданные дампа сценария.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Метаданные или None, если дамп создавался без них.
+    """
+    if not os.path.exists(get_seeds_meta_path(scenario)):
+        return None
+
+    with open(get_seeds_meta_path(scenario), 'r', encoding="utf-8") as file:
+        return SeedsDumpMeta.model_validate_json(file.read())
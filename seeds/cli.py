@@ -0,0 +1,61 @@
+import argparse
+import importlib
+import inspect
+
+from seeds.scenario import SeedsScenario
+
+
+def resolve_seeds_scenario(name: str) -> type[SeedsScenario]:
+    """
+    Находит класс сценария сидинга по имени модуля в пакете seeds.scenarios.
+
+    :param name: Имя модуля сценария, например existing_user_get_operations.
+    :return: Класс сценария, объявленный в этом модуле.
+    """
+    module = importlib.import_module(f"seeds.scenarios.{name}")
+
+    for _, value in inspect.getmembers(module, inspect.isclass):
+        if issubclass(value, SeedsScenario) and value.__module__ == module.__name__:
+            return value
+
+    raise ValueError(f"Seeds scenario is not found in module: {module.__name__}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Точка входа для запуска сидинга из командной строки:
+
+        python -m seeds.cli existing_user_get_operations --shards 8
+        python -m seeds.cli existing_user_get_operations --benchmark --count 100
+
+    При --shards 1 сценарий строится в текущем процессе (SeedsScenario.build),
+    иначе — в нескольких процессах с последующим слиянием шардов (SeedsScenario.build_sharded).
+    С --benchmark вместо сидинга выполняется замер скорости билдера (SeedsScenario.benchmark).
+    """
+    parser = argparse.ArgumentParser(description="Seeding of load testing scenarios")
+    parser.add_argument("scenario", help="Module name from seeds/scenarios, e.g. existing_user_get_operations")
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="Number of seeding processes (default: 1, build in the current process)"
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Measure seeding throughput and per-RPC latency instead of writing the dump"
+    )
+    parser.add_argument("--count", type=int, default=None, help="Number of users for --benchmark (default: plan count)")
+    args = parser.parse_args(argv)
+
+    scenario = resolve_seeds_scenario(args.scenario)()
+    if args.benchmark:
+        print(scenario.benchmark(count=args.count).model_dump_json(indent=2))
+    elif args.shards <= 1:
+        scenario.build()
+    else:
+        scenario.build_sharded(shards=args.shards)
+
+
+if __name__ == '__main__':
+    main()
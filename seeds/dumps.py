@@ -1,21 +1,68 @@
+import glob
 import os
+import random
+import shutil
+from array import array
+from itertools import islice
+from enum import StrEnum
+from typing import Iterable, Iterator
 
-from seeds.schema.result import SeedsResult
+from seeds.schema.result import SeedsResult, SeedUserResult
+from seeds.store import SeedsStore, write_seeds_store
 
+# Размер блока, которым SeedsCheckpoint.recover читает файл с конца в поисках последней целой строки
+CHECKPOINT_RECOVER_BLOCK_SIZE = 64 * 1024
 
-def save_seeds_result(result: SeedsResult, scenario: str):
+
+class SeedsDumpFormat(StrEnum):
+    """
+    Формат файла с результатом сидинга.
+
+    JSON — весь SeedsResult одним объектом (нужно целиком распарсить при загрузке).
+    JSONL — один SeedUserResult на строку (пользователи читаются и валидируются лениво).
+    BINARY — бинарное хранилище с индексом смещений для mmap (см. seeds.store.SeedsStore).
+    """
+    JSON = "json"
+    JSONL = "jsonl"
+    BINARY = "bin"
+
+
+def get_seeds_dump_path(scenario: str, dump_format: SeedsDumpFormat = SeedsDumpFormat.JSON) -> str:
     """
-    Сохраняет результат сидинга (SeedsResult) в JSON-файл.
+    Возвращает путь к файлу дампа сценария.
+
+    :param scenario: Название сценария нагрузки.
+    :param dump_format: Формат дампа.
+    :return: Путь вида ./dumps/{scenario}_seeds.{format}.
+    """
+    return f"./dumps/{scenario}_seeds.{dump_format}"
+
+
+def save_seeds_result(result: SeedsResult, scenario: str, dump_format: SeedsDumpFormat = SeedsDumpFormat.JSON):
+    """
+    Сохраняет результат сидинга (SeedsResult) в JSON или JSONL-файл.
 
     :param result: Результат сидинга, сгенерированный билдером.
     :param scenario: Название сценария нагрузки, для которого создаются данные.
                      Используется для генерации имени файла (например, "credit_card_test").
+    :param dump_format: Формат дампа (JSON по умолчанию).
     """
     if not os.path.exists("dumps"):
         os.mkdir("dumps")
 
-    with open(f"./dumps/{scenario}_seeds.json", 'w+', encoding="utf-8") as file:
-        file.write(result.model_dump_json())
+    if dump_format == SeedsDumpFormat.BINARY:
+        write_seeds_store(
+            get_seeds_dump_path(scenario, dump_format),
+            (user.model_dump_json().encode() for user in result.users)
+        )
+        return
+
+    with open(get_seeds_dump_path(scenario, dump_format), 'w+', encoding="utf-8") as file:
+        if dump_format == SeedsDumpFormat.JSONL:
+            for user in result.users:
+                file.write(user.model_dump_json() + "\n")
+        else:
+            file.write(result.model_dump_json())
 
 
 def load_seeds_result(scenario: str) -> SeedsResult:
@@ -26,5 +73,342 @@ def load_seeds_result(scenario: str) -> SeedsResult:
     :return: Объект SeedsResult, восстановленный из файла.
     """
 
-    with open(f'./dumps/{scenario}_seeds.json', 'r', encoding="utf-8") as file:
-        return SeedsResult.model_validate_json(file.read())
\ No newline at end of file
+    with open(get_seeds_dump_path(scenario), 'r', encoding="utf-8") as file:
+        return SeedsResult.model_validate_json(file.read())
+
+
+def iter_seeds_users(scenario: str) -> Iterator[SeedUserResult]:
+    """
+    Лениво читает пользователей из JSONL-дампа: строка валидируется только когда до неё дошла очередь.
+
+    :param scenario: Название сценария нагрузки, данные которого нужно загрузить.
+    :return: Генератор объектов SeedUserResult.
+    """
+    with open(get_seeds_dump_path(scenario, SeedsDumpFormat.JSONL), 'rb') as file:
+        for line in file:
+            if line.strip():
+                yield SeedUserResult.model_validate_json(line)
+
+
+class LazySeedsResult:
+    """
+    Ленивый аналог SeedsResult поверх JSONL-дампа.
+
+    Предоставляет тот же интерфейс раздачи пользователей (get_next_user, get_random_user),
+    но не держит весь список в памяти: get_next_user читает файл последовательно,
+    а get_random_user при первом вызове строит компактный индекс смещений строк
+    (8 байт на пользователя) и дальше читает одну случайную строку.
+    """
+
+    def __init__(self, scenario: str):
+        """
+        :param scenario: Название сценария нагрузки, JSONL-дамп которого нужно читать.
+        """
+        self.path = get_seeds_dump_path(scenario, SeedsDumpFormat.JSONL)
+        self.users = iter_seeds_users(scenario)
+        self.file = None
+        self.offsets: array | None = None
+        self.worker_index = 0
+        self.worker_count = 1
+
+    def __iter__(self) -> Iterator[SeedUserResult]:
+        return self.users
+
+    def partition(self, worker_index: int, worker_count: int) -> "LazySeedsResult":
+        """
+        Ограничивает раздачу детерминированной долей пользователей одного воркера Locust:
+        строки с номерами worker_index, worker_index + worker_count, ...
+
+        :param worker_index: Номер воркера (0 <= worker_index < worker_count).
+        :param worker_count: Общее количество воркеров.
+        :return: Этот же объект, ограниченный долей воркера.
+        """
+        self.worker_index, self.worker_count = worker_index, worker_count
+        self.users = islice(self.users, worker_index, None, worker_count)
+        self.offsets = None
+        return self
+
+    def build_offsets(self) -> array:
+        """
+        Строит индекс смещений начала каждой строки в файле дампа.
+
+        :return: Массив смещений (array типа 'q').
+        """
+        offsets = array('q')
+        with open(self.path, 'rb') as file:
+            position = 0
+            for line in file:
+                if line.strip():
+                    offsets.append(position)
+                position += len(line)
+
+        return offsets[self.worker_index::self.worker_count]
+
+    def get_next_user(self) -> SeedUserResult:
+        """
+        Возвращает следующего пользователя из дампа.
+
+        Returns:
+            SeedUserResult: Следующий пользователь.
+
+        Raises:
+            IndexError: Если пользователи в дампе закончились (как list.pop на пустом списке).
+        """
+        try:
+            return next(self.users)
+        except StopIteration:
+            raise IndexError("No more seeded users left in dump") from None
+
+    def get_random_user(self) -> SeedUserResult:
+        """
+        Возвращает случайного пользователя из дампа без удаления.
+
+        Returns:
+            SeedUserResult: Случайный пользователь.
+        """
+        if self.offsets is None:
+            self.offsets = self.build_offsets()
+            self.file = open(self.path, 'rb')
+
+        self.file.seek(random.choice(self.offsets))
+        return SeedUserResult.model_validate_json(self.file.readline())
+
+
+def get_seeds_shard_scenario(scenario: str, shard: int) -> str:
+    """
+    :param scenario: Название сценария нагрузки.
+    :param shard: Номер шарда.
+    :return: Имя, под которым шард ведёт собственный чекпоинт.
+    """
+    return f"{scenario}_shard{shard}"
+
+
+class SeedsCheckpoint:
+    """
+    Чекпоинт сидинга — файл, в который каждый готовый SeedUserResult дописывается отдельной строкой (JSON Lines).
+
+    Если сидинг упал посередине, при перезапуске уже созданные пользователи берутся из чекпоинта,
+    а билдер достраивает только оставшихся. После завершения чекпоинт сливается в итоговый дамп
+    построчно, без загрузки всех пользователей в память.
+
+    Используется как контекстный менеджер:
+
+        with SeedsCheckpoint(scenario="existing_user_get_operations") as checkpoint:
+            for user in builder.iter_users(plan=plan.users, count=plan.users.count - checkpoint.count):
+                checkpoint.append(user)
+        checkpoint.consolidate()
+    """
+
+    def __init__(self, scenario: str, fsync_every: int = 100):
+        """
+        :param scenario: Название сценария нагрузки, для которого ведётся чекпоинт.
+        :param fsync_every: Через сколько записей принудительно сбрасывать файл на диск (fsync).
+                            Сброс в ОС (flush) выполняется после каждой записи.
+        """
+        self.scenario = scenario
+        self.fsync_every = fsync_every
+        self.path = f"./dumps/{scenario}_seeds.checkpoint.jsonl"
+        self.count = self.recover()
+        self.file = None
+        self.unsynced = 0
+
+    def recover(self) -> int:
+        """
+        Восстанавливает чекпоинт после падения: обрезает недописанную последнюю строку.
+
+        :return: Количество полностью записанных пользователей.
+        """
+        if not os.path.exists(self.path):
+            return 0
+
+        with open(self.path, 'rb+') as file:
+            # Ищем последний перевод строки, читая файл с конца блоками
+            size = end = file.seek(0, os.SEEK_END)
+            while end > 0:
+                start = max(end - CHECKPOINT_RECOVER_BLOCK_SIZE, 0)
+                file.seek(start)
+                position = file.read(end - start).rfind(b"\n")
+                if position != -1:
+                    end = start + position + 1
+                    break
+                end = start
+
+            if end != size:
+                file.truncate(end)
+
+            file.seek(0)
+            return sum(1 for _ in file)
+
+    def __enter__(self) -> "SeedsCheckpoint":
+        if not os.path.exists("dumps"):
+            os.mkdir("dumps")
+
+        self.file = open(self.path, 'a', encoding="utf-8")
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.sync()
+        self.file.close()
+        self.file = None
+
+    def sync(self) -> None:
+        """
+        Сбрасывает накопленные записи на диск.
+        """
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.unsynced = 0
+
+    def append(self, user: SeedUserResult) -> None:
+        """
+        Дописывает готового пользователя в чекпоинт.
+
+        :param user: Результат генерации пользователя.
+        """
+        self.file.write(user.model_dump_json() + "\n")
+        self.file.flush()
+        self.count += 1
+        self.unsynced += 1
+
+        if self.unsynced >= self.fsync_every:
+            self.sync()
+
+    def iter_users(self) -> Iterator[SeedUserResult]:
+        """
+        Читает пользователей из чекпоинта по одному.
+
+        :return: Генератор пользователей в порядке записи.
+        """
+        with open(self.path, 'rb') as file:
+            for line in file:
+                yield SeedUserResult.model_validate_json(line)
+
+    def rewrite(self, users: Iterable[SeedUserResult]) -> None:
+        """
+        Переписывает чекпоинт целиком (например, после дополнения пользователей до нового плана).
+
+        Новые строки пишутся во временный файл и атомарно подменяют чекпоинт, поэтому
+        users может лениво читаться из этого же чекпоинта. Если процесс упадёт посередине,
+        старый чекпоинт останется нетронутым.
+
+        :param users: Пользователи, которые должны оказаться в чекпоинте.
+        """
+        temp_path = f"{self.path}.tmp"
+
+        with open(temp_path, 'w', encoding="utf-8") as file:
+            for user in users:
+                file.write(user.model_dump_json() + "\n")
+
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temp_path, self.path)
+        self.count = self.recover()
+
+    def merge(self, other: "SeedsCheckpoint") -> None:
+        """
+        Дописывает в чекпоинт всех пользователей другого чекпоинта (например, шарда) и удаляет его.
+
+        Строки копируются как есть, без валидации. Исходный чекпоинт удаляется только после fsync,
+        поэтому падение во время слияния не теряет пользователей.
+
+        :param other: Чекпоинт, который нужно влить в текущий.
+        """
+        if other.count:
+            with open(self.path, 'ab') as target, open(other.path, 'rb') as source:
+                shutil.copyfileobj(source, target)
+                target.flush()
+                os.fsync(target.fileno())
+
+            self.count += other.count
+
+        other.discard()
+
+    def discard(self) -> None:
+        """
+        Удаляет чекпоинт (например, если он остался от другого плана).
+        """
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+        self.count = 0
+
+    def restore(self, dump_format: SeedsDumpFormat) -> None:
+        """
+        Переносит пользователей из готового дампа в чекпоинт, чтобы дополнить дамп новыми пользователями.
+
+        :param dump_format: Формат существующего дампа.
+        """
+        path = get_seeds_dump_path(self.scenario, dump_format)
+
+        if dump_format == SeedsDumpFormat.JSONL:
+            shutil.copyfile(path, self.path)
+        elif dump_format == SeedsDumpFormat.BINARY:
+            store = SeedsStore(path)
+            with open(self.path, 'wb') as file:
+                for record in store.iter_records():
+                    file.write(record + b"\n")
+            store.close()
+        else:
+            with open(self.path, 'w', encoding="utf-8") as file:
+                for user in load_seeds_result(self.scenario).users:
+                    file.write(user.model_dump_json() + "\n")
+
+        self.count = self.recover()
+
+    def consolidate(self, dump_format: SeedsDumpFormat = SeedsDumpFormat.JSON) -> None:
+        """
+        Сливает чекпоинт в итоговый дамп сценария и удаляет чекпоинт.
+
+        Для JSONL чекпоинт уже имеет формат дампа и просто переименовывается.
+        Для BINARY строки чекпоинта становятся записями хранилища без повторной валидации.
+        Для JSON пользователи переписываются построчно, поэтому в памяти одновременно находится только одна строка.
+        Дамп сначала пишется во временный файл и атомарно подменяется, так что падение во время
+        слияния не портит ни чекпоинт, ни предыдущий дамп.
+
+        :param dump_format: Формат итогового дампа.
+        """
+        path = get_seeds_dump_path(self.scenario, dump_format)
+
+        if dump_format == SeedsDumpFormat.JSONL:
+            os.replace(self.path, path)
+            return
+
+        temp_path = f"{path}.tmp"
+
+        if dump_format == SeedsDumpFormat.BINARY:
+            with open(self.path, 'rb') as source:
+                write_seeds_store(temp_path, (line.rstrip(b"\n") for line in source))
+
+            os.replace(temp_path, path)
+            os.remove(self.path)
+            return
+
+        with (
+            open(self.path, 'r', encoding="utf-8") as source,
+            open(temp_path, 'w', encoding="utf-8") as target
+        ):
+            target.write('{"users":[')
+            for index, line in enumerate(source):
+                if index:
+                    target.write(",")
+                target.write(line.rstrip("\n"))
+            target.write("]}")
+
+            target.flush()
+            os.fsync(target.fileno())
+
+        os.replace(temp_path, path)
+        os.remove(self.path)
+
+
+def iter_seeds_shard_checkpoints(scenario: str) -> Iterator[SeedsCheckpoint]:
+    """
+    Находит чекпоинты шардов, оставшиеся от прерванного шардированного сидинга.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Генератор чекпоинтов шардов.
+    """
+    prefix, suffix = "./dumps/", "_seeds.checkpoint.jsonl"
+    for path in sorted(glob.glob(f"{prefix}{scenario}_shard*{suffix}")):
+        yield SeedsCheckpoint(scenario=path[len(prefix):-len(suffix)])
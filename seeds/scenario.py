@@ -1,9 +1,29 @@
+import multiprocessing
+import os
 from abc import ABC, abstractmethod
 
+from seeds.benchmark import SeedsBenchmark, SeedsBenchmarkReport, save_seeds_benchmark_report
 from seeds.builder import build_grpc_seeds_builder
-from seeds.dumps import save_seeds_result, load_seeds_result
+from seeds.cache import (
+    SeedsDumpMeta,
+    build_seeds_plan_hash,
+    is_seeds_plan_covered,
+    load_seeds_dump_meta,
+    save_seeds_dump_meta
+)
+from seeds.dumps import (
+    save_seeds_result,
+    load_seeds_result,
+    SeedsCheckpoint,
+    SeedsDumpFormat,
+    LazySeedsResult,
+    get_seeds_dump_path,
+    get_seeds_shard_scenario,
+    iter_seeds_shard_checkpoints
+)
 from seeds.schema.plan import SeedsPlan
 from seeds.schema.result import SeedsResult
+from seeds.store import SeedsStore
 
 
 class SeedsScenario(ABC):
@@ -37,23 +57,255 @@ class SeedsScenario(ABC):
         """
         ...
 
+    @property
+    def workers(self) -> int:
+        """
+        Количество параллельных воркеров, которые строят пользователей.
+
+        Воркеры — потоки ThreadPoolExecutor, но при импорте клиентов (через locust) threading пропатчен
+        gevent, поэтому на деле это гринлеты: они перекрывают ожидание ответов шлюза, а не загружают
+        ядра (для этого есть build_sharded). Выигрыш зависит от задержки шлюза, поэтому по умолчанию
+        сидинг последовательный, а сценарии включают воркеры сами, замерив скорость через
+        python -m seeds.cli <scenario> --benchmark.
+        Может быть переопределено в дочерних классах.
+        """
+        return 1
+
+    @property
+    def dump_format(self) -> SeedsDumpFormat:
+        """
+        Формат файла дампа. JSONL позволяет раздавать пользователей без загрузки всего дампа в память,
+        BINARY — дополнительно даёт O(1) доступ к любому пользователю через общий для процессов mmap.
+        Может быть переопределено в дочерних классах.
+        """
+        return SeedsDumpFormat.JSON
+
     def save(self, result: SeedsResult) -> None:
         """
         Сохраняет результат сидинга в файл.
         :param result: Объект SeedsResult, содержащий сгенерированные данные.
         """
-        save_seeds_result(result=result, scenario=self.scenario)
+        save_seeds_result(result=result, scenario=self.scenario, dump_format=self.dump_format)
 
-    def load(self) -> SeedsResult:
+    def load(self, worker_index: int = 0, worker_count: int = 1) -> SeedsResult | LazySeedsResult | SeedsStore:
         """
         Загружает результаты сидинга из файла.
-        :return: Объект SeedsResult, содержащий данные, загруженные из файла.
+
+        Для JSONL-дампа возвращает LazySeedsResult, который читает и валидирует пользователей по одному,
+        для BINARY — SeedsStore поверх mmap.
+        При распределённом запуске Locust каждому воркеру отдаётся только его доля пользователей
+        (см. tools.locust.workers.get_worker_partition), поэтому воркеры не раздают одних и тех же пользователей.
+
+        :param worker_index: Номер воркера Locust.
+        :param worker_count: Общее количество воркеров Locust.
+        :return: Объект с интерфейсом SeedsResult (get_next_user, get_random_user).
+        """
+        if self.dump_format == SeedsDumpFormat.BINARY:
+            store = SeedsStore(get_seeds_dump_path(self.scenario, self.dump_format))
+            return store.partition(worker_index, worker_count)
+
+        if self.dump_format == SeedsDumpFormat.JSONL:
+            return LazySeedsResult(scenario=self.scenario).partition(worker_index, worker_count)
+
+        return load_seeds_result(scenario=self.scenario).partition(worker_index, worker_count)
+
+    @property
+    def gateway(self) -> str:
+        """
+        Адрес шлюза, на котором создаются данные (gRPC target или базовый URL HTTP, в зависимости от билдера).
+        Входит в ключ кеша дампа.
+        """
+        return self.builder.gateway
+
+    def prepare_checkpoint(self) -> SeedsCheckpoint | None:
+        """
+        Сверяет план с кешем дампа и готовит чекпоинт для сидинга.
+
+        - Дамп создан по тому же плану на том же шлюзе и всего хватает — возвращает None (ничего строить не нужно).
+        - Структура плана та же, но выросли количества — переносит готовых пользователей в чекпоинт
+          и дополняет их недостающими счетами, картами и операциями; недостающих пользователей достроит билдер.
+        - План или шлюз изменились — удаляет устаревшие дамп и чекпоинты (в том числе чекпоинты шардов).
+        - Чекпоинт от прерванного запуска с тем же планом сохраняется и продолжается. Чекпоинты шардов
+          прерванного build_sharded вливаются в него после восстановления из дампа, поэтому их пользователи
+          тоже дополняются до плана, а повторный запуск (с любым количеством шардов или без них)
+          достраивает только оставшихся пользователей.
+
+        :return: Чекпоинт, в который нужно дописать недостающих пользователей, или None.
+        """
+        plan_hash = build_seeds_plan_hash(self.plan, self.gateway)
+        meta = load_seeds_dump_meta(self.scenario)
+        checkpoint = SeedsCheckpoint(scenario=self.scenario)
+
+        if meta is None or meta.plan_hash != plan_hash:
+            checkpoint.discard()
+            for shard_checkpoint in iter_seeds_shard_checkpoints(self.scenario):
+                shard_checkpoint.discard()
+            if meta is not None and os.path.exists(get_seeds_dump_path(self.scenario, meta.dump_format)):
+                os.remove(get_seeds_dump_path(self.scenario, meta.dump_format))
+
+            # Все пользователи чекпоинта будут построены по текущему плану, поэтому при продолжении
+            # прерванного запуска дополнять их не нужно
+            plan = self.plan.model_copy(deep=True)
+            plan.users.count = 0
+            meta = SeedsDumpMeta(plan_hash=plan_hash, gateway=self.gateway, dump_format=self.dump_format, plan=plan)
+        elif checkpoint.count == 0 and os.path.exists(get_seeds_dump_path(self.scenario, meta.dump_format)):
+            if meta.dump_format == self.dump_format and is_seeds_plan_covered(
+                    meta.plan.model_dump(), self.plan.model_dump()
+            ):
+                for shard_checkpoint in iter_seeds_shard_checkpoints(self.scenario):
+                    shard_checkpoint.discard()
+                return None
+
+            checkpoint.restore(meta.dump_format)
+
+        for shard_checkpoint in iter_seeds_shard_checkpoints(self.scenario):
+            checkpoint.merge(shard_checkpoint)
+
+        # Дополнение идемпотентно: уже дополненные пользователи (например, до падения) запросов не делают
+        if checkpoint.count and not is_seeds_plan_covered(
+                meta.plan.model_dump(exclude={"users": {"count"}}),
+                self.plan.model_dump(exclude={"users": {"count"}})
+        ):
+            checkpoint.rewrite(
+                self.builder.iter_top_up_users(
+                    plan=self.plan.users,
+                    users=checkpoint.iter_users(),
+                    workers=self.workers
+                )
+            )
+
+        save_seeds_dump_meta(meta, scenario=self.scenario)
+        return checkpoint
+
+    def finish_checkpoint(self, checkpoint: SeedsCheckpoint) -> None:
         """
-        return load_seeds_result(scenario=self.scenario)
+        Сливает чекпоинт в дамп и обновляет метаданные кеша.
+        Если формат дампа сменился, дамп в прежнем формате удаляется после слияния.
+
+        :param checkpoint: Заполненный чекпоинт.
+        """
+        meta = load_seeds_dump_meta(self.scenario)
+        checkpoint.consolidate(dump_format=self.dump_format)
+
+        if meta is not None and meta.dump_format != self.dump_format:
+            previous_path = get_seeds_dump_path(self.scenario, meta.dump_format)
+            if os.path.exists(previous_path):
+                os.remove(previous_path)
+
+        plan = self.plan.model_copy(deep=True)
+        plan.users.count = checkpoint.count
+        save_seeds_dump_meta(
+            SeedsDumpMeta(
+                plan_hash=build_seeds_plan_hash(self.plan, self.gateway),
+                gateway=self.gateway,
+                dump_format=self.dump_format,
+                plan=plan
+            ),
+            scenario=self.scenario
+        )
 
     def build(self) -> None:
         """
         Генерирует данные с помощью билдера, используя план сидинга, и сохраняет результат.
+
+        Если дамп уже создан по этому плану на этом шлюзе, он переиспользуется, а при росте количеств
+        достраивается только разница: пользователи, счета, карты и операции (см. prepare_checkpoint).
+        Каждый готовый пользователь сразу дописывается в чекпоинт. Если предыдущий запуск упал,
+        уже созданные пользователи не пересоздаются — билдер достраивает только оставшихся.
         """
-        result = self.builder.build(self.plan)
-        self.save(result)
+        checkpoint = self.prepare_checkpoint()
+        if checkpoint is None:
+            return
+
+        with checkpoint:
+            users = self.builder.iter_users(
+                plan=self.plan.users,
+                count=max(self.plan.users.count - checkpoint.count, 0),
+                workers=self.workers
+            )
+            for user in users:
+                checkpoint.append(user)
+
+        self.finish_checkpoint(checkpoint)
+
+    def benchmark(self, count: int | None = None) -> SeedsBenchmarkReport:
+        """
+        Измеряет скорость сидинга по плану сценария и сохраняет отчёт в ./reports (см. SeedsBenchmark).
+
+        Пользователи создаются на шлюзе, но в дамп, чекпоинт и кеш сценария не попадают.
+
+        :param count: Сколько пользователей создать (по умолчанию количество из плана).
+        :return: Отчёт бенчмарка.
+        """
+        report = SeedsBenchmark(self.builder).run(
+            scenario=self.scenario,
+            plan=self.plan.users,
+            count=count,
+            workers=self.workers
+        )
+        save_seeds_benchmark_report(report)
+        return report
+
+    def build_sharded(self, shards: int) -> None:
+        """
+        Генерирует данные в нескольких процессах и сливает их в один дамп сценария.
+
+        Недостающие пользователи делятся на shards долей. Каждая доля строится в отдельном процессе
+        (см. build_seeds_shard) со своим gRPC-каналом и пишет собственный чекпоинт, поэтому валидация
+        pydantic-моделей и разбор protobuf загружают все ядра, а не одно. Процессы запускаются через spawn:
+        fork процесса с уже открытыми gRPC-каналами и пропатченным gevent небезопасен. Используются
+        обычные процессы, а не ProcessPoolExecutor: его служебный поток зависает под monkey-патчем gevent,
+        который применяется при импорте locust.
+        После завершения всех процессов чекпоинты шардов вливаются в общий чекпоинт, который сливается в дамп.
+        Шарды, оставшиеся от прерванного запуска, вливаются в общий чекпоинт в prepare_checkpoint, так что
+        повторный запуск (с любым количеством шардов) достраивает только оставшихся пользователей.
+
+        :param shards: Количество процессов.
+        """
+        checkpoint = self.prepare_checkpoint()
+        if checkpoint is None:
+            return
+
+        count = max(self.plan.users.count - checkpoint.count, 0)
+        counts = [count // shards + (1 if shard < count % shards else 0) for shard in range(shards)]
+
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(target=build_seeds_shard, args=(type(self), shard, shard_count))
+            for shard, shard_count in enumerate(counts) if shard_count
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        failed = [process.name for process in processes if process.exitcode != 0]
+        if failed:
+            raise RuntimeError(f"Seeds shards failed: {failed}. Rerun to resume from their checkpoints")
+
+        for shard_checkpoint in iter_seeds_shard_checkpoints(self.scenario):
+            checkpoint.merge(shard_checkpoint)
+
+        self.finish_checkpoint(checkpoint)
+
+
+def build_seeds_shard(scenario_class: type[SeedsScenario], shard: int, count: int) -> None:
+    """
+    Строит одну долю пользователей сценария. Выполняется в отдельном процессе (см. SeedsScenario.build_sharded).
+
+    Сценарий создаётся заново внутри процесса, поэтому у каждого шарда свой билдер и свой gRPC-канал.
+
+    :param scenario_class: Класс сценария сидинга.
+    :param shard: Номер шарда.
+    :param count: Сколько пользователей должен построить шард.
+    """
+    scenario = scenario_class()
+
+    with SeedsCheckpoint(scenario=get_seeds_shard_scenario(scenario.scenario, shard)) as checkpoint:
+        users = scenario.builder.iter_users(
+            plan=scenario.plan.users,
+            count=max(count - checkpoint.count, 0),
+            workers=scenario.workers
+        )
+        for user in users:
+            checkpoint.append(user)
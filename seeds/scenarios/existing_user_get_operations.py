@@ -28,6 +28,14 @@ class ExistingUserGetOperationsSeedsScenario(SeedsScenario):
             ),
         )
 
+    @property
+    def workers(self) -> int:
+        """
+        Каждому пользователю создаются счёт и семь операций, поэтому пользователи строятся в 10 гринлетах
+        (см. SeedsScenario.workers).
+        """
+        return 10
+
     @property
     def scenario(self) -> str:
         """
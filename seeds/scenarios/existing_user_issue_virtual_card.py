@@ -20,6 +20,13 @@ class ExistingUserIssueVirtualCardSeedsScenario(SeedsScenario):
             ),
         )
 
+    @property
+    def workers(self) -> int:
+        """
+        Пользователи строятся в 10 гринлетах (см. SeedsScenario.workers).
+        """
+        return 10
+
     @property
     def scenario(self) -> str:
         """
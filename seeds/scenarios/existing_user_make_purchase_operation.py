@@ -25,6 +25,13 @@ class ExistingUserMakePurchaseOperationSeedsScenario(SeedsScenario):
             ),
         )
 
+    @property
+    def workers(self) -> int:
+        """
+        Счёт и карта каждого пользователя создаются в одном из 10 гринлетов (см. SeedsScenario.workers).
+        """
+        return 10
+
     @property
     def scenario(self) -> str:
         """
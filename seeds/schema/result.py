@@ -1,6 +1,6 @@
 import random
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class SeedCardResult(BaseModel):
@@ -73,17 +73,46 @@ class SeedsResult(BaseModel):
 
     users: list[SeedUserResult] = Field(default_factory=list)
 
+    # Позиция следующего пользователя для get_next_user: раздача за O(1) без сдвига списка
+    _cursor: int = PrivateAttr(default=0)
+
+    def partition(self, worker_index: int, worker_count: int) -> "SeedsResult":
+        """
+        Возвращает детерминированную долю пользователей для одного воркера Locust.
+
+        Пользователи делятся по остатку от деления номера на worker_count, поэтому доли
+        разных воркеров не пересекаются, а в сумме покрывают весь список. Вместе с get_next_user
+        это гарантирует, что каждый пользователь достаётся ровно одному виртуальному юзеру в кластере.
+
+        Args:
+            worker_index: Номер воркера (0 <= worker_index < worker_count)
+            worker_count: Общее количество воркеров
+
+        Returns:
+            SeedsResult: Новый результат только с пользователями этого воркера.
+        """
+        return SeedsResult(users=self.users[worker_index::worker_count])
+
     def get_next_user(self) -> SeedUserResult:
         """
-        Возвращает и удаляет первого пользователя из списка.
+        Возвращает следующего ещё не выданного пользователя.
 
         Используется в случае, когда на каждый виртуальный юзер нужен новый тестовый пользователь.
         Удобно при строго последовательной раздаче пользователей в тестовых сценариях.
+        Работает за O(1): вместо удаления из начала списка сдвигается курсор.
 
         Returns:
             SeedUserResult: Следующий пользователь из списка.
+
+        Raises:
+            IndexError: Если все пользователи уже выданы.
         """
-        return self.users.pop(0)
+        if self._cursor >= len(self.users):
+            raise IndexError("No more seeded users left")
+
+        user = self.users[self._cursor]
+        self._cursor += 1
+        return user
 
     def get_random_user(self) -> SeedUserResult:
         """
@@ -94,4 +123,4 @@ class SeedsResult(BaseModel):
         Returns:
             SeedUserResult: Случайный пользователь.
         """
-        return random.choice(self.users)
\ No newline at end of file
+        return random.choice(self.users)
@@ -0,0 +1,172 @@
+import mmap
+import random
+import struct
+import sys
+from array import array
+from typing import Iterable, Iterator
+
+from seeds.schema.result import SeedUserResult
+
+# Сигнатура и формат "подвала" файла: смещение индекса, количество пользователей, сигнатура
+SEEDS_STORE_MAGIC = b"SEEDS001"
+SEEDS_STORE_FOOTER = struct.Struct("<QQ8s")
+
+
+def write_seeds_store(path: str, records: Iterable[bytes]) -> int:
+    """
+    Записывает бинарное хранилище сидов с индексом смещений.
+
+    Структура файла:
+    - записи пользователей (JSON SeedUserResult) подряд, без разделителей;
+    - индекс: count + 1 смещений uint64 little-endian (начало каждой записи и конец последней), выровненный по 8 байт;
+    - подвал: смещение индекса, количество пользователей и сигнатура SEEDS001.
+
+    Индекс пишется в конце, поэтому файл формируется за один проход по потоку записей,
+    а в памяти держатся только смещения (8 байт на пользователя).
+
+    :param path: Путь к файлу хранилища.
+    :param records: Поток записей — JSON одного SeedUserResult в байтах.
+    :return: Количество записанных пользователей.
+    """
+    offsets = array('Q', [0])
+
+    with open(path, 'wb') as file:
+        for record in records:
+            file.write(record)
+            offsets.append(offsets[-1] + len(record))
+
+        padding = -offsets[-1] % 8
+        file.write(b"\0" * padding)
+        index_offset = offsets[-1] + padding
+
+        if sys.byteorder == "big":
+            offsets.byteswap()
+        file.write(offsets.tobytes())
+        file.write(SEEDS_STORE_FOOTER.pack(index_offset, len(offsets) - 1, SEEDS_STORE_MAGIC))
+
+    return len(offsets) - 1
+
+
+class SeedsStore:
+    """
+    Бинарное хранилище сидов, открываемое через mmap.
+
+    Все воркеры Locust на одном хосте отображают один и тот же файл в память и делят page cache,
+    поэтому пользователи не дублируются в памяти каждого процесса. Индекс смещений читается
+    прямо из отображения без копирования, а получение пользователя — это один срез и один
+    model_validate_json для конкретной записи: O(1) независимо от размера дампа.
+
+    Предоставляет тот же интерфейс раздачи пользователей, что и SeedsResult.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: Путь к файлу хранилища, созданному write_seeds_store.
+        """
+        self.path = path
+        self.file = open(path, 'rb')
+        self.mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        index_offset, self.count, magic = SEEDS_STORE_FOOTER.unpack_from(
+            self.mmap, len(self.mmap) - SEEDS_STORE_FOOTER.size
+        )
+        if magic != SEEDS_STORE_MAGIC:
+            raise ValueError(f"File {path} is not a seeds store")
+
+        index_size = (self.count + 1) * 8
+        self.index = memoryview(self.mmap)[index_offset:index_offset + index_size]
+        if sys.byteorder == "little":
+            self.offsets = self.index.cast('Q')
+        else:
+            # Индекс хранится в little-endian: на big-endian платформе он копируется с перестановкой байт
+            self.offsets = array('Q')
+            self.offsets.frombytes(self.index)
+            self.offsets.byteswap()
+        self.cursor = 0
+
+        # Доля воркера: номера пользователей start, start + step, start + 2 * step, ...
+        self.start = 0
+        self.step = 1
+
+    def __len__(self) -> int:
+        return len(range(self.start, self.count, self.step))
+
+    def __iter__(self) -> Iterator[SeedUserResult]:
+        return (self.get_user(index) for index in range(self.start, self.count, self.step))
+
+    def iter_records(self) -> Iterator[bytes]:
+        """
+        Отдаёт сырые записи (JSON SeedUserResult в байтах) всех пользователей без декодирования.
+
+        :return: Генератор записей в порядке хранения.
+        """
+        for index in range(self.count):
+            yield self.mmap[self.offsets[index]:self.offsets[index + 1]]
+
+    def partition(self, worker_index: int, worker_count: int) -> "SeedsStore":
+        """
+        Ограничивает раздачу детерминированной долей пользователей одного воркера Locust.
+
+        Файл не копируется: меняется только шаг, с которым get_next_user и get_random_user
+        выбирают номера записей.
+
+        :param worker_index: Номер воркера (0 <= worker_index < worker_count).
+        :param worker_count: Общее количество воркеров.
+        :return: Это же хранилище, ограниченное долей воркера.
+        """
+        self.start, self.step, self.cursor = worker_index, worker_count, 0
+        return self
+
+    def get_user(self, index: int) -> SeedUserResult:
+        """
+        Возвращает пользователя по его порядковому номеру в хранилище.
+
+        :param index: Номер пользователя (0 <= index < len(store)).
+        :return: SeedUserResult, декодированный из соответствующей записи.
+        """
+        if not 0 <= index < self.count:
+            raise IndexError(f"Seeded user index {index} out of range")
+
+        return SeedUserResult.model_validate_json(self.mmap[self.offsets[index]:self.offsets[index + 1]])
+
+    def get_next_user(self) -> SeedUserResult:
+        """
+        Возвращает следующего пользователя по порядку.
+
+        Returns:
+            SeedUserResult: Следующий пользователь.
+
+        Raises:
+            IndexError: Если пользователи в хранилище закончились.
+        """
+        index = self.start + self.cursor * self.step
+        if index >= self.count:
+            raise IndexError("No more seeded users left in store")
+
+        self.cursor += 1
+        return self.get_user(index)
+
+    def get_random_user(self) -> SeedUserResult:
+        """
+        Возвращает случайного пользователя без удаления.
+
+        Returns:
+            SeedUserResult: Случайный пользователь.
+
+        Raises:
+            IndexError: Если в хранилище (или в доле воркера) нет пользователей.
+        """
+        if self.start >= self.count:
+            raise IndexError("No seeded users in store")
+
+        return self.get_user(random.randrange(self.start, self.count, self.step))
+
+    def close(self) -> None:
+        """
+        Освобождает отображение и закрывает файл.
+        """
+        if isinstance(self.offsets, memoryview):
+            self.offsets.release()
+        self.index.release()
+        self.mmap.close()
+        self.file.close()
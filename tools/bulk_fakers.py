@@ -0,0 +1,172 @@
+from typing import Any, Iterator
+
+import numpy as np
+from faker import Faker
+from faker.providers.python import TEnum
+from google.protobuf.internal.enum_type_wrapper import EnumTypeWrapper
+
+from tools.fakers import CATEGORIES, FakePool, build_fake_pool
+
+
+class BulkFake:
+    """
+    Пакетный генератор тестовых данных на NumPy.
+
+    В отличие от Fake, который возвращает одно значение за вызов, каждый метод возвращает
+    столбец (numpy.ndarray) из size значений за один векторизованный вызов. Генератор создаётся
+    с фиксированным seed, поэтому одинаковый seed даёт одинаковые данные.
+
+    Числа, категории и перечисления генерируются NumPy напрямую. Имена, телефоны и email
+    выбираются из словаря FakePool: если он не передан, словарь генерируется Faker с тем же seed.
+    """
+
+    def __init__(self, seed: int = 0, pool: FakePool | None = None, pool_size: int = 1_000):
+        """
+        :param seed: Seed генератора NumPy (и Faker, если словарь строится здесь).
+        :param pool: Словарь значений для имён, телефонов и email.
+        :param pool_size: Размер словаря, если он строится здесь.
+        """
+        self.seed = seed
+        self.generator = np.random.default_rng(seed)
+        self.pool = pool
+        self.pool_size = pool_size
+        # Префикс и счётчик делают email уникальными (как в Fake.email); префикс зависит только от seed
+        self.email_prefix = f"{seed:016x}"[:12]
+        self.email_counter = 0
+
+    def get_pool(self) -> FakePool:
+        """
+        :return: Словарь значений (создаётся при первом обращении, если не передан).
+        """
+        if self.pool is None:
+            faker = Faker()
+            faker.seed_instance(self.seed)
+            self.pool = build_fake_pool(faker, self.pool_size)
+
+        return self.pool
+
+    def choice(self, values: list | tuple, size: int) -> np.ndarray:
+        """
+        Выбирает size случайных значений из списка.
+
+        :param values: Список значений.
+        :param size: Количество значений.
+        :return: Столбец значений.
+        """
+        return np.asarray(values)[self.generator.integers(0, len(values), size)]
+
+    def amounts(self, size: int) -> np.ndarray:
+        """
+        Генерирует денежные суммы от 1 до 1000 с двумя знаками после запятой.
+
+        :param size: Количество значений.
+        :return: Столбец float64.
+        """
+        return self.generator.integers(100, 100_000, size, endpoint=True) / 100
+
+    def categories(self, size: int) -> np.ndarray:
+        """
+        Генерирует категории покупок (см. CATEGORIES).
+
+        :param size: Количество значений.
+        :return: Столбец строк.
+        """
+        return self.choice(CATEGORIES, size)
+
+    def proto_enums(self, value: EnumTypeWrapper, size: int) -> np.ndarray:
+        """
+        Генерирует значения proto enum-типа.
+
+        :param value: Proto enum-класс.
+        :param size: Количество значений.
+        :return: Столбец int32.
+        """
+        return self.choice(np.asarray(value.values(), dtype=np.int32), size)
+
+    def enums(self, value: type[TEnum], size: int) -> np.ndarray:
+        """
+        Генерирует значения enum-типа.
+
+        :param value: Enum-класс.
+        :param size: Количество значений.
+        :return: Столбец элементов перечисления (dtype=object).
+        """
+        return self.choice(np.asarray(list(value), dtype=object), size)
+
+    def last_names(self, size: int) -> np.ndarray:
+        """
+        :param size: Количество значений.
+        :return: Столбец фамилий.
+        """
+        return self.choice(self.get_pool().last_names, size)
+
+    def first_names(self, size: int) -> np.ndarray:
+        """
+        :param size: Количество значений.
+        :return: Столбец имён (используются и для отчеств).
+        """
+        return self.choice(self.get_pool().first_names, size)
+
+    def phone_numbers(self, size: int) -> np.ndarray:
+        """
+        :param size: Количество значений.
+        :return: Столбец номеров телефонов.
+        """
+        return self.choice(self.get_pool().phone_numbers, size)
+
+    def emails(self, size: int) -> np.ndarray:
+        """
+        Генерирует уникальные email: префикс генератора и сквозной номер перед адресом из словаря.
+
+        :param size: Количество значений.
+        :return: Столбец email.
+        """
+        numbers = np.arange(self.email_counter, self.email_counter + size).astype(str)
+        self.email_counter += size
+
+        unique = np.char.add(np.char.add(self.email_prefix, numbers), ".")
+        return np.char.add(unique, self.choice(self.get_pool().emails, size))
+
+    def users(self, size: int) -> dict[str, np.ndarray]:
+        """
+        Генерирует данные для создания пользователей.
+
+        :param size: Количество пользователей.
+        :return: Столбцы с ключами полей CreateUserRequest.
+        """
+        return {
+            "email": self.emails(size),
+            "last_name": self.last_names(size),
+            "first_name": self.first_names(size),
+            "middle_name": self.first_names(size),
+            "phone_number": self.phone_numbers(size),
+        }
+
+    def operations(self, status: EnumTypeWrapper, size: int, category: bool = False) -> dict[str, np.ndarray]:
+        """
+        Генерирует данные для создания операций (без card_id/account_id).
+
+        :param status: Proto enum статуса операции (например, OperationStatus).
+        :param size: Количество операций.
+        :param category: Добавить ли категорию (для операций покупки).
+        :return: Столбцы с ключами полей Make*OperationRequest.
+        """
+        columns = {"amount": self.amounts(size), "status": self.proto_enums(status, size)}
+        if category:
+            columns["category"] = self.categories(size)
+
+        return columns
+
+
+def iter_rows(columns: dict[str, np.ndarray]) -> Iterator[dict[str, Any]]:
+    """
+    Превращает столбцы BulkFake в строки со значениями Python (str, float, int).
+
+    Подходит для заполнения protobuf-сообщений и pydantic-схем: Make*OperationRequest(**row).
+
+    :param columns: Столбцы одинаковой длины.
+    :return: Итератор словарей поле -> значение.
+    """
+    names = list(columns)
+    for values in zip(*(column.tolist() for column in columns.values())):
+        yield dict(zip(names, values))
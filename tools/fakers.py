@@ -1,13 +1,161 @@
-import time
+import hashlib
+import os
+import random
+import uuid
+from contextvars import ContextVar
+from itertools import count
+from pathlib import Path
 
 from faker import Faker
 from faker.providers.python import TEnum
 from google.protobuf.internal.enum_type_wrapper import EnumTypeWrapper
+from pydantic import BaseModel
+
+# Категории покупок (см. Fake.category)
+CATEGORIES = (
+    "gas",
+    "taxi",
+    "tolls",
+    "water",
+    "beauty",
+    "mobile",
+    "travel",
+    "parking",
+    "catalog",
+    "internet",
+    "satellite",
+    "education",
+    "government",
+    "healthcare",
+    "restaurants",
+    "electricity",
+    "supermarkets",
+)
+
+
+class FakePool(BaseModel):
+    """
+    Заранее сгенерированные значения для пулового режима Fake.
+
+    Attributes:
+        emails (list[str]): Email-адреса (уникальность обеспечивает Fake.email, а не пул).
+        last_names (list[str]): Фамилии.
+        first_names (list[str]): Имена (используются и для отчеств).
+        phone_numbers (list[str]): Номера телефонов.
+        amounts (list[float]): Денежные суммы от 1 до 1000.
+    """
+    emails: list[str]
+    last_names: list[str]
+    first_names: list[str]
+    phone_numbers: list[str]
+    amounts: list[float]
+
+
+def build_fake_pool(faker: Faker, size: int = 10_000) -> FakePool:
+    """
+    Генерирует пул значений с помощью Faker.
+
+    :param faker: Экземпляр Faker.
+    :param size: Количество значений каждого вида.
+    :return: Пул значений.
+    """
+    return FakePool(
+        emails=[faker.email() for _ in range(size)],
+        last_names=[faker.last_name() for _ in range(size)],
+        first_names=[faker.first_name() for _ in range(size)],
+        phone_numbers=[faker.phone_number() for _ in range(size)],
+        amounts=[faker.pyfloat(min_value=1, max_value=1000, right_digits=2) for _ in range(size)],
+    )
+
+
+def save_fake_pool(pool: FakePool, path: Path) -> None:
+    """
+    Сохраняет пул значений в JSON-файл, чтобы не генерировать его при каждом запуске.
+
+    :param pool: Пул значений.
+    :param path: Путь к файлу.
+    """
+    path.write_text(pool.model_dump_json())
+
+
+def load_fake_pool(path: Path) -> FakePool:
+    """
+    Загружает пул значений из JSON-файла (см. save_fake_pool).
+
+    :param path: Путь к файлу.
+    :return: Пул значений.
+    """
+    return FakePool.model_validate_json(path.read_bytes())
+
+
+class FakeStream:
+    """
+    Источник случайности Fake: генератор, префикс и счётчик уникальных email.
+
+    Поток, созданный с seed (см. build_fake_stream), детерминирован: одинаковая последовательность
+    вызовов Fake даёт одинаковые значения при каждом запуске. Создание потока дёшево
+    (один random.Random), поэтому его можно держать на каждого виртуального пользователя.
+    """
+
+    def __init__(self, seed: int | None = None):
+        """
+        :param seed: Seed потока или None для случайного потока процесса.
+        """
+        self.random = random.Random(seed)
+        # Префикс и счётчик делают email уникальными без обращения к часам
+        self.email_prefix = uuid.uuid4().hex[:12] if seed is None else f"{seed:016x}"[:12]
+        self.email_counter = count()
+        self.seeded = seed is not None
+
+
+# Поток текущего контекста (для Locust — текущего гринлета виртуального пользователя)
+current_fake_stream: ContextVar[FakeStream | None] = ContextVar("current_fake_stream", default=None)
+
+
+def build_fake_seed(run_id: str, worker_index: int, user_index: int) -> int:
+    """
+    Вычисляет seed из ключа (run_id, worker_index, user_index).
+
+    :param run_id: Идентификатор запуска: одинаковый run_id воспроизводит те же данные.
+    :param worker_index: Номер воркера Locust.
+    :param user_index: Номер виртуального пользователя на воркере.
+    :return: 64-битный seed.
+    """
+    digest = hashlib.blake2b(f"{run_id}:{worker_index}:{user_index}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def build_fake_stream(run_id: str, worker_index: int, user_index: int) -> FakeStream:
+    """
+    Создаёт детерминированный поток для виртуального пользователя.
+
+    :param run_id: Идентификатор запуска: одинаковый run_id воспроизводит те же данные.
+    :param worker_index: Номер воркера Locust.
+    :param user_index: Номер виртуального пользователя на воркере.
+    :return: Поток с seed, вычисленным из ключа (run_id, worker_index, user_index).
+    """
+    return FakeStream(build_fake_seed(run_id, worker_index, user_index))
+
+
+def use_fake_stream(stream: FakeStream | None) -> None:
+    """
+    Делает поток текущим для контекста: все вызовы fake.* в нём берут случайность из потока.
+
+    :param stream: Поток или None, чтобы вернуться к потоку процесса.
+    """
+    current_fake_stream.set(stream)
 
 
 class Fake:
     """
     Класс для генерации случайных тестовых данных с использованием библиотеки Faker.
+
+    В пуловом режиме (use_pool) значения не генерируются Faker на каждый вызов,
+    а выбираются случайным индексом из заранее подготовленного FakePool.
+    Режим переключается на существующем экземпляре, поэтому действует и на схемы,
+    которые связали методы (например, default_factory=fake.email) при импорте.
+
+    Случайность берётся из текущего FakeStream (use_fake_stream), а если он не задан — из потока процесса.
     """
 
     def __init__(self, faker: Faker):
@@ -15,6 +163,49 @@ class Fake:
         :param faker: Экземпляр класса Faker, который будет использоваться для генерации данных.
         """
         self.faker = faker
+        self.pool: FakePool | None = None
+        self.stream = FakeStream()
+        # Отдельный Faker со своим генератором: перед каждым вызовом из seeded-потока он пересеивается
+        self.stream_faker = Faker()
+        self.stream_faker.seed_instance(0)
+
+    def reseed(self) -> None:
+        """
+        Пересоздаёт поток процесса (генератор выбора из пула, префикс и счётчик уникальных email).
+        Вызывается в дочернем процессе после fork (например, locust --processes).
+        """
+        self.stream = FakeStream()
+
+    def get_stream(self) -> FakeStream:
+        """
+        :return: Поток текущего контекста или поток процесса.
+        """
+        return current_fake_stream.get() or self.stream
+
+    def generate(self, provider: str, *args, **kwargs):
+        """
+        Вызывает провайдер Faker с учётом текущего потока.
+
+        Для seeded-потока Faker пересеивается числом из потока, поэтому результат зависит
+        только от потока и не зависит от вызовов в других гринлетах.
+
+        :param provider: Имя метода Faker (например, "last_name").
+        :return: Сгенерированное значение.
+        """
+        stream = current_fake_stream.get()
+        if stream is None or not stream.seeded:
+            return getattr(self.faker, provider)(*args, **kwargs)
+
+        self.stream_faker.seed_instance(stream.random.getrandbits(64))
+        return getattr(self.stream_faker, provider)(*args, **kwargs)
+
+    def use_pool(self, pool: FakePool | None) -> None:
+        """
+        Включает пуловый режим с указанным пулом значений или выключает его (None).
+
+        :param pool: Пул значений или None.
+        """
+        self.pool = pool
 
     def enum(self, value: type[TEnum]) -> TEnum:
         """
@@ -23,16 +214,21 @@ class Fake:
         :param value: Enum-класс для генерации значения.
         :return: Случайное значение из перечисления.
         """
-        return self.faker.enum(value)
+        if self.pool:
+            return self.get_stream().random.choice(list(value))
+
+        return self.generate("enum", value)
 
     def email(self) -> str:
         """
-        Генерирует случайный email.
+        Генерирует случайный уникальный email.
 
-        Если не указан, будет использован случайный домен.
+        Уникальность обеспечивает префикс процесса и номер вызова перед адресом.
         :return: Случайный email.
         """
-        return f"{time.time()}.{self.faker.email()}"
+        stream = self.get_stream()
+        email = stream.random.choice(self.pool.emails) if self.pool else self.generate("email")
+        return f"{stream.email_prefix}{next(stream.email_counter)}.{email}"
 
     def category(self) -> str:
         """
@@ -43,25 +239,10 @@ class Fake:
 
         :return: Случайная категория (например, 'gas', 'taxi', 'supermarkets' и т.д.).
         """
-        return self.faker.random_element([
-            "gas",
-            "taxi",
-            "tolls",
-            "water",
-            "beauty",
-            "mobile",
-            "travel",
-            "parking",
-            "catalog",
-            "internet",
-            "satellite",
-            "education",
-            "government",
-            "healthcare",
-            "restaurants",
-            "electricity",
-            "supermarkets",
-        ])
+        if self.pool:
+            return self.get_stream().random.choice(CATEGORIES)
+
+        return self.generate("random_element", CATEGORIES)
 
     def last_name(self) -> str:
         """
@@ -69,7 +250,10 @@ class Fake:
 
         :return: Случайная фамилия.
         """
-        return self.faker.last_name()
+        if self.pool:
+            return self.get_stream().random.choice(self.pool.last_names)
+
+        return self.generate("last_name")
 
     def first_name(self) -> str:
         """
@@ -77,7 +261,10 @@ class Fake:
 
         :return: Случайное имя.
         """
-        return self.faker.first_name()
+        if self.pool:
+            return self.get_stream().random.choice(self.pool.first_names)
+
+        return self.generate("first_name")
 
     def middle_name(self) -> str:
         """
@@ -85,7 +272,10 @@ class Fake:
 
         :return: Случайное отчество.
         """
-        return self.faker.first_name()
+        if self.pool:
+            return self.get_stream().random.choice(self.pool.first_names)
+
+        return self.generate("first_name")
 
     def phone_number(self) -> str:
         """
@@ -93,7 +283,10 @@ class Fake:
 
         :return: Случайный номер телефона.
         """
-        return self.faker.phone_number()
+        if self.pool:
+            return self.get_stream().random.choice(self.pool.phone_numbers)
+
+        return self.generate("phone_number")
 
     def float(self, start: int = 1, end: int = 100) -> float:
         """
@@ -103,7 +296,7 @@ class Fake:
         :param end: Конец диапазона (включительно).
         :return: Случайное число с плавающей запятой.
         """
-        return self.faker.pyfloat(min_value=start, max_value=end, right_digits=2)
+        return self.generate("pyfloat", min_value=start, max_value=end, right_digits=2)
 
     def amount(self) -> float:
         """
@@ -111,6 +304,9 @@ class Fake:
 
         :return: Сумма от 1 до 1000.
         """
+        if self.pool:
+            return self.get_stream().random.choice(self.pool.amounts)
+
         return self.float(1, 1000)
 
     def proto_enum(self, value: EnumTypeWrapper) -> int:
@@ -120,7 +316,13 @@ class Fake:
         :param value: Proto enum-класс для генерации значения.
         :return: Случайное значение из перечисления.
         """
-        return self.faker.random_element(value.values())
+        if self.pool:
+            return self.get_stream().random.choice(value.values())
+
+        return self.generate("random_element", value.values())
 
 # Создаем экземпляр класса Fake с использованием Faker
 fake = Fake(faker=Faker())
+
+# После fork дочерний процесс получает собственный префикс email и состояние генератора
+os.register_at_fork(after_in_child=fake.reseed)
@@ -0,0 +1,123 @@
+import logging
+import time
+
+import gevent
+from gevent.pool import Pool
+from locust import constant, task
+from locust.exception import InterruptTaskSet, RescheduleTask, RescheduleTaskImmediately, StopTest, StopUser
+
+from tools.fakers import FakeStream, use_fake_stream
+from tools.locust.options import get_arrival_rate_options
+from tools.locust.schedule import current_intended_start, current_start_lag
+from tools.locust.stats import log_locust_stat
+from tools.locust.user import LocustBaseUser
+
+# Тип и имя строки статистики с опозданием старта итерации относительно расписания
+ARRIVAL_LAG_REQUEST_TYPE = "SCHEDULE"
+ARRIVAL_LAG_NAME = "start lag"
+
+
+class LocustArrivalRateUser(LocustBaseUser):
+    """
+    Виртуальный пользователь открытой модели нагрузки (constant arrival rate).
+
+    Вместо цикла «задача — ожидание — задача» пользователь работает как планировщик: запускает итерации
+    сценария (метод iteration) по расписанию start + n / rate в отдельных гринлетах, не дожидаясь ответов.
+    Когда шлюз замедляется, подаваемая нагрузка не падает, а растёт число одновременных итераций.
+
+    Одновременно выполняется не больше --arrival-max-in-flight итераций. Если лимит исчерпан, следующая
+    итерация ждёт свободного места и стартует позже расписания. Опоздание каждого старта относительно
+    расписания пишется в строку статистики "SCHEDULE start lag", а запланированное время доступно
+    клиентам через get_intended_start() и get_intended_send_time() (см. tools.locust.schedule).
+
+    Частота задаётся на одного пользователя (--arrival-rate или атрибут класса arrival_rate),
+    общая частота равна rate * количество пользователей. Для 5000 итераций в секунду на 10 воркерах
+    достаточно, например, -u 10 и --arrival-rate 500.
+
+    С --fake-run-id каждая итерация получает собственный детерминированный поток fake-данных,
+    выведенный из потока пользователя в порядке расписания, поэтому данные воспроизводятся
+    независимо от того, как перемежаются одновременные итерации.
+
+    Итерация может управлять пользователем исключениями Locust, как обычная задача: StopUser и StopTest
+    останавливают пользователя, RescheduleTask и InterruptTaskSet досрочно завершают только текущую итерацию.
+    """
+    abstract = True
+    wait_time = constant(0)
+
+    # Переопределяют --arrival-rate и --arrival-max-in-flight для конкретного сценария
+    arrival_rate: float | None = None
+    max_in_flight: int | None = None
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        self.iterations: Pool | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Требует iteration у неабстрактных наследников.
+
+        Метакласс User не совместим с ABCMeta, поэтому abc.abstractmethod здесь не работает:
+        проверка выполняется при объявлении класса, как и для абстрактных методов.
+        """
+        super().__init_subclass__(**kwargs)
+        if not cls.abstract and cls.iteration is LocustArrivalRateUser.iteration:
+            raise TypeError(f"{cls.__name__} must implement iteration() or set abstract = True")
+
+    def iteration(self) -> None:
+        """
+        Одна итерация сценария. Обязательна для неабстрактных наследников (см. __init_subclass__).
+        """
+        raise NotImplementedError
+
+    def on_stop(self) -> None:
+        if self.iterations is not None:
+            self.iterations.kill(block=False)
+
+    @task
+    def schedule(self) -> None:
+        """
+        Запускает итерации по расписанию, пока пользователь не будет остановлен.
+        """
+        options = get_arrival_rate_options(self.environment)
+        interval = 1 / (self.arrival_rate or options.rate)
+        self.iterations = Pool(size=self.max_in_flight or options.max_in_flight)
+
+        start = time.perf_counter()
+        number = 0
+        while True:
+            intended_start = start + number * interval
+            delay = intended_start - time.perf_counter()
+            if delay > 0:
+                gevent.sleep(delay)
+
+            fake_stream = FakeStream(self.fake_stream.random.getrandbits(64)) if self.fake_stream else None
+            # Блокируется, пока число выполняющихся итераций не опустится ниже лимита
+            self.iterations.spawn(self.run_iteration, intended_start, fake_stream)
+            number += 1
+
+    def run_iteration(self, intended_start: float, fake_stream: FakeStream | None) -> None:
+        """
+        Выполняет итерацию в собственном гринлете и записывает опоздание её старта.
+
+        :param intended_start: Запланированное время старта (time.perf_counter).
+        :param fake_stream: Поток fake-данных итерации или None.
+        """
+        start_lag = time.perf_counter() - intended_start
+        current_intended_start.set(intended_start)
+        current_start_lag.set(start_lag)
+        use_fake_stream(fake_stream)
+
+        log_locust_stat(self.environment, ARRIVAL_LAG_REQUEST_TYPE, ARRIVAL_LAG_NAME, start_lag * 1000)
+
+        try:
+            self.iteration()
+        except (RescheduleTask, RescheduleTaskImmediately, InterruptTaskSet):
+            # Итерация завершается досрочно, расписание следующих итераций не меняется
+            pass
+        except (StopUser, StopTest) as error:
+            # Итерация выполняется в своём гринлете: исключение передаётся гринлету пользователя,
+            # и Locust останавливает пользователя так же, как при исключении из задачи
+            self._greenlet.kill(error, block=False)
+        except Exception as error:
+            logging.getLogger(__name__).error("Arrival-rate iteration failed: %s", error)
+            self.environment.events.user_error.fire(user_instance=self, exception=error, tb=error.__traceback__)
@@ -0,0 +1,502 @@
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from weakref import WeakKeyDictionary
+
+from hdrh.histogram import HdrHistogram
+from locust import events
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner
+from pydantic import BaseModel
+
+from tools.locust.arrival import LocustArrivalRateUser
+from tools.locust.stats import LOCUST_STATS_MAX_ENTRIES, LOCUST_STATS_OVERFLOW_NAME
+
+# Диапазон и точность гистограмм задержек: от 1 мкс до 100 с (таймаут клиентов), 3 значащие цифры
+LATENCY_LOWEST_US = 1
+LATENCY_HIGHEST_US = 100_000_000
+LATENCY_SIGNIFICANT_FIGURES = 3
+# Ключ данных отчёта воркера (events.report_to_master), в котором мастеру передаются гистограммы
+LATENCY_REPORT_KEY = "latency_histograms"
+
+
+def build_latency_histogram() -> HdrHistogram:
+    """
+    :return: Пустая HDR-гистограмма задержек в микросекундах.
+    """
+    return HdrHistogram(LATENCY_LOWEST_US, LATENCY_HIGHEST_US, LATENCY_SIGNIFICANT_FIGURES)
+
+
+class RouteLatency:
+    """
+    Задержки одного маршрута: исходные (raw) и скорректированные на coordinated omission (corrected).
+
+    Raw — время от фактической отправки запроса до ответа, как в статистике Locust.
+    Corrected считается одним из двух способов:
+    - в открытой модели (известно запланированное время отправки, см. tools.locust.arrival) — время
+      от запланированной отправки до ответа, то есть вместе с ожиданием, которое вызвал медленный шлюз;
+    - в закрытой модели с заданным ожидаемым интервалом между запросами (--latency-expected-interval) —
+      raw с досчитанными значениями: если запрос длился дольше интервала, добавляются замеры value - interval,
+      value - 2 * interval, ... — те запросы, которые клиент не отправил, пока ждал
+      (HdrHistogram.record_corrected_value).
+    Без интервала в закрытой модели corrected совпадает с raw: ожидаемый темп запросов клиенту неизвестен,
+    а интервал, выведенный из самих задержек, исказил бы перцентили.
+    """
+
+    def __init__(self, request_type: str, name: str):
+        """
+        :param request_type: Тип запроса (колонка Type в Locust), например "HTTP" или "gRPC".
+        :param name: Имя строки статистики (маршрут).
+        """
+        self.request_type = request_type
+        self.name = name
+        self.raw = build_latency_histogram()
+        self.corrected = build_latency_histogram()
+
+    def record(self, raw_us: int, intended_us: int | None, expected_interval_us: int) -> None:
+        """
+        Записывает замер.
+
+        :param raw_us: Время от фактической отправки до ответа, мкс.
+        :param intended_us: Время от запланированной отправки до ответа, мкс (None вне открытой модели).
+        :param expected_interval_us: Ожидаемый интервал между запросами для закрытой модели, мкс
+                                     (0 — без коррекции).
+        """
+        raw_us = min(max(raw_us, LATENCY_LOWEST_US), LATENCY_HIGHEST_US)
+        self.raw.record_value(raw_us)
+
+        if intended_us is not None:
+            self.corrected.record_value(min(max(intended_us, raw_us), LATENCY_HIGHEST_US))
+        elif expected_interval_us:
+            self.corrected.record_corrected_value(raw_us, expected_interval_us)
+        else:
+            self.corrected.record_value(raw_us)
+
+    def flush(self) -> tuple[bytes, bytes]:
+        """
+        Кодирует накопленные гистограммы и очищает их.
+
+        :return: Сжатые raw и corrected гистограммы (HdrHistogram.encode, base64).
+        """
+        encoded = self.raw.encode(), self.corrected.encode()
+        self.raw.reset()
+        self.corrected.reset()
+
+        return encoded
+
+    def merge(self, raw: HdrHistogram, corrected: HdrHistogram) -> None:
+        """
+        Добавляет замеры других гистограмм (например, присланных воркером) без потери точности.
+
+        :param raw: Raw-гистограмма.
+        :param corrected: Corrected-гистограмма.
+        """
+        self.raw.add(raw)
+        self.corrected.add(corrected)
+
+
+class LatencyRecorder:
+    """
+    Гистограммы задержек по маршрутам в одном процессе Locust.
+
+    Количество маршрутов ограничено так же, как строки статистики Locust (LOCUST_STATS_MAX_ENTRIES,
+    сверх лимита — LOCUST_STATS_OVERFLOW_NAME), поэтому память ограничена: около 150 КБ на гистограмму
+    независимо от RPS и длительности прогона.
+
+    В распределённом режиме воркер с каждым отчётом мастеру отправляет сжатые гистограммы, накопленные
+    с прошлого отчёта, и очищает свои (flush). Мастер складывает их в свои гистограммы маршрутов (merge):
+    сложение HDR-гистограмм точное, поэтому перцентили мастера (включая p99.9 и p99.99) такие же,
+    как если бы все замеры записывались в одном процессе. Кроме того, мастер ведёт по одной
+    raw-гистограмме на воркер (все маршруты), чтобы был виден воркер с отличающимися задержками.
+    """
+
+    def __init__(self, expected_interval_ms: float = 0):
+        """
+        :param expected_interval_ms: Ожидаемый интервал между запросами маршрута для закрытой модели, мс
+                                     (0 — без коррекции).
+        """
+        self.expected_interval_us = int(expected_interval_ms * 1000)
+        self.routes: dict[tuple[str, str], RouteLatency] = {}
+        self.workers: dict[str, HdrHistogram] = {}
+
+    def get_route(self, request_type: str, name: str) -> RouteLatency:
+        """
+        :param request_type: Тип запроса, например "HTTP" или "gRPC".
+        :param name: Имя строки статистики (маршрут).
+        :return: Гистограммы маршрута (создаются при первом обращении, сверх лимита — общая строка переполнения).
+        """
+        key = (request_type, name)
+        if key not in self.routes:
+            if len(self.routes) >= LOCUST_STATS_MAX_ENTRIES:
+                key = (request_type, LOCUST_STATS_OVERFLOW_NAME)
+            if key not in self.routes:
+                self.routes[key] = RouteLatency(*key)
+
+        return self.routes[key]
+
+    def record(
+            self,
+            request_type: str,
+            name: str,
+            send_time: float,
+            intended_send_time: float | None,
+            end_time: float
+    ) -> None:
+        """
+        Записывает задержку запроса.
+
+        :param request_type: Тип запроса, например "HTTP" или "gRPC".
+        :param name: Имя строки статистики (маршрут).
+        :param send_time: Фактическое время отправки (time.perf_counter).
+        :param intended_send_time: Запланированное время отправки (time.perf_counter) или None.
+        :param end_time: Время получения ответа (time.perf_counter).
+        """
+        intended_us = None if intended_send_time is None else int((end_time - intended_send_time) * 1_000_000)
+        self.get_route(request_type, name).record(
+            int((end_time - send_time) * 1_000_000), intended_us, self.expected_interval_us
+        )
+
+    def reset(self) -> None:
+        """
+        Удаляет гистограммы всех маршрутов и воркеров (например, перед новым тестом).
+        """
+        self.routes.clear()
+        self.workers.clear()
+
+    def flush(self) -> list[list]:
+        """
+        Кодирует и очищает гистограммы маршрутов, в которые были записи с прошлого вызова.
+
+        :return: Список [request_type, name, raw, corrected] для отправки мастеру.
+        """
+        return [
+            [route.request_type, route.name, *route.flush()]
+            for route in self.routes.values()
+            if route.raw.get_total_count()
+        ]
+
+    def merge(self, worker: str, histograms: list[list]) -> None:
+        """
+        Добавляет гистограммы, присланные воркером (результат LatencyRecorder.flush на воркере).
+
+        :param worker: Идентификатор воркера (client_id).
+        :param histograms: Список [request_type, name, raw, corrected].
+        """
+        if worker not in self.workers:
+            self.workers[worker] = build_latency_histogram()
+
+        for request_type, name, raw, corrected in histograms:
+            raw_histogram = HdrHistogram.decode(raw)
+            self.get_route(request_type, name).merge(raw_histogram, HdrHistogram.decode(corrected))
+            self.workers[worker].add(raw_histogram)
+
+
+# Гистограммы задержек: по одному набору на окружение (то есть на процесс)
+latency_recorders: WeakKeyDictionary[Environment, LatencyRecorder | None] = WeakKeyDictionary()
+
+
+def get_latency_recorder(environment: Environment) -> LatencyRecorder | None:
+    """
+    Возвращает гистограммы задержек процесса.
+
+    :param environment: Объект окружения Locust.
+    :return: LatencyRecorder или None, если --latency-histograms не задан.
+    """
+    if environment not in latency_recorders:
+        options = environment.parsed_options
+        latency_recorders[environment] = LatencyRecorder(
+            expected_interval_ms=getattr(options, "latency_expected_interval", 0)
+        ) if getattr(options, "latency_histograms", False) else None
+
+    return latency_recorders[environment]
+
+
+def is_latency_uncorrected(environment: Environment) -> bool:
+    """
+    Проверяет, что corrected-перцентили части маршрутов не скорректированы на coordinated omission.
+
+    Так бывает в закрытой модели (пользователи не LocustArrivalRateUser) без --latency-expected-interval:
+    corrected таких маршрутов совпадает с raw (см. RouteLatency).
+
+    :param environment: Объект окружения Locust.
+    :return: True, если гистограммы включены, интервал не задан и есть пользователи закрытой модели.
+    """
+    options = environment.parsed_options
+    if not getattr(options, "latency_histograms", False) or getattr(options, "latency_expected_interval", 0):
+        return False
+
+    return any(not issubclass(user_class, LocustArrivalRateUser) for user_class in environment.user_classes)
+
+
+class LatencyReportRow(BaseModel):
+    """
+    Перцентили задержки одного маршрута: исходные и скорректированные на coordinated omission.
+
+    Attributes:
+        request_type (str): Тип запроса.
+        name (str): Маршрут.
+        count (int): Количество запросов.
+        corrected_count (int): Количество замеров скорректированной гистограммы (с досчитанными).
+        raw_p50_ms (float): Медиана raw, мс.
+        raw_p99_ms (float): 99-й перцентиль raw, мс.
+        raw_p999_ms (float): 99.9-й перцентиль raw, мс.
+        raw_p9999_ms (float): 99.99-й перцентиль raw, мс.
+        raw_max_ms (float): Максимум raw, мс.
+        corrected_p50_ms (float): Медиана corrected, мс.
+        corrected_p99_ms (float): 99-й перцентиль corrected, мс.
+        corrected_p999_ms (float): 99.9-й перцентиль corrected, мс.
+        corrected_p9999_ms (float): 99.99-й перцентиль corrected, мс.
+        corrected_max_ms (float): Максимум corrected, мс.
+    """
+    request_type: str
+    name: str
+    count: int
+    corrected_count: int
+    raw_p50_ms: float
+    raw_p99_ms: float
+    raw_p999_ms: float
+    raw_p9999_ms: float
+    raw_max_ms: float
+    corrected_p50_ms: float
+    corrected_p99_ms: float
+    corrected_p999_ms: float
+    corrected_p9999_ms: float
+    corrected_max_ms: float
+
+
+class LatencyWorkerReportRow(BaseModel):
+    """
+    Raw-перцентили задержки всех маршрутов одного воркера.
+
+    Attributes:
+        worker (str): Идентификатор воркера (client_id).
+        count (int): Количество запросов.
+        raw_p99_ms (float): 99-й перцентиль raw, мс.
+        raw_p999_ms (float): 99.9-й перцентиль raw, мс.
+        raw_p9999_ms (float): 99.99-й перцентиль raw, мс.
+        raw_max_ms (float): Максимум raw, мс.
+    """
+    worker: str
+    count: int
+    raw_p99_ms: float
+    raw_p999_ms: float
+    raw_p9999_ms: float
+    raw_max_ms: float
+
+
+class LatencyReport(BaseModel):
+    """
+    Отчёт о задержках прогона.
+
+    Attributes:
+        routes (list[LatencyReportRow]): Перцентили по маршрутам.
+        workers (list[LatencyWorkerReportRow]): Перцентили по воркерам (только в распределённом режиме).
+        uncorrected (bool): Corrected-перцентили маршрутов закрытой модели не скорректированы
+                            и совпадают с raw (см. is_latency_uncorrected).
+    """
+    routes: list[LatencyReportRow]
+    workers: list[LatencyWorkerReportRow]
+    uncorrected: bool = False
+
+
+def build_latency_report(recorder: LatencyRecorder, uncorrected: bool = False) -> LatencyReport:
+    """
+    :param recorder: Гистограммы задержек.
+    :param uncorrected: Маршруты закрытой модели не скорректированы (см. is_latency_uncorrected).
+    :return: Отчёт: маршруты отсортированы по типу и имени, воркеры — по идентификатору.
+    """
+    routes = [
+        LatencyReportRow(
+            request_type=route.request_type,
+            name=route.name,
+            count=route.raw.get_total_count(),
+            corrected_count=route.corrected.get_total_count(),
+            raw_p50_ms=route.raw.get_value_at_percentile(50) / 1000,
+            raw_p99_ms=route.raw.get_value_at_percentile(99) / 1000,
+            raw_p999_ms=route.raw.get_value_at_percentile(99.9) / 1000,
+            raw_p9999_ms=route.raw.get_value_at_percentile(99.99) / 1000,
+            raw_max_ms=route.raw.get_max_value() / 1000,
+            corrected_p50_ms=route.corrected.get_value_at_percentile(50) / 1000,
+            corrected_p99_ms=route.corrected.get_value_at_percentile(99) / 1000,
+            corrected_p999_ms=route.corrected.get_value_at_percentile(99.9) / 1000,
+            corrected_p9999_ms=route.corrected.get_value_at_percentile(99.99) / 1000,
+            corrected_max_ms=route.corrected.get_max_value() / 1000,
+        )
+        for _, route in sorted(recorder.routes.items())
+    ]
+    workers = [
+        LatencyWorkerReportRow(
+            worker=worker,
+            count=histogram.get_total_count(),
+            raw_p99_ms=histogram.get_value_at_percentile(99) / 1000,
+            raw_p999_ms=histogram.get_value_at_percentile(99.9) / 1000,
+            raw_p9999_ms=histogram.get_value_at_percentile(99.99) / 1000,
+            raw_max_ms=histogram.get_max_value() / 1000,
+        )
+        for worker, histogram in sorted(recorder.workers.items())
+    ]
+
+    return LatencyReport(routes=routes, workers=workers, uncorrected=uncorrected)
+
+
+def format_latency_report(report: LatencyReport) -> str:
+    """
+    :param report: Отчёт.
+    :return: Таблица с raw и corrected перцентилями рядом для каждого маршрута и таблица воркеров.
+             Если маршруты закрытой модели не скорректированы, колонки corrected помечены "NC" (not corrected) вместо "CO".
+    """
+    label = "NC" if report.uncorrected else "CO"
+    lines = [
+        f"{'Type':<8} {'Name':<60} {'# reqs':>9} | {'p99':>9} {'p99 ' + label:>9} | "
+        f"{'p99.9':>9} {'p99.9 ' + label:>9} | {'p99.99':>9} {'p99.99 ' + label:>9}"
+    ]
+    for row in report.routes:
+        lines.append(
+            f"{row.request_type:<8} {row.name[:60]:<60} {row.count:>9} | "
+            f"{row.raw_p99_ms:>9.1f} {row.corrected_p99_ms:>9.1f} | "
+            f"{row.raw_p999_ms:>9.1f} {row.corrected_p999_ms:>9.1f} | "
+            f"{row.raw_p9999_ms:>9.1f} {row.corrected_p9999_ms:>9.1f}"
+        )
+
+    if report.workers:
+        lines.append("")
+        lines.append(f"{'Worker':<69} {'# reqs':>9} | {'p99':>9} {'p99.9':>9} {'p99.99':>9} {'max':>9}")
+        for row in report.workers:
+            lines.append(
+                f"{row.worker[:69]:<69} {row.count:>9} | "
+                f"{row.raw_p99_ms:>9.1f} {row.raw_p999_ms:>9.1f} {row.raw_p9999_ms:>9.1f} {row.raw_max_ms:>9.1f}"
+            )
+
+    return "\n".join(lines)
+
+
+def save_latency_report(environment: Environment, report: LatencyReport) -> str:
+    """
+    Сохраняет отчёт в JSON рядом с отчётами Locust.
+
+    :param environment: Объект окружения Locust (имя сценария берётся из каталога locustfile).
+    :param report: Отчёт.
+    :return: Путь к сохранённому файлу.
+    """
+    if not os.path.exists("reports"):
+        os.mkdir("reports")
+
+    locustfile = getattr(environment.parsed_options, "locustfile", None) or "locust"
+    scenario = Path(str(locustfile)).parent.name or Path(str(locustfile)).stem
+
+    path = f"./reports/{scenario}_latency_{datetime.now():%Y-%m-%d-%Hh%Mm%S}.json"
+    with open(path, 'w', encoding="utf-8") as file:
+        file.write(report.model_dump_json(indent=2))
+
+    return path
+
+
+def write_latency_report(environment: Environment) -> None:
+    """
+    Выводит в лог и сохраняет raw и corrected перцентили по маршрутам.
+
+    :param environment: Объект окружения Locust.
+    """
+    recorder = get_latency_recorder(environment)
+    if recorder is None or not recorder.routes:
+        return
+
+    report = build_latency_report(recorder, uncorrected=is_latency_uncorrected(environment))
+    logger = logging.getLogger(__name__)
+    if report.uncorrected:
+        logger.info(
+            "Latency percentiles, raw vs corrected (ms); closed-model routes are NOT corrected for coordinated "
+            "omission (NC = raw), set --latency-expected-interval to correct them:\n%s",
+            format_latency_report(report)
+        )
+    else:
+        logger.info(
+            "Latency percentiles, raw vs coordinated-omission corrected (ms):\n%s", format_latency_report(report)
+        )
+    logger.info("Latency report saved to %s", save_latency_report(environment, report))
+
+
+@events.init.add_listener
+def init_latency_histograms_exchange(environment: Environment, **kwargs) -> None:
+    """
+    В распределённом режиме передаёт гистограммы с воркеров на мастер.
+
+    Воркер добавляет накопленные с прошлого отчёта гистограммы в каждый отчёт мастеру (в том числе
+    в последний, при завершении), мастер складывает их в свои.
+    """
+    if isinstance(environment.runner, WorkerRunner):
+        def on_report_to_master(client_id: str, data: dict, **kw) -> None:
+            # Аргументы --latency-* приходят с мастера вместе с заданием, поэтому гистограммы
+            # не создаются здесь, а берутся, только если их уже создали клиенты
+            recorder = latency_recorders.get(environment)
+            if recorder is not None:
+                data[LATENCY_REPORT_KEY] = recorder.flush()
+
+        environment.events.report_to_master.add_listener(on_report_to_master)
+
+    if isinstance(environment.runner, MasterRunner):
+        def on_worker_report(client_id: str, data: dict, **kw) -> None:
+            recorder = get_latency_recorder(environment)
+            if recorder is not None and data.get(LATENCY_REPORT_KEY):
+                recorder.merge(client_id, data[LATENCY_REPORT_KEY])
+
+        environment.events.worker_report.add_listener(on_worker_report)
+
+
+@events.init.add_listener
+def init_latency_histograms_reset(environment: Environment, **kwargs) -> None:
+    """
+    Очищает гистограммы вместе со статистикой Locust: при старте каждого теста и по кнопке Reset Stats веб-интерфейса.
+
+    Без этого при нескольких тестах в одном запуске веб-интерфейса (в том числе на мастере) отчёт
+    смешивал бы замеры всех тестов. Кнопка Reset Stats срабатывает только на мастере: воркеры
+    и так очищают свои гистограммы после каждого отчёта.
+    """
+    def reset_latency_histograms(**kw) -> None:
+        recorder = latency_recorders.get(environment)
+        if recorder is not None:
+            recorder.reset()
+
+    environment.events.test_start.add_listener(reset_latency_histograms)
+    environment.events.reset_stats.add_listener(reset_latency_histograms)
+
+
+@events.test_start.add_listener
+def warn_uncorrected_latency_histograms(environment: Environment, **kwargs) -> None:
+    """
+    Предупреждает при старте теста, что corrected-перцентили закрытой модели совпадут с raw.
+
+    Воркеры не предупреждают: аргументы у них те же, что у мастера, и предупреждение было бы в логе каждого.
+    """
+    if not isinstance(environment.runner, WorkerRunner) and is_latency_uncorrected(environment):
+        logging.getLogger(__name__).warning(
+            "Latency histograms are enabled for closed-model users without --latency-expected-interval: "
+            "their corrected percentiles will not be corrected for coordinated omission and equal raw"
+        )
+
+
+@events.test_stop.add_listener
+def report_latency_histograms(environment: Environment, **kwargs) -> None:
+    """
+    По окончании локального теста выводит и сохраняет отчёт о задержках.
+
+    Воркеры отчёт не пишут (их гистограммы уходят мастеру), мастер пишет его при завершении
+    (см. report_merged_latency_histograms).
+    """
+    if isinstance(environment.runner, (MasterRunner, WorkerRunner)):
+        return
+
+    write_latency_report(environment)
+
+
+@events.quitting.add_listener
+def report_merged_latency_histograms(environment: Environment, **kwargs) -> None:
+    """
+    При завершении мастера выводит и сохраняет отчёт по сложенным гистограммам всех воркеров.
+
+    Последние гистограммы воркеры присылают уже после test_stop, в финальном отчёте перед выходом,
+    поэтому мастер пишет отчёт на quitting.
+    """
+    if isinstance(environment.runner, MasterRunner):
+        write_latency_report(environment)
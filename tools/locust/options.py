@@ -0,0 +1,334 @@
+from enum import StrEnum
+
+from pathlib import Path
+
+from locust import events
+from locust.argument_parser import LocustArgumentParser
+from locust.env import Environment
+from locust.runners import MasterRunner
+from pydantic import BaseModel, Field
+
+from tools.fakers import build_fake_pool, fake, load_fake_pool, save_fake_pool
+
+
+class GatewayPoolPolicy(StrEnum):
+    """
+    Политика переиспользования соединений со шлюзом в Locust.
+
+    SHARED — все виртуальные пользователи и все сервисные клиенты процесса используют общий пул соединений.
+    PER_USER — каждый клиент каждого виртуального пользователя открывает собственное соединение.
+    """
+    SHARED = "shared"
+    PER_USER = "per-user"
+
+
+class GatewayHTTPTransport(StrEnum):
+    """
+    Сетевой транспорт HTTP-клиентов шлюза в Locust.
+
+    HTTPX — стандартный транспорт httpx (httpcore/h11).
+    GEVENT — geventhttpclient (см. clients.http.transport.GeventHTTPTransport), дешевле по CPU под gevent.
+    """
+    HTTPX = "httpx"
+    GEVENT = "gevent"
+
+
+class GatewayResponseValidation(StrEnum):
+    """
+    Режим обработки ответов HTTP-клиентов шлюза в Locust.
+
+    FULL — каждый ответ полностью валидируется pydantic-схемой.
+    LAZY — ответ только разбирается как JSON, поля извлекаются при обращении (см. clients.http.serialization.LazyModel),
+    полностью валидируется лишь выборка ответов.
+    """
+    FULL = "full"
+    LAZY = "lazy"
+
+
+class GatewayPoolOptions(BaseModel):
+    """
+    Настройки пула соединений со шлюзом.
+
+    Attributes:
+        policy (GatewayPoolPolicy): Политика переиспользования соединений.
+        size (int): Размер пула процесса: максимум HTTP-соединений или количество gRPC-каналов.
+        http_transport (GatewayHTTPTransport): Сетевой транспорт HTTP-клиентов.
+        http_phases (bool): Писать ли в статистику фазы HTTP-запросов (acquire, connect, tls, write, wait, read).
+    """
+    policy: GatewayPoolPolicy = GatewayPoolPolicy.PER_USER
+    size: int = 10
+    http_transport: GatewayHTTPTransport = GatewayHTTPTransport.HTTPX
+    http_phases: bool = False
+
+
+class GatewayResponseOptions(BaseModel):
+    """
+    Настройки обработки ответов HTTP-клиентов шлюза (см. clients.http.serialization.ResponseLoader).
+
+    Attributes:
+        validation (GatewayResponseValidation): Режим обработки ответов.
+        validation_sample (float): Доля ответов, которые в ленивом режиме валидируются полностью.
+    """
+    validation: GatewayResponseValidation = GatewayResponseValidation.FULL
+    validation_sample: float = Field(default=0.01, ge=0, le=1)
+
+
+class GatewayGRPCOptions(BaseModel):
+    """
+    Настройки gRPC-клиентов шлюза.
+
+    Attributes:
+        request_templates (int): Размер пула заранее сериализованных gRPC-запросов на метод (0 — выключено).
+    """
+    request_templates: int = Field(default=0, ge=0)
+
+
+class ArrivalRateOptions(BaseModel):
+    """
+    Настройки открытой модели нагрузки (см. tools.locust.arrival.LocustArrivalRateUser).
+
+    Attributes:
+        rate (float): Целевая частота итераций сценария в секунду на одного виртуального пользователя-планировщика.
+        max_in_flight (int): Максимум одновременно выполняющихся итераций одного планировщика.
+    """
+    rate: float = Field(default=1.0, gt=0)
+    max_in_flight: int = Field(default=100, ge=1)
+
+
+@events.init_command_line_parser.add_listener
+def init_gateway_pool_options(parser: LocustArgumentParser, **kwargs) -> None:
+    """
+    Регистрирует параметры пула соединений и транспорта шлюза в командной строке Locust (и в conf-файле запуска).
+    """
+    defaults = GatewayPoolOptions()
+
+    parser.add_argument(
+        "--gateway-pool-policy",
+        choices=[policy.value for policy in GatewayPoolPolicy],
+        default=defaults.policy.value,
+        env_var="LOCUST_GATEWAY_POOL_POLICY",
+        help="Gateway connection reuse: 'shared' process-wide pool or 'per-user' connections"
+    )
+    parser.add_argument(
+        "--gateway-pool-size",
+        type=int,
+        default=defaults.size,
+        env_var="LOCUST_GATEWAY_POOL_SIZE",
+        help="Shared pool size per process: max HTTP connections or number of gRPC channels"
+    )
+    parser.add_argument(
+        "--gateway-http-transport",
+        choices=[transport.value for transport in GatewayHTTPTransport],
+        default=defaults.http_transport.value,
+        env_var="LOCUST_GATEWAY_HTTP_TRANSPORT",
+        help="Network transport of gateway HTTP clients: 'httpx' or 'gevent' (geventhttpclient)"
+    )
+    parser.add_argument(
+        "--gateway-http-phases",
+        action="store_true",
+        default=defaults.http_phases,
+        env_var="LOCUST_GATEWAY_HTTP_PHASES",
+        help="Report acquire/connect/tls/write/wait/read phases of gateway HTTP requests as separate stats rows"
+    )
+
+
+@events.init_command_line_parser.add_listener
+def init_gateway_response_options(parser: LocustArgumentParser, **kwargs) -> None:
+    """
+    Регистрирует параметры валидации HTTP-ответов шлюза в командной строке Locust.
+    """
+    response_defaults = GatewayResponseOptions()
+    parser.add_argument(
+        "--gateway-response-validation",
+        choices=[validation.value for validation in GatewayResponseValidation],
+        default=response_defaults.validation.value,
+        env_var="LOCUST_GATEWAY_RESPONSE_VALIDATION",
+        help="Gateway HTTP responses: 'full' pydantic validation or 'lazy' field extraction without validation"
+    )
+    parser.add_argument(
+        "--gateway-response-validation-sample",
+        type=float,
+        default=response_defaults.validation_sample,
+        env_var="LOCUST_GATEWAY_RESPONSE_VALIDATION_SAMPLE",
+        help="Fraction of gateway HTTP responses fully validated in 'lazy' mode (0..1)"
+    )
+
+
+@events.init_command_line_parser.add_listener
+def init_gateway_grpc_options(parser: LocustArgumentParser, **kwargs) -> None:
+    """
+    Регистрирует параметры gRPC-клиентов шлюза в командной строке Locust.
+    """
+    grpc_defaults = GatewayGRPCOptions()
+    parser.add_argument(
+        "--gateway-grpc-request-templates",
+        type=int,
+        default=grpc_defaults.request_templates,
+        env_var="LOCUST_GATEWAY_GRPC_REQUEST_TEMPLATES",
+        help="Pre-serialised request variants per gateway gRPC operation method (0 disables templates)"
+    )
+
+
+@events.init_command_line_parser.add_listener
+def init_fake_data_options(parser: LocustArgumentParser, **kwargs) -> None:
+    """
+    Регистрирует параметры тестовых данных (tools.fakers) в командной строке Locust.
+    """
+    parser.add_argument(
+        "--fake-data-pool",
+        type=int,
+        default=0,
+        env_var="LOCUST_FAKE_DATA_POOL",
+        help="Serve fake names, phones, emails and amounts from a pre-generated pool of this size (0 disables)"
+    )
+    parser.add_argument(
+        "--fake-data-pool-file",
+        default="",
+        env_var="LOCUST_FAKE_DATA_POOL_FILE",
+        help="JSON file with the fake data pool: loaded if it exists, otherwise generated and saved there"
+    )
+    parser.add_argument(
+        "--fake-run-id",
+        default="",
+        env_var="LOCUST_FAKE_RUN_ID",
+        help="Seed per-user fake data streams with this run id, so every run with the same id sends the same data"
+    )
+
+
+@events.init_command_line_parser.add_listener
+def init_latency_histograms_options(parser: LocustArgumentParser, **kwargs) -> None:
+    """
+    Регистрирует параметры гистограмм задержек (tools.locust.latency) в командной строке Locust.
+    """
+    parser.add_argument(
+        "--latency-histograms",
+        action="store_true",
+        default=False,
+        env_var="LOCUST_LATENCY_HISTOGRAMS",
+        help="Record gateway latencies into HDR histograms and report raw vs coordinated-omission-corrected percentiles"
+    )
+    parser.add_argument(
+        "--latency-expected-interval",
+        type=float,
+        default=0,
+        env_var="LOCUST_LATENCY_EXPECTED_INTERVAL",
+        help="Expected interval between requests of a route in ms for closed-model correction (0: no correction)"
+    )
+
+
+@events.init_command_line_parser.add_listener
+def init_arrival_rate_options(parser: LocustArgumentParser, **kwargs) -> None:
+    """
+    Регистрирует параметры открытой модели нагрузки (tools.locust.arrival) в командной строке Locust.
+    """
+    arrival_defaults = ArrivalRateOptions()
+    parser.add_argument(
+        "--arrival-rate",
+        type=float,
+        default=arrival_defaults.rate,
+        env_var="LOCUST_ARRIVAL_RATE",
+        help="Open model: scenario iterations per second started by each arrival-rate user, regardless of latency"
+    )
+    parser.add_argument(
+        "--arrival-max-in-flight",
+        type=int,
+        default=arrival_defaults.max_in_flight,
+        env_var="LOCUST_ARRIVAL_MAX_IN_FLIGHT",
+        help="Open model: max concurrent iterations per arrival-rate user; late starts are reported as start lag"
+    )
+
+
+def get_gateway_pool_options(environment: Environment) -> GatewayPoolOptions:
+    """
+    Возвращает настройки пула соединений для окружения Locust.
+
+    :param environment: Объект окружения Locust.
+    :return: Настройки из командной строки или значения по умолчанию, если окружение создано без неё.
+    """
+    options = environment.parsed_options
+    if options is None:
+        return GatewayPoolOptions()
+
+    defaults = GatewayPoolOptions()
+    return GatewayPoolOptions(
+        policy=getattr(options, "gateway_pool_policy", defaults.policy),
+        size=getattr(options, "gateway_pool_size", defaults.size),
+        http_transport=getattr(options, "gateway_http_transport", defaults.http_transport),
+        http_phases=getattr(options, "gateway_http_phases", defaults.http_phases)
+    )
+
+
+def get_gateway_response_options(environment: Environment) -> GatewayResponseOptions:
+    """
+    Возвращает настройки обработки ответов HTTP-клиентов шлюза для окружения Locust.
+
+    :param environment: Объект окружения Locust.
+    :return: Настройки из командной строки или значения по умолчанию, если окружение создано без неё.
+    """
+    defaults = GatewayResponseOptions()
+    options = environment.parsed_options
+
+    return GatewayResponseOptions(
+        validation=getattr(options, "gateway_response_validation", defaults.validation),
+        validation_sample=getattr(options, "gateway_response_validation_sample", defaults.validation_sample)
+    )
+
+
+def get_gateway_grpc_options(environment: Environment) -> GatewayGRPCOptions:
+    """
+    Возвращает настройки gRPC-клиентов шлюза для окружения Locust.
+
+    :param environment: Объект окружения Locust.
+    :return: Настройки из командной строки или значения по умолчанию, если окружение создано без неё.
+    """
+    defaults = GatewayGRPCOptions()
+    options = environment.parsed_options
+
+    return GatewayGRPCOptions(
+        request_templates=getattr(options, "gateway_grpc_request_templates", defaults.request_templates)
+    )
+
+
+def get_arrival_rate_options(environment: Environment) -> ArrivalRateOptions:
+    """
+    Возвращает настройки открытой модели нагрузки для окружения Locust.
+
+    :param environment: Объект окружения Locust.
+    :return: Настройки из командной строки или значения по умолчанию, если окружение создано без неё.
+    """
+    defaults = ArrivalRateOptions()
+    options = environment.parsed_options
+
+    return ArrivalRateOptions(
+        rate=getattr(options, "arrival_rate", defaults.rate),
+        max_in_flight=getattr(options, "arrival_max_in_flight", defaults.max_in_flight)
+    )
+
+
+@events.init.add_listener
+def init_fake_data_pool(environment: Environment, **kwargs) -> None:
+    """
+    Включает пуловый режим tools.fakers.fake согласно --fake-data-pool и --fake-data-pool-file.
+
+    Мастер сам запросы не отправляет, поэтому пул не строит. Если файл пула указан, но не существует,
+    а размер для генерации не задан, запуск прерывается: иначе тест молча шёл бы без пула.
+    """
+    if isinstance(environment.runner, MasterRunner):
+        return
+
+    options = environment.parsed_options
+    size = getattr(options, "fake_data_pool", 0)
+    path = Path(getattr(options, "fake_data_pool_file", "") or "")
+
+    if path.name and path.exists():
+        fake.use_pool(load_fake_pool(path))
+    elif path.name and not size:
+        raise FileNotFoundError(
+            f"Fake data pool file '{path}' does not exist; set --fake-data-pool to generate it"
+        )
+    elif size:
+        pool = build_fake_pool(fake.faker, size)
+        if path.name:
+            save_fake_pool(pool, path)
+
+        fake.use_pool(pool)
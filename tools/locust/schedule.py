@@ -0,0 +1,33 @@
+from contextvars import ContextVar
+
+# Запланированное время старта текущей итерации (time.perf_counter), см. get_intended_start
+current_intended_start: ContextVar[float | None] = ContextVar("current_intended_start", default=None)
+# Опоздание старта текущей итерации относительно расписания в секундах, см. get_intended_send_time
+current_start_lag: ContextVar[float] = ContextVar("current_start_lag", default=0.0)
+
+
+def get_intended_start() -> float | None:
+    """
+    Возвращает запланированное время старта текущей итерации открытой модели.
+
+    Время задаётся расписанием LocustArrivalRateUser (см. tools.locust.arrival) и не зависит от того,
+    насколько медленно отвечает шлюз, поэтому по нему можно измерять задержку так, как её видит клиент
+    с постоянным потоком запросов.
+
+    :return: Значение time.perf_counter() или None вне итерации открытой модели.
+    """
+    return current_intended_start.get()
+
+
+def get_intended_send_time(send_time: float) -> float:
+    """
+    Возвращает время, в которое запрос был бы отправлен, если бы итерация стартовала по расписанию.
+
+    Внутри итерации открытой модели это фактическое время отправки минус опоздание старта итерации:
+    ожидание, вызванное медленными ответами шлюза, засчитывается в задержку запроса.
+    Вне итерации совпадает с фактическим временем.
+
+    :param send_time: Фактическое время отправки (time.perf_counter).
+    :return: Запланированное время отправки (time.perf_counter).
+    """
+    return send_time - current_start_lag.get()
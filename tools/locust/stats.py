@@ -0,0 +1,144 @@
+import re
+from weakref import WeakKeyDictionary
+
+from locust import events
+from locust.env import Environment
+from locust.runners import MasterRunner
+from locust.stats import StatsEntry
+
+# Максимальное количество строк статистики запросов Locust в одном процессе (без вспомогательных строк)
+LOCUST_STATS_MAX_ENTRIES = 500
+# Имя строки, в которую попадают замеры сверх LOCUST_STATS_MAX_ENTRIES
+LOCUST_STATS_OVERFLOW_NAME = "[other]"
+
+# Сегменты пути, похожие на идентификаторы: UUID, числа, длинные hex-строки
+ROUTE_ID_SEGMENT = re.compile(
+    r"^([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|\d+|[0-9a-fA-F]{16,})$"
+)
+
+# Строки статистики запросов, уже допущенные get_locust_stat_name: по одному набору на окружение (процесс)
+locust_stat_names: WeakKeyDictionary[Environment, set[tuple[str, str]]] = WeakKeyDictionary()
+# Имена строк статистики, допущенные мастером при слиянии отчётов воркеров (см. init_locust_stats_limit)
+locust_master_stat_names: WeakKeyDictionary[Environment, set[str]] = WeakKeyDictionary()
+
+
+def build_route_template(path: str) -> str:
+    """
+    Заменяет в пути сегменты-идентификаторы на {id}, например
+    /api/v1/users/4f7c...-... -> /api/v1/users/{id}.
+
+    Используется как запасной вариант, если вызов не передал route в extensions.
+
+    :param path: Путь запроса.
+    :return: Шаблон маршрута.
+    """
+    return "/".join("{id}" if ROUTE_ID_SEGMENT.match(segment) else segment for segment in path.split("/"))
+
+
+def get_locust_stat_name(environment: Environment, request_type: str, name: str) -> str:
+    """
+    Ограничивает количество строк статистики запросов Locust.
+
+    Пока допущено меньше LOCUST_STATS_MAX_ENTRIES строк или строка с таким именем уже допущена, имя
+    возвращается как есть, иначе — LOCUST_STATS_OVERFLOW_NAME. Так память воркера не растёт
+    на длительных прогонах, даже если какой-то вызов пишет в статистику неограниченное количество имён.
+    Лимит действует в каждом процессе отдельно, а воркеры могут допустить разные имена, поэтому
+    мастер ограничивает свою статистику сам (см. init_locust_stats_limit).
+    Вспомогательные строки (log_locust_stat) в лимите не учитываются, поэтому не вытесняют строки запросов.
+
+    :param environment: Объект окружения Locust.
+    :param request_type: Тип строки статистики (колонка Type).
+    :param name: Желаемое имя строки статистики.
+    :return: Имя, под которым нужно записать замер.
+    """
+    if environment not in locust_stat_names:
+        locust_stat_names[environment] = set()
+
+    names = locust_stat_names[environment]
+    key = (name, request_type)
+    if key in names:
+        return name
+
+    if len(names) < LOCUST_STATS_MAX_ENTRIES:
+        names.add(key)
+        return name
+
+    return LOCUST_STATS_OVERFLOW_NAME
+
+
+def log_locust_stat(
+        environment: Environment,
+        request_type: str,
+        name: str,
+        response_time: float,
+        response_length: int = 0
+) -> None:
+    """
+    Записывает замер в отдельную строку статистики Locust.
+
+    В отличие от environment.events.request, замер не попадает в строку Aggregated и не увеличивает RPS,
+    поэтому подходит для вспомогательных метрик запроса (время до первого байта, фазы соединения и т.д.).
+    В распределённом режиме такие строки передаются мастеру вместе с остальной статистикой воркера.
+
+    Вспомогательные строки не учитываются в лимите get_locust_stat_name: имя должно быть уже ограничено —
+    это имя строки запроса, полученное от get_locust_stat_name, или фиксированное имя. Тогда строк каждого
+    вспомогательного типа не больше, чем строк запросов.
+
+    :param environment: Объект окружения Locust.
+    :param request_type: Тип строки статистики (колонка Type), например "TTFB".
+    :param name: Имя строки статистики, например "GET /api/v1/documents/contract-document/{account_id}".
+    :param response_time: Значение в миллисекундах.
+    :param response_length: Размер в байтах.
+    """
+    environment.stats.get(name, request_type).log(response_time, response_length)
+
+
+def fold_locust_stats_overflow(environment: Environment, keys: list[tuple[str, str]]) -> None:
+    """
+    Переносит строки статистики мастера сверх LOCUST_STATS_MAX_ENTRIES имён в LOCUST_STATS_OVERFLOW_NAME.
+
+    Лимит считается по именам, а не по парам (имя, тип): вспомогательные строки носят имя строки
+    запроса, поэтому остаются рядом с ней и не вытесняют строки запросов.
+
+    :param environment: Объект окружения Locust мастера.
+    :param keys: Ключи (имя, тип) строк, пришедших в отчёте воркера.
+    """
+    if environment not in locust_master_stat_names:
+        locust_master_stat_names[environment] = set()
+
+    names = locust_master_stat_names[environment]
+    stats = environment.stats
+    for name, request_type in keys:
+        if name in names or name == LOCUST_STATS_OVERFLOW_NAME or (name, request_type) not in stats.entries:
+            continue
+
+        if len(names) < LOCUST_STATS_MAX_ENTRIES:
+            names.add(name)
+            continue
+
+        entry = stats.entries.pop((name, request_type))
+        overflow_key = (LOCUST_STATS_OVERFLOW_NAME, request_type)
+        if overflow_key not in stats.entries:
+            stats.entries[overflow_key] = StatsEntry(
+                stats, LOCUST_STATS_OVERFLOW_NAME, request_type, use_response_times_cache=True
+            )
+        stats.entries[overflow_key].extend(entry)
+
+
+@events.init.add_listener
+def init_locust_stats_limit(environment: Environment, **kwargs) -> None:
+    """
+    Ограничивает количество строк статистики на мастере.
+
+    Каждый воркер допускает до LOCUST_STATS_MAX_ENTRIES строк, но разные воркеры могут допустить
+    разные имена, и без этого мастер хранил бы до LOCUST_STATS_MAX_ENTRIES строк на каждый воркер.
+    Обработчик регистрируется позже слияния статистики самим Locust (при создании раннера),
+    поэтому переносит в LOCUST_STATS_OVERFLOW_NAME уже слитые строки из очередного отчёта.
+    """
+    if isinstance(environment.runner, MasterRunner):
+        def on_worker_report(client_id: str, data: dict, **kw) -> None:
+            fold_locust_stats_overflow(
+                environment, [(stats_data["name"], stats_data["method"]) for stats_data in data.get("stats", [])]
+            )
+
+        environment.events.worker_report.add_listener(on_worker_report)
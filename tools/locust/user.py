@@ -1,10 +1,56 @@
+from itertools import count
+from weakref import WeakKeyDictionary
+
 from locust import User, between
+from locust.env import Environment
+
+# Регистрирует параметры командной строки проекта (пул соединений со шлюзом и т.д.)
+import tools.locust.options  # noqa: F401
+from tools.fakers import FakeStream, build_fake_stream, use_fake_stream
+from tools.locust.workers import get_worker_partition
+
+# Счётчики виртуальных пользователей: по одному на окружение (то есть на процесс)
+locust_user_counters: WeakKeyDictionary[Environment, count] = WeakKeyDictionary()
+
+
+def build_locust_user_fake_stream(environment: Environment) -> FakeStream | None:
+    """
+    Создаёт детерминированный поток тестовых данных для очередного виртуального пользователя.
+
+    Ключ потока — (--fake-run-id, номер воркера, номер пользователя на воркере). Пользователи
+    создаются в одном и том же порядке, поэтому при том же run id и той же конфигурации запуска
+    каждый пользователь получает ту же последовательность данных.
+
+    :param environment: Объект окружения Locust.
+    :return: Поток или None, если --fake-run-id не задан.
+    """
+    run_id = getattr(environment.parsed_options, "fake_run_id", "")
+    if not run_id:
+        return None
+
+    if environment not in locust_user_counters:
+        locust_user_counters[environment] = count()
+
+    worker_index, _ = get_worker_partition(environment)
+    return build_fake_stream(run_id, worker_index, next(locust_user_counters[environment]))
+
 
 class LocustBaseUser(User):
     """
     Базовый виртуальный пользователь Locust, от которого наследуются все сценарии.
     Содержит общие настройки, которые могут быть переопределены при необходимости.
+
+    С --fake-run-id у каждого пользователя свой детерминированный поток fake-данных:
+    он становится текущим в гринлете пользователя в on_start (наследники, переопределяющие
+    on_start, должны вызывать super().on_start()).
     """
     host = "localhost"
     abstract = True
-    wait_time = between(1,3)
\ No newline at end of file
+    wait_time = between(1,3)
+
+    def __init__(self, environment: Environment):
+        super().__init__(environment)
+        self.fake_stream = build_locust_user_fake_stream(environment)
+
+    def on_start(self) -> None:
+        use_fake_stream(self.fake_stream)
@@ -0,0 +1,36 @@
+from locust.env import Environment
+from locust.runners import WorkerRunner
+
+
+def get_worker_partition(environment: Environment) -> tuple[int, int]:
+    """
+    Возвращает номер текущего воркера Locust и общее количество воркеров.
+
+    Используется для раздела сидов между воркерами (см. SeedsScenario.load):
+
+        @events.test_start.add_listener
+        def on_test_start(environment: Environment, **kwargs):
+            environment.seeds = ExistingUserGetOperationsSeedsScenario().load(*get_worker_partition(environment))
+
+    Номер воркера назначается мастером после подключения, поэтому вызывать функцию нужно
+    не раньше события test_start. Количество воркеров на воркере берётся из --expect-workers:
+    это флаг мастера, и сам воркер его не получает (по умолчанию 1), поэтому его нужно явно
+    передать и каждому воркеру — например, через общий conf-файл запуска. В локальном режиме
+    возвращается (0, 1).
+
+    :param environment: Объект окружения Locust.
+    :return: Кортеж (worker_index, worker_count).
+    :raises ValueError: Если количество воркеров меньше 1 или номер воркера не попадает в него.
+    """
+    if not isinstance(environment.runner, WorkerRunner):
+        return 0, 1
+
+    worker_index = environment.runner.worker_index
+    worker_count = environment.parsed_options.expect_workers
+    if worker_count < 1 or worker_index >= worker_count:
+        raise ValueError(
+            f"Worker index {worker_index} does not fit --expect-workers={worker_count}: "
+            f"pass the total number of workers to every worker with --expect-workers"
+        )
+
+    return worker_index, worker_count